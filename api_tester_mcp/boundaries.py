@@ -0,0 +1,521 @@
+"""Boundary-value test inputs derived from parameter and request body schemas"""
+
+import copy
+import json
+import random
+import re
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from .models import ApiEndpoint
+from .utils import compile_pattern
+
+# Boundary scenarios generated per endpoint unless configured otherwise
+DEFAULT_BOUNDARY_BUDGET = 10
+
+# Deepest request body property nesting that is explored
+MAX_BODY_DEPTH = 3
+
+# Strings and arrays longer than this are not generated
+MAX_GENERATED_LENGTH = 65536
+
+# Methods whose test cases send a request body
+BODY_METHODS = ("POST", "PUT", "PATCH")
+
+# Headers that OpenAPI ignores when declared as parameters
+_IGNORED_HEADERS = {"accept", "authorization", "content-type"}
+
+# Valid sample values for common string formats
+_FORMAT_SAMPLES = {
+    "email": "user@example.com",
+    "uuid": "00000000-0000-4000-8000-000000000000",
+    "date": "2024-01-01",
+    "date-time": "2024-01-01T00:00:00Z",
+    "uri": "https://example.com",
+    "url": "https://example.com",
+    "hostname": "example.com",
+    "ipv4": "192.0.2.1",
+    "ipv6": "2001:db8::1",
+    "password": "Passw0rd!",
+}
+
+# Longest value shown in a boundary case description
+MAX_DESCRIBED_LENGTH = 32
+
+# Characters kept out of descriptions: scenario names end up inside string
+# literals and comments of generated test code
+_UNSAFE_DESCRIPTION_CHARS = re.compile(r"[\x00-\x1f\x7f'\"`\\$]")
+
+# Draws tried for a pattern match that also fits the length limits
+PATTERN_SAMPLE_ATTEMPTS = 10
+
+# Candidates for a string that does not match a pattern, tried in order
+_PATTERN_MISMATCHES = ("", "!", "invalid value", "0" * 64)
+
+# When the budget runs out, lower ranks are kept: values just outside a limit
+# find missing validation, values on a limit find off-by-one rejections
+_RANKS = {
+    "below_minimum": 0,
+    "above_maximum": 0,
+    "too_short": 1,
+    "too_long": 1,
+    "too_few_items": 1,
+    "too_many_items": 1,
+    "missing_required": 2,
+    "not_in_enum": 3,
+    "pattern_mismatch": 4,
+    "at_minimum": 5,
+    "at_maximum": 5,
+    "min_length": 6,
+    "max_length": 6,
+    "min_items": 6,
+    "max_items": 6,
+}
+
+Resolver = Callable[[Any], Any]
+
+
+def _no_resolve(obj: Any) -> Any:
+    return obj
+
+
+class BoundaryCase(NamedTuple):
+    """One boundary input: a single field set to a limit value, or omitted"""
+
+    constraint: str  # A key of _RANKS, e.g. "above_maximum"
+    location: str  # query, path, header or body
+    field: Tuple[str, ...]  # Parameter name, or property path in the body
+    description: str
+    value: Any = None
+    valid: bool = False
+    omit: bool = False
+
+    @property
+    def rank(self) -> int:
+        return _RANKS[self.constraint]
+
+
+def schema_type(schema: Dict[str, Any]) -> Optional[str]:
+    """Type of a schema, inferred from its keywords when it is not declared"""
+    type_name = schema.get("type")
+    if isinstance(type_name, list):
+        # OpenAPI 3.1 nullable types, e.g. ["string", "null"]
+        type_name = next((t for t in type_name if t != "null"), None)
+    if type_name is None:
+        if "properties" in schema:
+            return "object"
+        if "items" in schema:
+            return "array"
+    return type_name
+
+
+def numeric_limits(
+    schema: Dict[str, Any], step: float
+) -> Tuple[Optional[float], Optional[float]]:
+    """Inclusive lower and upper limits, with exclusive limits moved inwards"""
+    low = schema.get("minimum")
+    high = schema.get("maximum")
+
+    exclusive = schema.get("exclusiveMinimum")
+    if isinstance(exclusive, bool):
+        if exclusive and low is not None:
+            low += step
+    elif isinstance(exclusive, (int, float)):
+        low = exclusive + step if low is None else max(low, exclusive + step)
+
+    exclusive = schema.get("exclusiveMaximum")
+    if isinstance(exclusive, bool):
+        if exclusive and high is not None:
+            high -= step
+    elif isinstance(exclusive, (int, float)):
+        high = exclusive - step if high is None else min(high, exclusive - step)
+
+    return low, high
+
+
+def _length(value: Any) -> Optional[int]:
+    return value if isinstance(value, int) and not isinstance(value, bool) else None
+
+
+def _pattern_sample(
+    pattern: Any, min_length: int, max_length: Optional[int]
+) -> Optional[str]:
+    """
+    Deterministic string matching a pattern and its length limits, or None
+    when no pattern is given or no match could be generated
+    """
+    generate = compile_pattern(pattern) if isinstance(pattern, str) else None
+    if generate is None:
+        return None
+    rng = random.Random(pattern)
+    for _ in range(PATTERN_SAMPLE_ATTEMPTS):
+        match = generate(rng)
+        if (
+            match is not None
+            and len(match) >= min_length
+            and (max_length is None or len(match) <= max_length)
+        ):
+            return match
+    return None
+
+
+def sample_value(
+    schema: Any,
+    resolve: Resolver = _no_resolve,
+    depth: int = 0,
+    include_optional: bool = False,
+) -> Any:
+    """
+    Deterministic value that satisfies a schema: its example, default or first
+    enum value, else a match of its pattern or the smallest value allowed.
+    Objects get their required properties only, unless include_optional is set.
+    """
+    schema = resolve(schema)
+    if not isinstance(schema, dict) or depth > MAX_BODY_DEPTH + 2:
+        return None
+
+    for key in ("example", "default"):
+        if key in schema:
+            return schema[key]
+    if schema.get("enum"):
+        return schema["enum"][0]
+
+    type_name = schema_type(schema)
+    if type_name == "string":
+        pattern = schema.get("pattern")
+        format_sample = _FORMAT_SAMPLES.get(schema.get("format"))
+        if format_sample is not None and (
+            not isinstance(pattern, str) or matches_pattern(pattern, format_sample)
+        ):
+            return format_sample
+        min_length = _length(schema.get("minLength")) or 0
+        max_length = _length(schema.get("maxLength"))
+        match = _pattern_sample(pattern, min_length, max_length)
+        if match is not None:
+            return match
+        if format_sample is not None:
+            return format_sample
+        length = max(min_length, 1)
+        if max_length is not None:
+            length = min(length, max_length)
+        return "x" * length
+    if type_name in ("integer", "number"):
+        integer = type_name == "integer"
+        low, high = numeric_limits(schema, 1 if integer else 0.01)
+        value = low if low is not None else high if high is not None else 1
+        return int(value) if integer else value
+    if type_name == "boolean":
+        return True
+    if type_name == "array":
+        count = max(_length(schema.get("minItems")) or 0, 1)
+        max_items = _length(schema.get("maxItems"))
+        if max_items is not None:
+            count = min(count, max_items)
+        item = sample_value(
+            schema.get("items", {}), resolve, depth + 1, include_optional
+        )
+        return [item] * count
+    if type_name == "object":
+        properties = schema.get("properties", {})
+        names = properties if include_optional else schema.get("required", [])
+        return {
+            name: sample_value(properties[name], resolve, depth + 1, include_optional)
+            for name in names
+            if name in properties
+        }
+    return None
+
+
+def describe_value(value: Any) -> str:
+    """
+    Value as shown in scenario names: strings unquoted, long values shortened
+    and quotes, backslashes and control characters replaced.
+    """
+    if isinstance(value, str):
+        if not value:
+            return "empty string"
+        text = value
+    elif isinstance(value, list):
+        text = "[" + ", ".join(describe_value(item) for item in value) + "]"
+    else:
+        text = json.dumps(value)
+    if len(text) > MAX_DESCRIBED_LENGTH:
+        text = f"{text[:MAX_DESCRIBED_LENGTH]}... ({len(text)} characters)"
+    return _UNSAFE_DESCRIPTION_CHARS.sub("?", text)
+
+
+def _not_in_enum(values: List[Any]) -> Any:
+    numbers = [v for v in values if isinstance(v, (int, float))]
+    if numbers and len(numbers) == len(values):
+        return max(numbers) + 1
+    candidate = "not_a_valid_value"
+    while candidate in values:
+        candidate += "_"
+    return candidate
+
+
+def matches_pattern(pattern: str, value: str) -> bool:
+    """Whether a string matches a pattern; invalid patterns match anything"""
+    try:
+        return re.search(pattern, value) is not None
+    except re.error:
+        return True
+
+
+def _pattern_mismatch(pattern: str) -> Optional[str]:
+    try:
+        compiled = re.compile(pattern)
+    except re.error:
+        return None
+    for candidate in _PATTERN_MISMATCHES:
+        if not compiled.search(candidate):
+            return candidate
+    return None
+
+
+def _field_cases(
+    schema: Any,
+    resolve: Resolver,
+    location: str,
+    field: Tuple[str, ...],
+    required: bool,
+) -> Iterator[BoundaryCase]:
+    """Boundary cases of the constraints of one field"""
+    schema = resolve(schema)
+    if not isinstance(schema, dict):
+        return
+    label = ".".join(field)
+
+    def case(constraint: str, description: str, value: Any = None, valid=False):
+        return BoundaryCase(
+            constraint, location, field, f"{label} {description}", value, valid
+        )
+
+    if required and location != "path":
+        yield case("missing_required", "omitted (required)")._replace(omit=True)
+
+    if schema.get("enum"):
+        value = _not_in_enum(schema["enum"])
+        yield case("not_in_enum", f"= {describe_value(value)} (not in enum)", value)
+
+    type_name = schema_type(schema)
+    if type_name in ("integer", "number"):
+        integer = type_name == "integer"
+        step = 1 if integer else 0.01
+        low, high = numeric_limits(schema, step)
+        if low is not None:
+            yield case("below_minimum", f"= {low - step} (below minimum)", low - step)
+            yield case("at_minimum", f"= {low} (minimum)", low, valid=True)
+        if high is not None:
+            yield case("above_maximum", f"= {high + step} (above maximum)", high + step)
+            yield case("at_maximum", f"= {high} (maximum)", high, valid=True)
+
+    elif type_name == "string":
+        # Plain strings of the limit length would break formats and patterns
+        plain = not schema.get("format") and not schema.get("pattern")
+        min_length = _length(schema.get("minLength"))
+        max_length = _length(schema.get("maxLength"))
+        if min_length and min_length <= MAX_GENERATED_LENGTH:
+            yield case(
+                "too_short",
+                f"of {min_length - 1} characters (below minLength)",
+                "x" * (min_length - 1),
+            )
+            if plain:
+                yield case(
+                    "min_length",
+                    f"of {min_length} characters (minLength)",
+                    "x" * min_length,
+                    valid=True,
+                )
+        if max_length is not None and max_length < MAX_GENERATED_LENGTH:
+            yield case(
+                "too_long",
+                f"of {max_length + 1} characters (above maxLength)",
+                "x" * (max_length + 1),
+            )
+            if plain:
+                yield case(
+                    "max_length",
+                    f"of {max_length} characters (maxLength)",
+                    "x" * max_length,
+                    valid=True,
+                )
+        if schema.get("pattern"):
+            value = _pattern_mismatch(schema["pattern"])
+            if value is not None:
+                yield case(
+                    "pattern_mismatch",
+                    f"= {describe_value(value)} (does not match pattern)",
+                    value,
+                )
+
+    elif type_name == "array":
+        item = sample_value(schema.get("items", {}), resolve)
+        min_items = _length(schema.get("minItems"))
+        max_items = _length(schema.get("maxItems"))
+        if min_items and min_items <= MAX_GENERATED_LENGTH:
+            yield case(
+                "too_few_items",
+                f"with {min_items - 1} items (below minItems)",
+                [item] * (min_items - 1),
+            )
+            yield case(
+                "min_items",
+                f"with {min_items} items (minItems)",
+                [item] * min_items,
+                valid=True,
+            )
+        if max_items is not None and max_items < MAX_GENERATED_LENGTH:
+            yield case(
+                "too_many_items",
+                f"with {max_items + 1} items (above maxItems)",
+                [item] * (max_items + 1),
+            )
+            yield case(
+                "max_items",
+                f"with {max_items} items (maxItems)",
+                [item] * max_items,
+                valid=True,
+            )
+
+
+def _body_cases(
+    schema: Any, resolve: Resolver, path: Tuple[str, ...] = (), depth: int = 0
+) -> Iterator[BoundaryCase]:
+    """Boundary cases of the properties of an object schema, nested ones included"""
+    schema = resolve(schema)
+    if not isinstance(schema, dict) or schema_type(schema) != "object":
+        return
+    if depth >= MAX_BODY_DEPTH:
+        return
+
+    required = set(schema.get("required", []))
+    for name, prop_schema in schema.get("properties", {}).items():
+        field = path + (name,)
+        yield from _field_cases(prop_schema, resolve, "body", field, name in required)
+        yield from _body_cases(prop_schema, resolve, field, depth + 1)
+
+
+def request_body_schema(endpoint: ApiEndpoint) -> Optional[Dict[str, Any]]:
+    """
+    JSON schema of the request body: the OpenAPI 3 requestBody, or the body
+    parameter of a Swagger 2 operation
+    """
+    if isinstance(endpoint.request_body, dict):
+        content = endpoint.request_body.get("content", {})
+        schema = content.get("application/json", {}).get("schema")
+        if schema:
+            return schema
+    for parameter in endpoint.parameters:
+        if parameter.get("in") == "body" and isinstance(parameter.get("schema"), dict):
+            return parameter["schema"]
+    return None
+
+
+def iter_parameters(
+    endpoint: ApiEndpoint, resolve: Resolver = _no_resolve
+) -> Iterator[tuple]:
+    """(location, name, schema, required) of the query, path and header parameters"""
+    for parameter in endpoint.parameters:
+        parameter = resolve(parameter)
+        if not isinstance(parameter, dict) or not parameter.get("name"):
+            continue
+        location = parameter.get("in")
+        if location not in ("query", "path", "header"):
+            continue
+        if location == "header" and parameter["name"].lower() in _IGNORED_HEADERS:
+            continue
+        # Swagger 2 keeps the type and limits on the parameter itself
+        schema = parameter.get("schema") or parameter
+        required = bool(parameter.get("required")) or location == "path"
+        yield location, parameter["name"], schema, required
+
+
+def _set_field(
+    body: Any,
+    schema: Any,
+    field: Tuple[str, ...],
+    value: Any,
+    omit: bool,
+    resolve: Resolver,
+) -> Any:
+    """Copy of body with one property replaced or removed; parents are added"""
+    body = copy.deepcopy(body) if isinstance(body, dict) else {}
+    node, node_schema = body, resolve(schema)
+    for name in field[:-1]:
+        prop_schema = resolve(node_schema.get("properties", {}).get(name, {}))
+        if not isinstance(node.get(name), dict):
+            parent = sample_value(prop_schema, resolve)
+            node[name] = parent if isinstance(parent, dict) else {}
+        node, node_schema = node[name], prop_schema
+    if omit:
+        node.pop(field[-1], None)
+    else:
+        node[field[-1]] = value
+    return body
+
+
+def boundary_inputs(
+    endpoint: ApiEndpoint,
+    budget: int = DEFAULT_BOUNDARY_BUDGET,
+    resolve: Resolver = _no_resolve,
+) -> List[Tuple[BoundaryCase, Dict[str, Any]]]:
+    """
+    Boundary cases of an endpoint with the test data that exercises them.
+
+    Every case starts from the same valid baseline (path parameters, required
+    query and header parameters, and a body with the required properties) and
+    changes one field. At most budget cases are returned, most valuable first.
+    """
+    if budget <= 0:
+        return []
+
+    parameters = list(iter_parameters(endpoint, resolve))
+    body_schema = None
+    if endpoint.method.upper() in BODY_METHODS:
+        body_schema = request_body_schema(endpoint)
+
+    cases = [
+        case
+        for location, name, schema, required in parameters
+        for case in _field_cases(schema, resolve, location, (name,), required)
+    ]
+    if body_schema is not None:
+        cases.extend(_body_cases(body_schema, resolve))
+    if not cases:
+        return []
+
+    # Stable sort: within a rank, fields keep their declaration order
+    cases.sort(key=lambda case: case.rank)
+    del cases[budget:]
+
+    baseline: Dict[str, Any] = {"path_params": {}, "query": {}, "headers": {}}
+    for location, name, schema, required in parameters:
+        if required:
+            key = {"path": "path_params", "query": "query", "header": "headers"}
+            baseline[key[location]][name] = sample_value(schema, resolve)
+    if body_schema is not None:
+        baseline["body"] = sample_value(body_schema, resolve)
+
+    inputs = []
+    for case in cases:
+        test_data = copy.deepcopy(baseline)
+        if case.location == "body":
+            test_data["body"] = _set_field(
+                baseline.get("body"),
+                body_schema,
+                case.field,
+                case.value,
+                case.omit,
+                resolve,
+            )
+        else:
+            key = {"path": "path_params", "query": "query", "header": "headers"}
+            values = test_data[key[case.location]]
+            if case.omit:
+                values.pop(case.field[0], None)
+            else:
+                values[case.field[0]] = case.value
+        inputs.append((case, test_data))
+
+    return inputs
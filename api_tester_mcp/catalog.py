@@ -0,0 +1,335 @@
+"""Indexed endpoint catalog for selecting endpoints, scenarios and test cases"""
+
+from collections import defaultdict
+from fnmatch import fnmatchcase
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from .models import ApiEndpoint
+from .records import ScenarioRecord, TestCaseRecord
+
+_GLOB_CHARS = set("*?[")
+
+
+def _split_path(path: str) -> List[str]:
+    """Split a path into its non-empty segments, ignoring any query string"""
+    return [segment for segment in path.split("?", 1)[0].split("/") if segment]
+
+
+def _is_template_segment(segment: str) -> bool:
+    """Check for OpenAPI ({id}) and Postman ({{id}}, :id) path parameters"""
+    return (segment.startswith("{") and segment.endswith("}")) or segment.startswith(
+        ":"
+    )
+
+
+class _PathNode:
+    __slots__ = ("children", "templates", "values")
+
+    def __init__(self):
+        self.children: Dict[str, "_PathNode"] = {}
+        self.templates: Dict[str, "_PathNode"] = {}
+        self.values: List[int] = []
+
+    def iter_children(self) -> Iterable["_PathNode"]:
+        yield from self.children.values()
+        yield from self.templates.values()
+
+
+class PathTrie:
+    """
+    Trie of path segments.
+
+    Literal segments and template segments ({id}, :id) are kept in separate
+    tables so a concrete path such as /pets/42 can match /pets/{petId} without
+    scanning every stored path.
+    """
+
+    def __init__(self):
+        self.root = _PathNode()
+
+    def insert(self, path: str, value: int):
+        node = self.root
+        for segment in _split_path(path):
+            table = node.templates if _is_template_segment(segment) else node.children
+            child = table.get(segment)
+            if child is None:
+                child = table[segment] = _PathNode()
+            node = child
+        node.values.append(value)
+
+    def _collect(self, nodes: Iterable[_PathNode]) -> List[int]:
+        """Gather the values stored in the given subtrees"""
+        values = []
+        stack = list(nodes)
+        while stack:
+            node = stack.pop()
+            values.extend(node.values)
+            stack.extend(node.iter_children())
+        return values
+
+    def prefix(self, prefix: str) -> List[int]:
+        """Values for every path under the given prefix"""
+        node = self.root
+        for segment in _split_path(prefix):
+            node = node.children.get(segment) or node.templates.get(segment)
+            if node is None:
+                return []
+        return self._collect([node])
+
+    def match(self, path: str) -> List[int]:
+        """Values whose path template matches a concrete path"""
+        frontier = [self.root]
+        for segment in _split_path(path):
+            next_frontier = []
+            for node in frontier:
+                child = node.children.get(segment)
+                if child is not None:
+                    next_frontier.append(child)
+                next_frontier.extend(node.templates.values())
+            if not next_frontier:
+                return []
+            frontier = next_frontier
+
+        values = []
+        for node in frontier:
+            values.extend(node.values)
+        return values
+
+    def glob(self, pattern: str) -> List[int]:
+        """
+        Values whose path matches a glob pattern.
+
+        ``*`` matches within one segment, ``**`` matches any number of segments,
+        and a concrete segment also matches a template segment, so /pets/*,
+        /pets/** and /pets/42 all select /pets/{petId}.
+        """
+        segments = _split_path(pattern)
+        values = []
+        visited: Set[tuple] = set()
+        stack = [(self.root, 0)]
+
+        while stack:
+            node, index = stack.pop()
+            key = (id(node), index)
+            if key in visited:
+                continue
+            visited.add(key)
+
+            if index == len(segments):
+                values.extend(node.values)
+                continue
+
+            segment = segments[index]
+            if segment == "**":
+                stack.append((node, index + 1))
+                stack.extend((child, index) for child in node.iter_children())
+            elif _GLOB_CHARS.intersection(segment):
+                for table in (node.children, node.templates):
+                    stack.extend(
+                        (child, index + 1)
+                        for name, child in table.items()
+                        if fnmatchcase(name, segment)
+                    )
+            else:
+                child = node.children.get(segment)
+                if child is not None:
+                    stack.append((child, index + 1))
+                if _is_template_segment(segment):
+                    child = node.templates.get(segment)
+                    if child is not None:
+                        stack.append((child, index + 1))
+                else:
+                    stack.extend(
+                        (child, index + 1) for child in node.templates.values()
+                    )
+
+        return values
+
+
+class _LinkedItems:
+    """Scenario or test case records keyed by id and by endpoint index"""
+
+    __slots__ = ("by_id", "positions", "by_endpoint")
+
+    def __init__(self):
+        self.by_id: Dict[str, Any] = {}
+        self.positions: Dict[str, int] = {}
+        self.by_endpoint: Dict[int, List[str]] = defaultdict(list)
+
+    def add(self, record: Any):
+        self.positions.setdefault(record.id, len(self.positions))
+        self.by_id[record.id] = record
+        if record.endpoint_index is not None:
+            self.by_endpoint[record.endpoint_index].append(record.id)
+
+    def select(
+        self, ids: Optional[List[str]], endpoint_indexes: Optional[List[int]]
+    ) -> List[Any]:
+        """Resolve ids and endpoint selections, keeping the original record order"""
+        if ids:
+            chosen = [
+                item_id for item_id in dict.fromkeys(ids) if item_id in self.by_id
+            ]
+            if endpoint_indexes is not None:
+                allowed = set(endpoint_indexes)
+                chosen = [
+                    item_id
+                    for item_id in chosen
+                    if self.by_id[item_id].endpoint_index in allowed
+                ]
+        elif endpoint_indexes is not None:
+            chosen = [
+                item_id
+                for index in endpoint_indexes
+                for item_id in self.by_endpoint.get(index, ())
+            ]
+        else:
+            return list(self.by_id.values())
+
+        chosen.sort(key=self.positions.__getitem__)
+        return [self.by_id[item_id] for item_id in chosen]
+
+
+class EndpointCatalog:
+    """
+    In-session catalog of ingested endpoints.
+
+    Endpoints are stored once and addressed by their position, which is what
+    scenario and test case records refer to. Hash indexes by id, tag, method,
+    service and operationId and a path trie resolve selectors in time
+    proportional to the result, and scenarios and test cases are linked to the
+    endpoint they exercise so the same selectors apply to them.
+    """
+
+    def __init__(self, endpoints: Iterable[ApiEndpoint] = ()):
+        self.endpoints: List[ApiEndpoint] = []
+        self._by_id: Dict[str, int] = {}
+        self._by_tag: Dict[str, List[int]] = defaultdict(list)
+        self._by_method: Dict[str, List[int]] = defaultdict(list)
+        self._by_service: Dict[str, List[int]] = defaultdict(list)
+        self._by_operation_id: Dict[str, int] = {}
+        self._paths = PathTrie()
+        self.scenarios = _LinkedItems()
+        self.test_cases = _LinkedItems()
+
+        for endpoint in endpoints:
+            self.add(endpoint)
+
+    def __len__(self) -> int:
+        return len(self.endpoints)
+
+    def add(self, endpoint: ApiEndpoint) -> int:
+        """Index an endpoint and return its position in the catalog"""
+        index = len(self.endpoints)
+        self.endpoints.append(endpoint)
+
+        endpoint_id = f"{endpoint.method.upper()} {endpoint.path}"
+        if endpoint_id in self._by_id:
+            # GraphQL fields and duplicated Postman requests share method and path
+            endpoint_id += f"#{endpoint.operation_id or index}"
+        self._by_id[endpoint_id] = index
+
+        for tag in endpoint.tags:
+            self._by_tag[tag].append(index)
+        self._by_method[endpoint.method.upper()].append(index)
+        if endpoint.service:
+            self._by_service[endpoint.service].append(index)
+        if endpoint.operation_id:
+            self._by_operation_id.setdefault(endpoint.operation_id, index)
+        self._paths.insert(endpoint.path, index)
+
+        return index
+
+    def get(self, endpoint_id: str) -> Optional[ApiEndpoint]:
+        """Look up an endpoint by its "METHOD /path" id"""
+        index = self._by_id.get(endpoint_id)
+        return self.endpoints[index] if index is not None else None
+
+    def get_by_operation_id(self, operation_id: str) -> Optional[ApiEndpoint]:
+        index = self._by_operation_id.get(operation_id)
+        return self.endpoints[index] if index is not None else None
+
+    def endpoint_ids(self) -> List[str]:
+        return list(self._by_id)
+
+    def services(self) -> List[str]:
+        return list(self._by_service)
+
+    def select(
+        self,
+        tags: Optional[List[str]] = None,
+        methods: Optional[List[str]] = None,
+        path_glob: Optional[str] = None,
+        operation_ids: Optional[List[str]] = None,
+        services: Optional[List[str]] = None,
+    ) -> Optional[List[int]]:
+        """
+        Resolve selectors to endpoint positions in catalog order.
+
+        Values within one selector are alternatives and different selectors must
+        all match. Returns None when no selector is given.
+        """
+        candidates: List[Set[int]] = []
+
+        if tags:
+            candidates.append({i for tag in tags for i in self._by_tag.get(tag, ())})
+        if methods:
+            candidates.append(
+                {
+                    i
+                    for method in methods
+                    for i in self._by_method.get(method.upper(), ())
+                }
+            )
+        if operation_ids:
+            candidates.append(
+                {
+                    self._by_operation_id[operation_id]
+                    for operation_id in operation_ids
+                    if operation_id in self._by_operation_id
+                }
+            )
+        if services:
+            candidates.append(
+                {i for service in services for i in self._by_service.get(service, ())}
+            )
+        if path_glob:
+            candidates.append(set(self._paths.glob(path_glob)))
+
+        if not candidates:
+            return None
+
+        candidates.sort(key=len)
+        return sorted(candidates[0].intersection(*candidates[1:]))
+
+    def link_scenarios(self, scenarios: Iterable[ScenarioRecord]):
+        """Index scenario records by id and by the endpoint they exercise"""
+        for scenario in scenarios:
+            self.scenarios.add(scenario)
+
+    def link_test_cases(self, test_cases: Iterable[TestCaseRecord]):
+        """Index test case records by id and by the endpoint they exercise"""
+        for test_case in test_cases:
+            self.test_cases.add(test_case)
+
+    def endpoint_index_of_scenario(self, scenario_id: str) -> Optional[int]:
+        scenario = self.scenarios.by_id.get(scenario_id)
+        return scenario.endpoint_index if scenario is not None else None
+
+    def reset_scenarios(self):
+        self.scenarios = _LinkedItems()
+
+    def reset_test_cases(self):
+        self.test_cases = _LinkedItems()
+
+    def select_scenarios(
+        self, scenario_ids: Optional[List[str]] = None, **selectors
+    ) -> List[ScenarioRecord]:
+        """Scenarios matching the given ids and endpoint selectors"""
+        return self.scenarios.select(scenario_ids, self.select(**selectors))
+
+    def select_test_cases(
+        self, test_case_ids: Optional[List[str]] = None, **selectors
+    ) -> List[TestCaseRecord]:
+        """Test cases matching the given ids and endpoint selectors"""
+        return self.test_cases.select(test_case_ids, self.select(**selectors))
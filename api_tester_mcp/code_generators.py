@@ -1,11 +1,21 @@
 """Code generators for different languages and testing frameworks"""
 
+import asyncio
 import json
-from typing import Any, Dict, List, Optional
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from typing import IO, Any, Dict, List, Optional, Sequence, Tuple
 
-from jinja2 import Template
+from jinja2 import DictLoader, Environment, FileSystemBytecodeCache, Template
 
 from .models import TestCase, TestFramework, TestLanguage
+from .payloads import LargePayload
+
+# Template output pieces joined into each chunk written by write_test_code()
+STREAM_BUFFER_SIZE = 4096
 
 
 class CodeGenerator:
@@ -19,6 +29,30 @@ class CodeGenerator:
         self, test_cases: List[TestCase], session_info: Dict[str, Any]
     ) -> str:
         """Generate test code for the given test cases"""
+        template, context = self._prepare(test_cases, session_info)
+        return template.render(context)
+
+    def write_test_code(
+        self, test_cases: List[TestCase], session_info: Dict[str, Any], file: IO[str]
+    ):
+        """
+        Render test code straight into an open text file.
+
+        The template output is written in small chunks as it is produced, so
+        memory use does not grow with the size of the suite.
+        """
+        template, context = self._prepare(test_cases, session_info)
+        pieces = template.generate(context)
+        while True:
+            chunk = list(islice(pieces, STREAM_BUFFER_SIZE))
+            if not chunk:
+                break
+            file.write("".join(chunk))
+
+    def _prepare(
+        self, test_cases: List[TestCase], session_info: Dict[str, Any]
+    ) -> Tuple[Template, Dict[str, Any]]:
+        """Select the template and build its rendering context"""
 
         # Check if we have GraphQL test cases
         is_graphql = self._is_graphql_test_suite(test_cases)
@@ -26,13 +60,13 @@ class CodeGenerator:
         # Get the appropriate template
         template = self._get_template(is_graphql)
 
-        return template.render(
-            test_cases=test_cases,
-            session_info=session_info,
-            language=self.language.value,
-            framework=self.framework.value,
-            is_graphql=is_graphql,
-        )
+        return template, {
+            "test_cases": test_cases,
+            "session_info": session_info,
+            "language": self.language.value,
+            "framework": self.framework.value,
+            "is_graphql": is_graphql,
+        }
 
     def _is_graphql_test_suite(self, test_cases: List[TestCase]) -> bool:
         """Check if test cases are for GraphQL endpoints"""
@@ -50,64 +84,7 @@ class CodeGenerator:
 
     def _get_template(self, is_graphql: bool = False) -> Template:
         """Get the appropriate template for this language/framework combination"""
-        if is_graphql:
-            # Use GraphQL-specific templates when available
-            if (
-                self.language == TestLanguage.PYTHON
-                and self.framework == TestFramework.REQUESTS
-            ):
-                return Template(PYTHON_REQUESTS_GRAPHQL_TEMPLATE)
-            elif (
-                self.language == TestLanguage.PYTHON
-                and self.framework == TestFramework.PYTEST
-            ):
-                return Template(PYTHON_PYTEST_GRAPHQL_TEMPLATE)
-            elif (
-                self.language == TestLanguage.TYPESCRIPT
-                and self.framework == TestFramework.PLAYWRIGHT
-            ):
-                return Template(TYPESCRIPT_PLAYWRIGHT_GRAPHQL_TEMPLATE)
-            elif (
-                self.language == TestLanguage.JAVASCRIPT
-                and self.framework == TestFramework.JEST
-            ):
-                return Template(JAVASCRIPT_JEST_GRAPHQL_TEMPLATE)
-
-        # Use regular templates for REST APIs or unsupported GraphQL combinations
-        if (
-            self.language == TestLanguage.TYPESCRIPT
-            and self.framework == TestFramework.PLAYWRIGHT
-        ):
-            return Template(TYPESCRIPT_PLAYWRIGHT_TEMPLATE)
-        elif (
-            self.language == TestLanguage.JAVASCRIPT
-            and self.framework == TestFramework.JEST
-        ):
-            return Template(JAVASCRIPT_JEST_TEMPLATE)
-        elif (
-            self.language == TestLanguage.PYTHON
-            and self.framework == TestFramework.PYTEST
-        ):
-            return Template(PYTHON_PYTEST_TEMPLATE)
-        elif (
-            self.language == TestLanguage.PYTHON
-            and self.framework == TestFramework.REQUESTS
-        ):
-            return Template(PYTHON_REQUESTS_TEMPLATE)
-        elif (
-            self.language == TestLanguage.TYPESCRIPT
-            and self.framework == TestFramework.SUPERTEST
-        ):
-            return Template(TYPESCRIPT_SUPERTEST_TEMPLATE)
-        elif (
-            self.language == TestLanguage.JAVASCRIPT
-            and self.framework == TestFramework.CYPRESS
-        ):
-            return Template(JAVASCRIPT_CYPRESS_TEMPLATE)
-        else:
-            raise ValueError(
-                f"Unsupported language/framework combination: {self.language.value}/{self.framework.value}"
-            )
+        return get_template(self.language, self.framework, is_graphql)
 
 
 # TypeScript + Playwright Template
@@ -127,7 +104,7 @@ const BASE_URL = process.env.BASE_URL || '{{ session_info.base_url }}';
 const AUTH_TOKEN = process.env.AUTH_TOKEN || '{{ session_info.auth_token }}';
 
 {% for test_case in test_cases %}
-test('{{ test_case.name }}', async ({ request }) => {
+test({{ test_case.name | tojson }}, async ({ request }) => {
   const headers: Record<string, string> = {
     'Content-Type': 'application/json',
     'Accept': 'application/json'
@@ -136,7 +113,7 @@ test('{{ test_case.name }}', async ({ request }) => {
   {% if test_case.headers %}
   // Add additional headers, overriding defaults if necessary
   {% for key, value in test_case.headers.items() %}
-  headers['{{ key }}'] = '{{ value }}';
+  headers[{{ key | tojson }}] = {{ value | tojson }};
   {% endfor %}
   {% endif %}
 
@@ -144,7 +121,7 @@ test('{{ test_case.name }}', async ({ request }) => {
   const requestBody = {{ test_case.body | tojson }};
   {% endif %}
 
-  const response = await request.{{ test_case.method.lower() }}('{{ test_case.url }}', {
+  const response = await request.{{ test_case.method.lower() }}({{ test_case.url | tojson }}, {
     headers,
     {% if test_case.body %}
     data: requestBody,
@@ -202,7 +179,7 @@ axios.defaults.validateStatus = () => true; // Don't throw on any status code
 describe('API Test Suite', () => {
   {% for test_case in test_cases %}
   
-  test('{{ test_case.name }}', async () => {
+  test({{ test_case.name | tojson }}, async () => {
     const headers = {
       'Content-Type': 'application/json',
       'Accept': 'application/json'
@@ -211,13 +188,13 @@ describe('API Test Suite', () => {
     {% if test_case.headers %}
     // Add additional headers, overriding defaults if necessary
     {% for key, value in test_case.headers.items() %}
-    headers['{{ key }}'] = '{{ value }}';
+    headers[{{ key | tojson }}] = {{ value | tojson }};
     {% endfor %}
     {% endif %}
     
     const config = {
       method: '{{ test_case.method.lower() }}',
-      url: '{{ test_case.url }}',
+      url: {{ test_case.url | tojson }},
       headers,
       timeout: {{ test_case.timeout * 1000 }},
       {% if test_case.body %}
@@ -295,19 +272,32 @@ class TestAPIEndpoints:
         {% if test_case.headers %}
         # Add additional headers, overriding defaults if necessary
         {% for key, value in test_case.headers.items() %}
-        headers['{{ key }}'] = '{{ value }}'
+        headers[{{ key | tojson }}] = {{ value | tojson }}
         {% endfor %}
         {% endif %}
         
-        {% if test_case.body %}
+        {% if test_case.payload_size %}
+        {% set payload = large_payload(test_case.body, test_case.payload_size) %}
+        def request_body():
+            \"""{{ payload.total_size }} byte body streamed in chunks (chunked transfer encoding)\"""
+            yield {{ payload.prefix | tojson }}.encode('utf-8')
+            remaining = {{ payload.padding }}
+            while remaining > 0:
+                chunk = min(remaining, {{ payload.chunk_size }})
+                yield b'A' * chunk
+                remaining -= chunk
+            yield {{ payload.suffix | tojson }}.encode('utf-8')
+        {% elif test_case.body %}
         request_body = {{ test_case.body | tojson }}
         {% endif %}
         
         start_time = time.time()
         response = requests.{{ test_case.method.lower() }}(
-            url='{{ test_case.url }}',
+            url={{ test_case.url | tojson }},
             headers=headers,
-            {% if test_case.body %}
+            {% if test_case.payload_size %}
+            data=request_body(),
+            {% elif test_case.body %}
             json=request_body,
             {% endif %}
             timeout={{ test_case.timeout }}
@@ -377,19 +367,32 @@ def run_all_tests():
         {% if test_case.headers %}
         # Add additional headers, overriding defaults if necessary
         {% for key, value in test_case.headers.items() %}
-        headers['{{ key }}'] = '{{ value }}'
+        headers[{{ key | tojson }}] = {{ value | tojson }}
         {% endfor %}
         {% endif %}
         
-        {% if test_case.body %}
+        {% if test_case.payload_size %}
+        {% set payload = large_payload(test_case.body, test_case.payload_size) %}
+        def request_body():
+            \"""{{ payload.total_size }} byte body streamed in chunks (chunked transfer encoding)\"""
+            yield {{ payload.prefix | tojson }}.encode('utf-8')
+            remaining = {{ payload.padding }}
+            while remaining > 0:
+                chunk = min(remaining, {{ payload.chunk_size }})
+                yield b'A' * chunk
+                remaining -= chunk
+            yield {{ payload.suffix | tojson }}.encode('utf-8')
+        {% elif test_case.body %}
         request_body = {{ test_case.body | tojson }}
         {% endif %}
         
         start_time = time.time()
         response = requests.{{ test_case.method.lower() }}(
-            url='{{ test_case.url }}',
+            url={{ test_case.url | tojson }},
             headers=headers,
-            {% if test_case.body %}
+            {% if test_case.payload_size %}
+            data=request_body(),
+            {% elif test_case.body %}
             json=request_body,
             {% endif %}
             timeout={{ test_case.timeout }}
@@ -427,7 +430,7 @@ def run_all_tests():
         {% endfor %}
         
         results.append({
-            'test_name': '{{ test_case.name }}',
+            'test_name': {{ test_case.name | tojson }},
             'test_id': '{{ test_case.id }}',
             'passed': test_passed,
             'response_status': response.status_code,
@@ -435,17 +438,17 @@ def run_all_tests():
             'assertion_results': assertion_results
         })
         
-        print(f"✓ {{ test_case.name }} - {'PASSED' if test_passed else 'FAILED'}")
+        print("✓ " + {{ test_case.name | tojson }} + f" - {'PASSED' if test_passed else 'FAILED'}")
         print(f"  Status: {response.status_code}, Time: {response_time:.2f}ms")
         
     except Exception as e:
         results.append({
-            'test_name': '{{ test_case.name }}',
+            'test_name': {{ test_case.name | tojson }},
             'test_id': '{{ test_case.id }}',
             'passed': False,
             'error': str(e)
         })
-        print(f"✗ {{ test_case.name }} - ERROR: {e}")
+        print("✗ " + {{ test_case.name | tojson }} + f" - ERROR: {e}")
     
     {% endfor %}
     
@@ -483,9 +486,9 @@ const AUTH_TOKEN = process.env.AUTH_TOKEN || '{{ session_info.auth_token }}';
 describe('API Test Suite', () => {
   {% for test_case in test_cases %}
   
-  it('{{ test_case.name }}', async () => {
+  it({{ test_case.name | tojson }}, async () => {
     let req = request(BASE_URL)
-      .{{ test_case.method.lower() }}('{{ test_case.url.replace(session_info.base_url, '') }}')
+      .{{ test_case.method.lower() }}({{ test_case.url.replace(session_info.base_url, '') | tojson }})
       .set('Content-Type', 'application/json')
       .set('Accept', 'application/json')
       .timeout({{ test_case.timeout * 1000 }});
@@ -493,7 +496,7 @@ describe('API Test Suite', () => {
     {% if test_case.headers %}
     // Add additional headers (will override defaults if same key)
     {% for key, value in test_case.headers.items() %}
-    req = req.set('{{ key }}', '{{ value }}');
+    req = req.set({{ key | tojson }}, {{ value | tojson }});
     {% endfor %}
     {% endif %}
     
@@ -542,7 +545,7 @@ const AUTH_TOKEN = Cypress.env('AUTH_TOKEN') || '{{ session_info.auth_token }}';
 describe('API Test Suite', () => {
   {% for test_case in test_cases %}
   
-  it('{{ test_case.name }}', () => {
+  it({{ test_case.name | tojson }}, () => {
     const headers = {
       'Content-Type': 'application/json',
       'Accept': 'application/json'
@@ -551,13 +554,13 @@ describe('API Test Suite', () => {
     {% if test_case.headers %}
     // Add additional headers, overriding defaults if necessary
     {% for key, value in test_case.headers.items() %}
-    headers['{{ key }}'] = '{{ value }}';
+    headers[{{ key | tojson }}] = {{ value | tojson }};
     {% endfor %}
     {% endif %}
     
     const options = {
       method: '{{ test_case.method }}',
-      url: '{{ test_case.url }}',
+      url: {{ test_case.url | tojson }},
       headers,
       timeout: {{ test_case.timeout * 1000 }},
       {% if test_case.body %}
@@ -707,26 +710,26 @@ def run_all_tests():
         {% endif %}
         
         result = {
-            "test": "{{ test_case.name }}",
+            "test": {{ test_case.name | tojson }},
             "success": success,
             "response_time_ms": round(response_time, 2),
             "response_data": response_data,
             "error": error_msg
         }
         results.append(result)
-        print(f"✓ {{ test_case.name }}: {'PASS' if success else 'FAIL'} ({round(response_time, 2)}ms)")
+        print("✓ " + {{ test_case.name | tojson }} + f": {'PASS' if success else 'FAIL'} ({round(response_time, 2)}ms)")
         if error_msg:
             print(f"  Error: {error_msg}")
         
     except Exception as e:
         result = {
-            "test": "{{ test_case.name }}",
+            "test": {{ test_case.name | tojson }},
             "success": False,
             "response_time_ms": 0,
             "error": str(e)
         }
         results.append(result)
-        print(f"✗ {{ test_case.name }}: ERROR - {str(e)}")
+        print("✗ " + {{ test_case.name | tojson }} + f": ERROR - {str(e)}")
     
     {% endfor %}
     
@@ -905,7 +908,7 @@ async function executeGraphQLQuery(
 }
 
 {% for test_case in test_cases %}
-test('{{ test_case.name }}', async () => {
+test({{ test_case.name | tojson }}, async () => {
   {% if test_case.body %}
   const testBody = {{ test_case.body | tojson }};
   const query = testBody.query || '';
@@ -989,7 +992,7 @@ async function executeGraphQLQuery(query, variables = null, customHeaders = {})
 
 describe('GraphQL API Tests', () => {
   {% for test_case in test_cases %}
-  test('{{ test_case.name }}', async () => {
+  test({{ test_case.name | tojson }}, async () => {
     {% if test_case.body %}
     const testBody = {{ test_case.body | tojson }};
     const query = testBody.query || '';
@@ -1030,6 +1033,123 @@ describe('GraphQL API Tests', () => {
 """
 
 
+# Template names are "<language>/<framework>", with a ".graphql" suffix for the
+# GraphQL variants of the combinations that have one
+_TEMPLATE_SOURCES = {
+    "typescript/playwright": TYPESCRIPT_PLAYWRIGHT_TEMPLATE,
+    "typescript/playwright.graphql": TYPESCRIPT_PLAYWRIGHT_GRAPHQL_TEMPLATE,
+    "typescript/supertest": TYPESCRIPT_SUPERTEST_TEMPLATE,
+    "javascript/jest": JAVASCRIPT_JEST_TEMPLATE,
+    "javascript/jest.graphql": JAVASCRIPT_JEST_GRAPHQL_TEMPLATE,
+    "javascript/cypress": JAVASCRIPT_CYPRESS_TEMPLATE,
+    "python/pytest": PYTHON_PYTEST_TEMPLATE,
+    "python/pytest.graphql": PYTHON_PYTEST_GRAPHQL_TEMPLATE,
+    "python/requests": PYTHON_REQUESTS_TEMPLATE,
+    "python/requests.graphql": PYTHON_REQUESTS_GRAPHQL_TEMPLATE,
+}
+
+# Shared by all code generators. The sources never change at runtime, so
+# templates are not re-checked once compiled.
+template_environment = Environment(
+    loader=DictLoader(_TEMPLATE_SOURCES), auto_reload=False
+)
+# Python templates stream large payload bodies from a generator
+template_environment.globals["large_payload"] = LargePayload
+
+
+@lru_cache(maxsize=None)
+def get_template(
+    language: TestLanguage, framework: TestFramework, is_graphql: bool = False
+) -> Template:
+    """
+    Compiled template for a language/framework combination.
+
+    GraphQL suites fall back to the REST template of combinations without a
+    GraphQL variant.
+    """
+    name = f"{language.value}/{framework.value}"
+    if is_graphql and f"{name}.graphql" in _TEMPLATE_SOURCES:
+        name += ".graphql"
+    if name not in _TEMPLATE_SOURCES:
+        raise ValueError(
+            f"Unsupported language/framework combination: {language.value}/{framework.value}"
+        )
+    return template_environment.get_template(name)
+
+
+def enable_template_bytecode_cache(directory: str):
+    """
+    Keep compiled templates in a directory so a restarted server loads them
+    instead of compiling the sources again.
+    """
+    os.makedirs(directory, exist_ok=True)
+    template_environment.bytecode_cache = FileSystemBytecodeCache(directory)
+    template_environment.cache.clear()
+    get_template.cache_clear()
+
+
+def write_test_code_file(
+    language: TestLanguage,
+    framework: TestFramework,
+    test_cases: List[TestCase],
+    session_info: Dict[str, Any],
+    file_path: str,
+) -> Dict[str, Any]:
+    """
+    Render a suite into a file.
+
+    Runs in a worker process, so failures are reported in the returned
+    summary instead of being raised.
+    """
+    started = time.perf_counter()
+    result: Dict[str, Any] = {
+        "file_path": file_path,
+        "language": language.value,
+        "framework": framework.value,
+        "test_cases_count": len(test_cases),
+    }
+
+    try:
+        with open(file_path, "w", encoding="utf-8") as file:
+            CodeGenerator(language, framework).write_test_code(
+                test_cases, session_info, file
+            )
+    except Exception as e:
+        result["error"] = str(e)
+    finally:
+        result["render_time_ms"] = round((time.perf_counter() - started) * 1000, 2)
+
+    return result
+
+
+async def write_test_code_files(
+    jobs: Sequence[tuple], max_workers: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    Run write_test_code_file for each tuple of arguments without blocking the
+    event loop: in a process pool when there is more than one job and more
+    than one worker, otherwise in a thread. Results keep the order of jobs.
+    """
+    workers = min(len(jobs), max_workers or os.cpu_count() or 1)
+    if workers <= 1:
+        return [await asyncio.to_thread(write_test_code_file, *job) for job in jobs]
+
+    # Workers load compiled templates from the bytecode cache when one is set
+    cache = template_environment.bytecode_cache
+    initializer_args: Dict[str, Any] = {}
+    if isinstance(cache, FileSystemBytecodeCache):
+        initializer_args = {
+            "initializer": enable_template_bytecode_cache,
+            "initargs": (cache.directory,),
+        }
+
+    loop = asyncio.get_running_loop()
+    with ProcessPoolExecutor(max_workers=workers, **initializer_args) as pool:
+        return await asyncio.gather(
+            *(loop.run_in_executor(pool, write_test_code_file, *job) for job in jobs)
+        )
+
+
 def get_supported_combinations() -> List[Dict[str, str]]:
     """Get list of supported language/framework combinations"""
     return [
@@ -1067,10 +1187,18 @@ def get_supported_combinations() -> List[Dict[str, str]]:
 
 
 def generate_package_files(
-    language: TestLanguage, framework: TestFramework
+    language: TestLanguage,
+    framework: TestFramework,
+    shard_count: Optional[int] = None,
 ) -> Dict[str, str]:
-    """Generate package configuration files for the selected language/framework"""
+    """
+    Generate package configuration files for the selected language/framework.
+
+    With a shard_count above one the runner is configured to run that many test
+    files in parallel, matching a suite sharded by generate_test_cases.
+    """
     files = {}
+    workers = shard_count if shard_count and shard_count > 1 else None
 
     if language == TestLanguage.TYPESCRIPT:
         if framework == TestFramework.PLAYWRIGHT:
@@ -1088,14 +1216,19 @@ def generate_package_files(
     "typescript": "^5.0.0"
   }
 }"""
-            files[
-                "playwright.config.ts"
-            ] = """import { defineConfig } from '@playwright/test';
+            files["playwright.config.ts"] = (
+                """import { defineConfig } from '@playwright/test';
 
 export default defineConfig({
   testDir: './tests',
   timeout: 30000,
-  retries: 1,
+  retries: 1,"""
+                + (
+                    f"\n  fullyParallel: false,\n  workers: {workers},"
+                    if workers
+                    else ""
+                )
+                + """
   use: {
     baseURL: process.env.BASE_URL,
     extraHTTPHeaders: {
@@ -1103,6 +1236,7 @@ export default defineConfig({
     }
   }
 });"""
+            )
 
         elif framework == TestFramework.SUPERTEST:
             files["package.json"] = """{
@@ -1122,11 +1256,15 @@ export default defineConfig({
     "typescript": "^5.0.0"
   }
 }"""
-            files["jest.config.js"] = """module.exports = {
+            files["jest.config.js"] = (
+                """module.exports = {
   preset: 'ts-jest',
   testEnvironment: 'node',
-  testMatch: ['**/*.test.ts']
+  testMatch: ['**/*.test.ts']"""
+                + (f",\n  maxWorkers: {workers}" if workers else "")
+                + """
 };"""
+            )
 
     elif language == TestLanguage.JAVASCRIPT:
         if framework == TestFramework.JEST:
@@ -1143,6 +1281,11 @@ export default defineConfig({
     "jest": "^29.0.0"
   }
 }"""
+            if workers:
+                files["jest.config.js"] = f"""module.exports = {{
+  testEnvironment: 'node',
+  maxWorkers: {workers}
+}};"""
         elif framework == TestFramework.CYPRESS:
             files["package.json"] = """{
   "name": "api-tests",
@@ -1168,9 +1311,13 @@ export default defineConfig({
             files["requirements.txt"] = """pytest>=7.0.0
 requests>=2.28.0
 pytest-html>=3.0.0"""
-            files["pytest.ini"] = """[tool:pytest]
+            files["pytest.ini"] = """[pytest]
 testpaths = tests
 addopts = --html=report.html --self-contained-html -v"""
+            if workers:
+                # Each shard file stays on one worker
+                files["requirements.txt"] += "\npytest-xdist>=3.0.0"
+                files["pytest.ini"] += f" -n {workers} --dist loadfile"
         elif framework == TestFramework.REQUESTS:
             files["requirements.txt"] = """requests>=2.28.0"""
 
@@ -0,0 +1,265 @@
+"""Machine-readable exports of test results: JUnit XML, CSV and columnar files"""
+
+import csv
+import re
+import zipfile
+from itertools import islice
+from typing import IO, Any, Dict, Iterable, Optional, Sequence
+from urllib.parse import urlsplit
+from xml.sax.saxutils import escape, quoteattr
+
+from .models import TestResult
+
+# Rows written per chunk (CSV) or per row group (Parquet)
+EXPORT_BATCH_SIZE = 65536
+
+# Columns of load test samples, in file order
+LOAD_SAMPLE_COLUMNS = (
+    "timestamp",
+    "user_id",
+    "test_case_id",
+    "status_code",
+    "response_time",
+    "success",
+    "error",
+)
+
+# Longest response body excerpt kept in a JUnit test case's system-out
+MAX_SYSTEM_OUT = 2000
+
+# Characters XML 1.0 does not allow, even escaped
+_INVALID_XML_CHARS = re.compile(
+    "[^\t\n\r\x20-\ud7ff\ue000-\ufffd\U00010000-\U0010ffff]"
+)
+
+
+def _xml_text(value: Any) -> str:
+    """Text escaped for XML content"""
+    return escape(_INVALID_XML_CHARS.sub("\ufffd", str(value)))
+
+
+def _xml_attr(value: Any) -> str:
+    """Quoted, escaped XML attribute value"""
+    return quoteattr(_INVALID_XML_CHARS.sub("\ufffd", str(value)))
+
+
+def write_junit_xml(
+    results: Sequence[TestResult],
+    test_cases: Iterable[Any],
+    suite_name: str,
+    timestamp: str,
+    file: IO[str],
+):
+    """
+    Write API test results as a JUnit XML test suite.
+
+    Results with a response whose assertions failed are failures; results
+    without a response (connection errors, timeouts) are errors. Test cases
+    are grouped by endpoint through their classname. Elements are written as
+    they are produced, so the document is never held in memory.
+    """
+    cases = {case.id: case for case in test_cases}
+
+    failures = errors = 0
+    total_time = 0.0
+    for result in results:
+        total_time += result.execution_time
+        if result.status == "failed":
+            if result.response_status is None:
+                errors += 1
+            else:
+                failures += 1
+
+    file.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+    counts = (
+        f'tests="{len(results)}" failures="{failures}" errors="{errors}" '
+        f'time="{total_time:.3f}"'
+    )
+    file.write(f"<testsuites name={_xml_attr(suite_name)} {counts}>\n")
+    file.write(
+        f'  <testsuite name={_xml_attr(suite_name)} {counts} skipped="0" '
+        f"timestamp={_xml_attr(timestamp)}>\n"
+    )
+
+    for result in results:
+        case = cases.get(result.test_case_id)
+        if case is not None:
+            classname = f"{case.method} {urlsplit(case.url).path or '/'}"
+            name = case.name
+        else:
+            classname, name = "api_tests", result.test_case_id
+        file.write(
+            f"    <testcase classname={_xml_attr(classname)} name={_xml_attr(name)} "
+            f'time="{result.execution_time:.3f}"'
+        )
+        if result.status == "passed":
+            file.write(" />\n")
+            continue
+
+        file.write(">\n")
+        if result.status == "failed" and result.response_status is None:
+            message = result.error_message or "Request failed"
+            file.write(
+                f'      <error message={_xml_attr(message)} type="RequestError">'
+                f"{_xml_text(message)}</error>\n"
+            )
+        elif result.status == "failed":
+            failed = [
+                detail["message"]
+                for detail in result.assertion_details
+                if not detail["passed"]
+            ]
+            message = failed[0] if failed else result.error_message or "Failed"
+            file.write(
+                f'      <failure message={_xml_attr(message)} type="AssertionError">'
+                f"{_xml_text(chr(10).join(failed or [message]))}</failure>\n"
+            )
+        if result.response_body:
+            file.write(
+                "      <system-out>"
+                f"{_xml_text(result.response_body[:MAX_SYSTEM_OUT])}</system-out>\n"
+            )
+        file.write("    </testcase>\n")
+
+    file.write("  </testsuite>\n</testsuites>\n")
+
+
+def write_load_samples_csv(samples: Iterable[Dict[str, Any]], file: IO[str]):
+    """Write load test samples as CSV, one request per row, in batches"""
+    writer = csv.writer(file)
+    writer.writerow(LOAD_SAMPLE_COLUMNS)
+    rows = (
+        [sample.get(column) for column in LOAD_SAMPLE_COLUMNS] for sample in samples
+    )
+    while True:
+        batch = list(islice(rows, EXPORT_BATCH_SIZE))
+        if not batch:
+            break
+        writer.writerows(batch)
+
+
+def columnar_format() -> Optional[str]:
+    """File format of write_load_samples_columnar: parquet, npz or None"""
+    try:
+        import pyarrow.parquet  # noqa: F401
+
+        return "parquet"
+    except ImportError:
+        pass
+    try:
+        import numpy  # noqa: F401
+
+        return "npz"
+    except ImportError:
+        return None
+
+
+def write_load_samples_columnar(
+    samples: Sequence[Dict[str, Any]], base_path: str
+) -> Optional[str]:
+    """
+    Write load test samples in a columnar file for notebooks and warehouses.
+
+    Uses Parquet (one row group per batch) when pyarrow is installed, and a
+    compressed NumPy .npz archive when only numpy is. Returns the path
+    written, or None when neither is available.
+    """
+    file_format = columnar_format()
+    if file_format == "parquet":
+        file_path = f"{base_path}.parquet"
+        _write_parquet(samples, file_path)
+    elif file_format == "npz":
+        file_path = f"{base_path}.npz"
+        _write_npz(samples, file_path)
+    else:
+        return None
+    return file_path
+
+
+def _write_parquet(samples: Iterable[Dict[str, Any]], file_path: str):
+    """Parquet file of samples, written a row group at a time"""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pa.schema(
+        [
+            ("timestamp", pa.float64()),
+            ("user_id", pa.int32()),
+            ("test_case_id", pa.string()),
+            ("status_code", pa.int16()),
+            ("response_time", pa.float64()),
+            ("success", pa.bool_()),
+            ("error", pa.string()),
+        ]
+    )
+    samples = iter(samples)
+    with pq.ParquetWriter(file_path, schema, compression="zstd") as writer:
+        while True:
+            batch = list(islice(samples, EXPORT_BATCH_SIZE))
+            if not batch:
+                break
+            columns = {
+                column: [sample.get(column) for sample in batch]
+                for column in LOAD_SAMPLE_COLUMNS
+            }
+            writer.write_table(pa.Table.from_pydict(columns, schema=schema))
+
+
+def _write_npz(samples: Sequence[Dict[str, Any]], file_path: str):
+    """
+    Compressed .npz archive with one array per column.
+
+    Each column is written into its own archive member a batch at a time,
+    so only one batch of values is converted to an array at once. Test case
+    ids are stored as codes into a test_case_ids array and errors as codes
+    into an errors array (-1 for none), which keeps the archive small and
+    the arrays numeric.
+    """
+    import numpy as np
+    from numpy.lib import format as npy_format
+
+    test_case_ids: Dict[str, int] = {}
+    error_messages: Dict[str, int] = {}
+
+    def code(values: Dict[str, int], value: Optional[str]) -> int:
+        if value is None:
+            return -1
+        return values.setdefault(value, len(values))
+
+    columns = (
+        ("timestamp", np.float64, lambda sample: sample["timestamp"]),
+        ("user_id", np.int32, lambda sample: sample["user_id"]),
+        (
+            "test_case_id",
+            np.int32,
+            lambda sample: code(test_case_ids, sample["test_case_id"]),
+        ),
+        ("status_code", np.int16, lambda sample: sample["status_code"]),
+        ("response_time", np.float64, lambda sample: sample["response_time"]),
+        ("success", np.bool_, lambda sample: sample["success"]),
+        ("error", np.int32, lambda sample: code(error_messages, sample.get("error"))),
+    )
+
+    with zipfile.ZipFile(file_path, "w", zipfile.ZIP_DEFLATED) as archive:
+        for name, dtype, value in columns:
+            with archive.open(f"{name}.npy", "w", force_zip64=True) as member:
+                npy_format.write_array_header_1_0(
+                    member,
+                    {
+                        "descr": npy_format.dtype_to_descr(np.dtype(dtype)),
+                        "fortran_order": False,
+                        "shape": (len(samples),),
+                    },
+                )
+                for start in range(0, len(samples), EXPORT_BATCH_SIZE):
+                    batch = samples[start : start + EXPORT_BATCH_SIZE]
+                    member.write(
+                        np.fromiter(map(value, batch), dtype, len(batch)).tobytes()
+                    )
+
+        for name, values in (
+            ("test_case_ids", test_case_ids),
+            ("errors", error_messages),
+        ):
+            with archive.open(f"{name}.npy", "w", force_zip64=True) as member:
+                npy_format.write_array(member, np.array(list(values), dtype=str))
@@ -0,0 +1,661 @@
+"""Schema-aware HTTP fuzzing: mutated valid requests and crash triage"""
+
+import asyncio
+import hashlib
+import json
+import os
+import random
+import re
+import time
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+from urllib.parse import parse_qsl, quote, urlencode, urlsplit, urlunsplit
+
+import aiohttp
+
+from .boundaries import (
+    BODY_METHODS,
+    Resolver,
+    iter_parameters,
+    request_body_schema,
+    sample_value,
+)
+from .models import ApiEndpoint, TestCase
+from .utils import ProgressTracker, logger
+
+FUZZ_MUTATORS = ("type_confusion", "huge_string", "unicode", "null", "deep_nesting")
+
+DEFAULT_HUGE_STRING_LENGTH = 64 * 1024
+DEFAULT_NESTING_DEPTH = 256
+
+# Bracketed query parameter names (a[a][a]=...) nest at most this deep
+MAX_QUERY_NESTING_DEPTH = 64
+
+# Body fields below this depth are not mutated on their own
+MAX_FIELD_DEPTH = 6
+
+# Fields of one body that are candidates for mutation
+MAX_FIELDS_PER_BODY = 256
+
+# Requests spent shrinking the reproducer of each distinct crash
+MAX_MINIMIZE_REQUESTS = 32
+
+# Bytes of a crash response kept in its corpus entry
+RESPONSE_EXCERPT_BYTES = 512
+
+# Headers that are never mutated, so requests stay authenticated
+_AUTH_HEADERS = {"authorization", "cookie", "x-api-key"}
+
+_UNICODE_SAMPLES = (
+    "\u0000",
+    "\ud800",  # Lone surrogate
+    "\u202egnp.exe",  # Right-to-left override
+    "\ufeffBOM",
+    "\u2028\u2029",  # Line and paragraph separators
+    "Z\u0351\u0352\u0353\u0354\u0355\u0356\u0357" * 8,  # Stacked combining marks
+    "\U0001f600\U0001f44d\U0001f3fd\U0001f468\u200d\U0001f469\u200d\U0001f467",
+    "\U0001d518\U0001d52b\U0001d526\U0001d520\U0001d52c\U0001d521\U0001d522",
+    "\uff21\uff44\uff4d\uff49\uff4e",  # Fullwidth "Admin"
+    "\u01c5\u01c8\u01cb \u00df \ufb03 \u0130",  # Case mapping changes length
+)
+
+_TYPE_CONFUSIONS = ("", "not_a_number", -1, 0, 2**63, 1e308, True, [], {})
+
+# Numbers and quoted text in error pages: ids, timestamps, echoed input
+_RESPONSE_NOISE = re.compile(rb"\d+|'[^'\n]*'|\"[^\"\n]*\"")
+
+_CONTROL_CHARACTERS = re.compile(r"[\x00-\x1f\x7f]")
+
+_NO_BODY = object()
+
+
+def _transport_value(value: Any) -> str:
+    """Value as written in a query string, header or path segment"""
+    if isinstance(value, str):
+        return value
+    if value is None:
+        return ""
+    return json.dumps(value, separators=(",", ":"))
+
+
+@lru_cache(maxsize=256)
+def _escape_header(text: str) -> str:
+    # Control characters are refused by the client; lone surrogates cannot be
+    # encoded. Both are sent as backslash escapes instead.
+    text = _CONTROL_CHARACTERS.sub(lambda match: f"\\x{ord(match.group()):02x}", text)
+    return text.encode("utf-8", "backslashreplace").decode("utf-8")
+
+
+def _header_value(value: Any) -> str:
+    """Value as written in a header; mutations repeat, so escaping is cached"""
+    return _escape_header(_transport_value(value))
+
+
+class FuzzRequest(NamedTuple):
+    """A mutated request and the mutation that produced it"""
+
+    endpoint: str  # "METHOD /path" of the specification
+    mutator: str
+    location: str  # body, query, header or path
+    field: Tuple[Any, ...]  # Body path, (name,) or (path segment index,)
+    method: str
+    path: str  # URL without query string
+    query: Tuple[Tuple[str, str], ...]
+    headers: Dict[str, str]
+    body: Any  # _NO_BODY when the request has none
+
+    def url(self) -> str:
+        if not self.query:
+            return self.path
+        query = urlencode(self.query, quote_via=quote, errors="surrogatepass")
+        return f"{self.path}?{query}"
+
+    def body_bytes(self) -> Optional[bytes]:
+        if self.body is _NO_BODY:
+            return None
+        return json.dumps(self.body, separators=(",", ":")).encode("utf-8")
+
+    def size(self) -> int:
+        body = self.body_bytes() or b""
+        headers = sum(len(name) + len(value) for name, value in self.headers.items())
+        return len(self.url()) + headers + len(body)
+
+    def field_name(self) -> str:
+        return ".".join(str(part) for part in self.field) or "(whole body)"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "endpoint": self.endpoint,
+            "mutator": self.mutator,
+            "location": self.location,
+            "field": self.field_name(),
+            "method": self.method,
+            "url": self.url(),
+            "headers": self.headers,
+            "body": None if self.body is _NO_BODY else self.body,
+        }
+
+
+class FuzzSeed(NamedTuple):
+    """A valid request of one endpoint that mutations start from"""
+
+    endpoint: str
+    method: str
+    path: str
+    query: Tuple[Tuple[str, str], ...]
+    headers: Dict[str, str]
+    body: Any
+    targets: Tuple[Tuple[str, Tuple[Any, ...]], ...]  # (location, field)
+
+    @classmethod
+    def from_test_case(cls, test_case: TestCase, endpoint: ApiEndpoint) -> "FuzzSeed":
+        parts = urlsplit(test_case.url)
+        path = urlunsplit((parts.scheme, parts.netloc, parts.path, "", ""))
+        query = tuple(parse_qsl(parts.query, keep_blank_values=True))
+        body = _NO_BODY if test_case.body is None else test_case.body
+
+        targets: List[Tuple[str, Tuple[Any, ...]]] = []
+        if body is not _NO_BODY or test_case.method.upper() in BODY_METHODS:
+            body = {} if body is _NO_BODY else body
+            targets.extend(("body", field) for field in _body_fields(body))
+        targets.extend(("query", (index,)) for index in range(len(query)))
+        targets.extend(
+            ("header", (name,))
+            for name in test_case.headers
+            if name.lower() not in _AUTH_HEADERS
+        )
+
+        # Path parameters are the trailing template segments of the URL; the
+        # first three segments of "scheme://host/..." are never parameters
+        template = endpoint.path.split("?", 1)[0].strip("/").split("/")
+        offset = len(path.split("/")) - len(template)
+        targets.extend(
+            ("path", (offset + index,))
+            for index, segment in enumerate(template)
+            if segment.startswith(("{", ":")) and offset + index >= 3
+        )
+
+        return cls(
+            endpoint=f"{endpoint.method} {endpoint.path}",
+            method=test_case.method,
+            path=path,
+            query=query,
+            headers=dict(test_case.headers),
+            body=body,
+            targets=tuple(targets),
+        )
+
+
+def seed_test_data(
+    endpoint: ApiEndpoint, resolve: Resolver = lambda obj: obj
+) -> Dict[str, Any]:
+    """
+    Valid inputs for every declared parameter of an endpoint and a body with
+    all properties, optional ones included, so each of them can be mutated
+    """
+    test_data: Dict[str, Any] = {"path_params": {}, "query": {}, "headers": {}}
+    keys = {"path": "path_params", "query": "query", "header": "headers"}
+    for location, name, schema, _ in iter_parameters(endpoint, resolve):
+        value = sample_value(schema, resolve)
+        test_data[keys[location]][name] = 1 if value is None else value
+
+    if endpoint.method.upper() in BODY_METHODS:
+        schema = request_body_schema(endpoint)
+        if schema is not None:
+            test_data["body"] = sample_value(schema, resolve, include_optional=True)
+    return test_data
+
+
+def _body_fields(body: Any) -> List[Tuple[Any, ...]]:
+    """Paths of the body and its nested values, breadth first"""
+    fields: List[Tuple[Any, ...]] = [()]
+    queue = [((), body)]
+    while queue and len(fields) < MAX_FIELDS_PER_BODY:
+        path, value = queue.pop(0)
+        if len(path) >= MAX_FIELD_DEPTH:
+            continue
+        if isinstance(value, dict):
+            children = list(value.items())
+        elif isinstance(value, list):
+            children = list(enumerate(value))
+        else:
+            continue
+        for key, child in children:
+            fields.append(path + (key,))
+            queue.append((path + (key,), child))
+    return fields[:MAX_FIELDS_PER_BODY]
+
+
+def _value_at(body: Any, field: Tuple[Any, ...]) -> Any:
+    for key in field:
+        body = body[key]
+    return body
+
+
+def _replace_at(body: Any, field: Tuple[Any, ...], value: Any) -> Any:
+    """Copy of body with one value replaced, sharing the untouched containers"""
+    if not field:
+        return value
+    key = field[0]
+    copy = list(body) if isinstance(body, list) else dict(body)
+    copy[key] = _replace_at(body[key], field[1:], value)
+    return copy
+
+
+def _nested(depth: int) -> Any:
+    value: Any = "x"
+    for level in range(depth):
+        value = {"a": value} if level % 2 else [value]
+    return value
+
+
+class MutationEngine:
+    """
+    Produce mutated requests from valid seeds.
+
+    Every mutation changes one field of one seed with one mutator, all picked
+    by a seeded random generator, so a run with the same seed sends the same
+    requests. Bodies share every container the mutation does not touch.
+    """
+
+    def __init__(
+        self,
+        seeds: List[FuzzSeed],
+        mutators: Iterable[str] = FUZZ_MUTATORS,
+        huge_string_length: int = DEFAULT_HUGE_STRING_LENGTH,
+        nesting_depth: int = DEFAULT_NESTING_DEPTH,
+        seed: Optional[int] = None,
+    ):
+        self.seeds = [seed_request for seed_request in seeds if seed_request.targets]
+        self.mutators = tuple(mutators)
+        self.nesting_depth = nesting_depth
+        self.huge_string = "A" * huge_string_length
+        self.nested = _nested(nesting_depth)
+        self.rng = random.Random(seed)
+
+    def _value(self, mutator: str, original: Any) -> Any:
+        if mutator == "type_confusion":
+            candidates = [
+                value for value in _TYPE_CONFUSIONS if type(value) is not type(original)
+            ]
+            return self.rng.choice(candidates)
+        if mutator == "huge_string":
+            return self.huge_string
+        if mutator == "unicode":
+            return self.rng.choice(_UNICODE_SAMPLES)
+        if mutator == "null":
+            return None
+        if mutator == "deep_nesting":
+            return self.nested
+        raise ValueError(f"Unknown mutator '{mutator}'")
+
+    def mutate(
+        self, seed: FuzzSeed, location: str, field: Tuple[Any, ...], mutator: str
+    ) -> FuzzRequest:
+        """Apply one mutator to one field of a seed"""
+        query, headers, body, path = seed.query, seed.headers, seed.body, seed.path
+
+        if location == "body":
+            value = self._value(mutator, _value_at(body, field))
+            body = _replace_at(body, field, value)
+        elif location == "query":
+            index = field[0]
+            name, original = query[index]
+            if mutator == "deep_nesting":
+                depth = min(self.nesting_depth, MAX_QUERY_NESTING_DEPTH)
+                name += "[a]" * depth
+                value = original
+            else:
+                value = _transport_value(self._value(mutator, original))
+            query = query[:index] + ((name, value),) + query[index + 1 :]
+        elif location == "header":
+            name = field[0]
+            headers = dict(headers)
+            headers[name] = _header_value(self._value(mutator, headers[name]))
+        else:
+            segments = path.split("/")
+            value = _transport_value(self._value(mutator, segments[field[0]]))
+            segments[field[0]] = quote(value or "null", safe="", errors="surrogatepass")
+            path = "/".join(segments)
+
+        return FuzzRequest(
+            seed.endpoint,
+            mutator,
+            location,
+            field,
+            seed.method,
+            path,
+            query,
+            headers,
+            body,
+        )
+
+    def generate(self, count: int) -> Iterator[FuzzRequest]:
+        """Yield count random mutations of the seeds"""
+        if not self.seeds or not self.mutators:
+            return
+        for _ in range(count):
+            seed = self.rng.choice(self.seeds)
+            location, field = self.rng.choice(seed.targets)
+            yield self.mutate(seed, location, field, self.rng.choice(self.mutators))
+
+
+def _response_shape(value: Any) -> Any:
+    """Keys and value types of a JSON response, without the values"""
+    if isinstance(value, dict):
+        return {key: _response_shape(item) for key, item in sorted(value.items())}
+    if isinstance(value, list):
+        return [_response_shape(value[0])] if value else []
+    return type(value).__name__
+
+
+def response_signature(endpoint: str, status: int, body: bytes) -> str:
+    """
+    Identify a crash by endpoint, status code and response body.
+
+    Error pages often echo the input or include ids and timestamps, so JSON
+    bodies are compared by their keys and value types, and other bodies with
+    numbers and quoted text masked.
+    """
+    try:
+        normalized = json.dumps(_response_shape(json.loads(body))).encode("utf-8")
+    except (ValueError, RecursionError):
+        normalized = _RESPONSE_NOISE.sub(b"0", body)
+
+    digest = hashlib.blake2b(digest_size=8)
+    digest.update(endpoint.encode("utf-8"))
+    digest.update(normalized)
+    return f"{status}-{digest.hexdigest()}"
+
+
+def error_signature(endpoint: str, kind: str) -> str:
+    """Identify a timeout or dropped connection of an endpoint"""
+    digest = hashlib.blake2b(endpoint.encode("utf-8"), digest_size=8)
+    return f"{kind}-{digest.hexdigest()}"
+
+
+class FuzzCrash:
+    """Requests that produced one crash signature, with the smallest kept"""
+
+    __slots__ = ("signature", "status", "count", "request", "response_excerpt")
+
+    def __init__(
+        self,
+        signature: str,
+        status: Optional[int],
+        request: FuzzRequest,
+        response_excerpt: str,
+    ):
+        self.signature = signature
+        self.status = status
+        self.count = 1
+        self.request = request
+        self.response_excerpt = response_excerpt
+
+    def add(self, request: FuzzRequest):
+        self.count += 1
+        if request.size() < self.request.size():
+            self.request = request
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "signature": self.signature,
+            "status": self.status,
+            "count": self.count,
+            "request": self.request.to_dict(),
+            "request_size": self.request.size(),
+            "response_excerpt": self.response_excerpt,
+        }
+
+
+class FuzzExecutor:
+    """
+    Send mutated requests through a fixed pool of concurrent workers.
+
+    Workers pull requests from one shared iterator, so mutations are produced
+    as they are sent and memory stays flat however many are requested.
+    Responses with a 5xx status, timeouts and dropped connections are crashes,
+    deduplicated by signature; everything else is only counted.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = 50,
+        timeout: float = 10.0,
+        minimize: bool = True,
+    ):
+        self.max_concurrent = max_concurrent
+        self.timeout = timeout
+        self.minimize = minimize
+        self.crashes: Dict[str, FuzzCrash] = {}
+        self.status_classes: Dict[str, int] = {}
+        self.mutator_counts: Dict[str, int] = {}
+        self.client_rejected = 0
+        self.sent = 0
+        self.minimize_requests = 0
+
+    async def _send(
+        self, session: aiohttp.ClientSession, request: FuzzRequest
+    ) -> Tuple[Optional[int], Optional[str], bytes]:
+        """Status, crash signature (None when not a crash) and response body"""
+        try:
+            async with session.request(
+                request.method,
+                request.url(),
+                headers=request.headers,
+                data=request.body_bytes(),
+            ) as response:
+                body = await response.read()
+        except aiohttp.InvalidURL:
+            return None, None, b""
+        except asyncio.TimeoutError:
+            return None, error_signature(request.endpoint, "timeout"), b""
+        except aiohttp.ClientError:
+            return None, error_signature(request.endpoint, "connection_error"), b""
+        except (ValueError, UnicodeError):
+            # The client library refused to send it, e.g. an unencodable URL
+            return None, None, b""
+
+        if response.status >= 500:
+            signature = response_signature(request.endpoint, response.status, body)
+            return response.status, signature, body
+        return response.status, None, body
+
+    def _record(
+        self,
+        request: FuzzRequest,
+        status: Optional[int],
+        signature: Optional[str],
+        body: bytes,
+    ):
+        self.sent += 1
+        self.mutator_counts[request.mutator] = (
+            self.mutator_counts.get(request.mutator, 0) + 1
+        )
+        if status is None and signature is None:
+            self.client_rejected += 1
+            return
+
+        status_class = f"{status // 100}xx" if status is not None else "no_response"
+        self.status_classes[status_class] = self.status_classes.get(status_class, 0) + 1
+
+        if signature is not None:
+            crash = self.crashes.get(signature)
+            if crash is None:
+                excerpt = body[:RESPONSE_EXCERPT_BYTES].decode("utf-8", "replace")
+                self.crashes[signature] = FuzzCrash(signature, status, request, excerpt)
+            else:
+                crash.add(request)
+
+    async def _worker(
+        self,
+        session: aiohttp.ClientSession,
+        requests: Iterator[FuzzRequest],
+        progress: ProgressTracker,
+        chunk: int,
+    ):
+        for request in requests:
+            status, signature, body = await self._send(session, request)
+            self._record(request, status, signature, body)
+            if self.sent % chunk == 0:
+                progress.update(f"{self.sent} requests, {len(self.crashes)} crashes")
+
+    def _reductions(self, request: FuzzRequest) -> Iterator[FuzzRequest]:
+        """Smaller variants of a reproducer, most promising first"""
+        # Shrink the mutated value itself
+        if request.location == "body":
+            value = _value_at(request.body, request.field)
+            smaller = _shrink(value)
+            if smaller is not None:
+                body = _replace_at(request.body, request.field, smaller)
+                yield request._replace(body=body)
+        elif request.location in ("query", "header"):
+            if request.location == "query":
+                index = request.field[0]
+                name, value = request.query[index]
+            else:
+                value = request.headers[request.field[0]]
+            if len(value) > 1:
+                smaller = value[: len(value) // 2]
+                if request.location == "query":
+                    query = list(request.query)
+                    query[index] = (name, smaller)
+                    yield request._replace(query=tuple(query))
+                else:
+                    headers = dict(request.headers)
+                    headers[request.field[0]] = smaller
+                    yield request._replace(headers=headers)
+
+        # Drop the body fields, query parameters and headers not mutated
+        if isinstance(request.body, dict):
+            kept = request.field[:1]
+            for key in request.body:
+                if (key,) != kept:
+                    body = {k: v for k, v in request.body.items() if k != key}
+                    yield request._replace(body=body)
+        for index in range(len(request.query)):
+            if request.location != "query" or index != request.field[0]:
+                query = request.query[:index] + request.query[index + 1 :]
+                field = request.field
+                if request.location == "query" and index < request.field[0]:
+                    field = (request.field[0] - 1,)
+                yield request._replace(query=query, field=field)
+
+    async def _minimize(self, session: aiohttp.ClientSession, crash: FuzzCrash):
+        """
+        Greedily apply reductions that still produce the same signature.
+
+        Timeouts and dropped connections are not minimized; reproducing them
+        costs a full timeout or a restart of the server under test.
+        """
+        if crash.status is None:
+            return
+        budget = MAX_MINIMIZE_REQUESTS
+        reduced = True
+        while reduced and budget > 0:
+            reduced = False
+            for candidate in self._reductions(crash.request):
+                if budget <= 0:
+                    break
+                budget -= 1
+                self.minimize_requests += 1
+                _, signature, _ = await self._send(session, candidate)
+                if signature == crash.signature:
+                    crash.request = candidate
+                    reduced = True
+                    break
+
+    async def run(self, requests: Iterator[FuzzRequest], total: int) -> Dict[str, Any]:
+        """Send the requests, minimize the crashes found and summarize the run"""
+        progress = ProgressTracker(
+            total_steps=100, operation_name=f"Fuzzing ({total} mutations)"
+        )
+        progress.start()
+        chunk = max(1, total // 100)
+
+        started = time.perf_counter()
+        connector = aiohttp.TCPConnector(limit=self.max_concurrent)
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        async with aiohttp.ClientSession(
+            connector=connector, timeout=timeout
+        ) as session:
+            workers = min(self.max_concurrent, max(1, total))
+            await asyncio.gather(
+                *(
+                    self._worker(session, requests, progress, chunk)
+                    for _ in range(workers)
+                )
+            )
+            fuzz_seconds = time.perf_counter() - started
+
+            if self.minimize:
+                for crash in self.crashes.values():
+                    await self._minimize(session, crash)
+
+        progress.finish()
+        logger.info(
+            f"🧨 Fuzzing sent {self.sent} requests in {fuzz_seconds:.2f}s, "
+            f"found {len(self.crashes)} distinct crashes"
+        )
+
+        return {
+            "total_requests": self.sent,
+            "duration_seconds": round(fuzz_seconds, 3),
+            "requests_per_second": (
+                round(self.sent / fuzz_seconds, 1) if fuzz_seconds > 0 else None
+            ),
+            "status_classes": self.status_classes,
+            "client_rejected": self.client_rejected,
+            "mutators": self.mutator_counts,
+            "unique_crashes": len(self.crashes),
+            "minimize_requests": self.minimize_requests,
+            "crashes": [
+                crash.to_dict()
+                for crash in sorted(
+                    self.crashes.values(), key=lambda crash: -crash.count
+                )
+            ],
+        }
+
+
+def _shrink(value: Any) -> Any:
+    """Roughly half of a string or nested value, or None when it is minimal"""
+    if isinstance(value, str) and len(value) > 1:
+        return value[: len(value) // 2]
+    depth = 0
+    inner = value
+    while isinstance(inner, (list, dict)) and len(inner) == 1:
+        inner = next(iter(inner.values())) if isinstance(inner, dict) else inner[0]
+        depth += 1
+    if depth > 1:
+        return _nested(depth // 2)
+    return None
+
+
+def save_corpus(corpus_dir: str, crashes: Iterable[Dict[str, Any]]) -> List[str]:
+    """
+    Write one file per crash signature into the corpus directory.
+
+    An entry from an earlier run keeps its request when that one is smaller,
+    and crash counts accumulate. Returns the paths written.
+    """
+    os.makedirs(corpus_dir, exist_ok=True)
+    written = []
+    for crash in crashes:
+        file_path = os.path.join(corpus_dir, f"{crash['signature']}.json")
+        entry = dict(crash)
+        try:
+            with open(file_path, "r", encoding="utf-8") as f:
+                existing = json.load(f)
+        except (OSError, ValueError):
+            existing = None
+        if isinstance(existing, dict):
+            entry["count"] = existing.get("count", 0) + crash["count"]
+            if existing.get("request_size", float("inf")) <= crash["request_size"]:
+                entry["request"] = existing["request"]
+                entry["request_size"] = existing["request_size"]
+
+        with open(file_path, "w", encoding="utf-8") as f:
+            json.dump(entry, f, indent=2)
+        written.append(file_path)
+    return written
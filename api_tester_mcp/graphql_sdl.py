@@ -0,0 +1,496 @@
+"""Single-pass tokenizer and recursive-descent parser for GraphQL SDL"""
+
+import gc
+import json
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+BUILTIN_SCALARS = ["String", "Int", "Float", "Boolean", "ID"]
+
+_DEFINITION_KEYWORDS = {
+    "schema",
+    "scalar",
+    "type",
+    "interface",
+    "union",
+    "enum",
+    "input",
+    "directive",
+    "extend",
+}
+
+# Whitespace, commas and comments; a comment always runs to the end of its line
+_IGNORED = r"(?:[\s,\ufeff]|\#[^\n\r]*(?![^\n\r]))*"
+_IGNORED_PATTERN = re.compile(_IGNORED)
+
+# Each match consumes any ignored characters followed by exactly one token
+_TOKEN_PATTERN = re.compile(
+    _IGNORED + r"""
+    (?:
+      (?P<block_string>\"\"\"(?:\\\"\"\"|[\s\S])*?\"\"\")
+    | (?P<string>"(?:[^"\\\n\r]|\\.)*")
+    | (?P<number>-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?(?:[eE][+-]?[0-9]+)?)
+    | (?P<name>[_A-Za-z][_0-9A-Za-z]*)
+    | (?P<punct>\.\.\.|[!$&():=@\[\]{|}])
+    | (?P<eof>\Z)
+    )
+    """,
+    re.VERBOSE,
+)
+
+# Token tuples are (kind, value, offset)
+Token = Tuple[str, Any, int]
+
+
+def _location(text: str, offset: int) -> str:
+    """Describe an offset in the source as a line and column"""
+    line = text.count("\n", 0, offset) + 1
+    column = offset - text.rfind("\n", 0, offset)
+    return f"line {line}, column {column}"
+
+
+def _block_string_value(raw: str) -> str:
+    """Apply the GraphQL block string indentation rules"""
+    lines = raw.replace('\\"""', '"""').splitlines()
+
+    common_indent = None
+    for line in lines[1:]:
+        stripped = line.lstrip(" \t")
+        if stripped:
+            indent = len(line) - len(stripped)
+            if common_indent is None or indent < common_indent:
+                common_indent = indent
+
+    if common_indent:
+        lines = lines[:1] + [line[common_indent:] for line in lines[1:]]
+
+    while lines and not lines[0].strip():
+        lines.pop(0)
+    while lines and not lines[-1].strip():
+        lines.pop()
+
+    return "\n".join(lines)
+
+
+def tokenize_sdl(text: str) -> List[Token]:
+    """Split SDL text into tokens in a single left-to-right pass"""
+    tokens = []
+    append = tokens.append
+    pos = 0
+
+    match = _TOKEN_PATTERN.match
+    while True:
+        token_match = match(text, pos)
+        if token_match is None:
+            break
+
+        kind = token_match.lastgroup
+        if kind == "eof":
+            append(("eof", None, pos))
+            return tokens
+
+        start = token_match.start(kind)
+        value = token_match.group(kind)
+        pos = token_match.end()
+
+        if kind == "name" or kind == "punct":
+            append((kind, value, start))
+        elif kind == "string":
+            append((kind, json.loads(value), start))
+        elif kind == "block_string":
+            append(("string", _block_string_value(value[3:-3]), start))
+        else:
+            number = float(value) if any(c in value for c in ".eE") else int(value)
+            append((kind, number, start))
+
+    pos = _IGNORED_PATTERN.match(text, pos).end()
+    raise ValueError(f"Unexpected character {text[pos]!r} at {_location(text, pos)}")
+
+
+class SDLParser:
+    """
+    Recursive-descent parser that builds a full GraphQL type map from SDL.
+
+    The result mirrors the ``__schema`` object of an introspection query, so SDL
+    documents and introspection results can be processed by the same code.
+    Type extensions are merged into their base definitions regardless of order.
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        self.tokens = tokenize_sdl(text)
+        self.index = 0
+        self.types: Dict[str, Dict[str, Any]] = {}
+        self.directives: List[Dict[str, Any]] = []
+        self.root_types: Dict[str, str] = {}
+        self.named_refs: List[Dict[str, Any]] = []
+
+    def parse(self) -> Dict[str, Any]:
+        """Parse the whole document and return an introspection-style schema"""
+        while self.tokens[self.index][0] != "eof":
+            self._parse_definition()
+
+        for scalar in BUILTIN_SCALARS:
+            self.types.setdefault(
+                scalar, {"kind": "SCALAR", "name": scalar, "description": None}
+            )
+
+        # Named type references only learn their kind once every type is known
+        for ref in self.named_refs:
+            type_def = self.types.get(ref["name"])
+            ref["kind"] = type_def["kind"] if type_def else "SCALAR"
+
+        def root(operation: str, default: str) -> Optional[Dict[str, str]]:
+            name = self.root_types.get(operation)
+            if name is None and default in self.types:
+                name = default
+            return {"name": name} if name else None
+
+        return {
+            "queryType": root("query", "Query"),
+            "mutationType": root("mutation", "Mutation"),
+            "subscriptionType": root("subscription", "Subscription"),
+            "types": list(self.types.values()),
+            "directives": self.directives,
+        }
+
+    # Token helpers
+
+    def _error(self, message: str) -> ValueError:
+        offset = self.tokens[self.index][2]
+        return ValueError(f"{message} at {_location(self.text, offset)}")
+
+    def _peek_is(self, kind: str, value: Any = None) -> bool:
+        token = self.tokens[self.index]
+        return token[0] == kind and (value is None or token[1] == value)
+
+    def _skip(self, kind: str, value: Any = None) -> bool:
+        if self._peek_is(kind, value):
+            self.index += 1
+            return True
+        return False
+
+    def _expect(self, kind: str, value: Any = None) -> Any:
+        token = self.tokens[self.index]
+        if token[0] != kind or (value is not None and token[1] != value):
+            expected = value if value is not None else kind
+            found = token[1] if token[0] != "eof" else "end of document"
+            raise self._error(f"Expected {expected!r} but found {found!r}")
+        self.index += 1
+        return token[1]
+
+    def _parse_description(self) -> Optional[str]:
+        if self._peek_is("string"):
+            self.index += 1
+            return self.tokens[self.index - 1][1]
+        return None
+
+    # Definitions
+
+    def _parse_definition(self):
+        description = self._parse_description()
+        is_extension = self._skip("name", "extend")
+        keyword = self._expect("name")
+
+        if keyword == "schema":
+            self._parse_schema_definition()
+        elif keyword == "scalar":
+            name = self._expect("name")
+            self._parse_directives()
+            self._merge_type(
+                {"kind": "SCALAR", "name": name, "description": description},
+                is_extension,
+            )
+        elif keyword in ("type", "interface"):
+            self._parse_object_definition(keyword, description, is_extension)
+        elif keyword == "union":
+            self._parse_union_definition(description, is_extension)
+        elif keyword == "enum":
+            self._parse_enum_definition(description, is_extension)
+        elif keyword == "input":
+            name = self._expect("name")
+            directives = self._parse_directives()
+            input_fields = []
+            if self._skip("punct", "{"):
+                while not self._skip("punct", "}"):
+                    input_fields.append(self._parse_input_value())
+            self._merge_type(
+                {
+                    "kind": "INPUT_OBJECT",
+                    "name": name,
+                    "description": description,
+                    "inputFields": input_fields,
+                    "appliedDirectives": directives,
+                },
+                is_extension,
+            )
+        elif keyword == "directive" and not is_extension:
+            self._parse_directive_definition(description)
+        else:
+            self.index -= 1
+            raise self._error(f"Unexpected definition {keyword!r}")
+
+    def _parse_schema_definition(self):
+        self._parse_directives()
+        self._expect("punct", "{")
+        while not self._skip("punct", "}"):
+            operation = self._expect("name")
+            self._expect("punct", ":")
+            self.root_types[operation] = self._expect("name")
+
+    def _parse_object_definition(
+        self, keyword: str, description: Optional[str], is_extension: bool
+    ):
+        name = self._expect("name")
+
+        interfaces = []
+        if self._skip("name", "implements"):
+            self._skip("punct", "&")
+            interfaces.append(self._named_ref(self._expect("name")))
+            # Legacy SDL separates interfaces with whitespace instead of "&"
+            while self._skip("punct", "&") or (
+                self._peek_is("name")
+                and self.tokens[self.index][1] not in _DEFINITION_KEYWORDS
+            ):
+                interfaces.append(self._named_ref(self._expect("name")))
+
+        directives = self._parse_directives()
+
+        fields = []
+        if self._skip("punct", "{"):
+            while not self._skip("punct", "}"):
+                fields.append(self._parse_field())
+
+        self._merge_type(
+            {
+                "kind": "OBJECT" if keyword == "type" else "INTERFACE",
+                "name": name,
+                "description": description,
+                "fields": fields,
+                "interfaces": interfaces,
+                "appliedDirectives": directives,
+            },
+            is_extension,
+        )
+
+    def _parse_union_definition(self, description: Optional[str], is_extension: bool):
+        name = self._expect("name")
+        directives = self._parse_directives()
+
+        possible_types = []
+        if self._skip("punct", "="):
+            self._skip("punct", "|")
+            possible_types.append(self._named_ref(self._expect("name")))
+            while self._skip("punct", "|"):
+                possible_types.append(self._named_ref(self._expect("name")))
+
+        self._merge_type(
+            {
+                "kind": "UNION",
+                "name": name,
+                "description": description,
+                "possibleTypes": possible_types,
+                "appliedDirectives": directives,
+            },
+            is_extension,
+        )
+
+    def _parse_enum_definition(self, description: Optional[str], is_extension: bool):
+        name = self._expect("name")
+        directives = self._parse_directives()
+
+        enum_values = []
+        if self._skip("punct", "{"):
+            while not self._skip("punct", "}"):
+                value_description = self._parse_description()
+                value_name = self._expect("name")
+                value_directives = self._parse_directives()
+                enum_values.append(
+                    {
+                        "name": value_name,
+                        "description": value_description,
+                        "isDeprecated": any(
+                            d["name"] == "deprecated" for d in value_directives
+                        ),
+                    }
+                )
+
+        self._merge_type(
+            {
+                "kind": "ENUM",
+                "name": name,
+                "description": description,
+                "enumValues": enum_values,
+                "appliedDirectives": directives,
+            },
+            is_extension,
+        )
+
+    def _parse_directive_definition(self, description: Optional[str]):
+        self._expect("punct", "@")
+        name = self._expect("name")
+        args = self._parse_argument_definitions()
+        is_repeatable = self._skip("name", "repeatable")
+        self._expect("name", "on")
+
+        self._skip("punct", "|")
+        locations = [self._expect("name")]
+        while self._skip("punct", "|"):
+            locations.append(self._expect("name"))
+
+        self.directives.append(
+            {
+                "name": name,
+                "description": description,
+                "args": args,
+                "locations": locations,
+                "isRepeatable": is_repeatable,
+            }
+        )
+
+    # Fields, arguments and types
+
+    def _parse_field(self) -> Dict[str, Any]:
+        description = self._parse_description()
+        name = self._expect("name")
+        args = self._parse_argument_definitions()
+        self._expect("punct", ":")
+        field_type = self._parse_type()
+        directives = self._parse_directives()
+        return {
+            "name": name,
+            "description": description,
+            "args": args,
+            "type": field_type,
+            "isDeprecated": any(d["name"] == "deprecated" for d in directives),
+            "appliedDirectives": directives,
+        }
+
+    def _parse_argument_definitions(self) -> List[Dict[str, Any]]:
+        args = []
+        if self._skip("punct", "("):
+            while not self._skip("punct", ")"):
+                args.append(self._parse_input_value())
+        return args
+
+    def _parse_input_value(self) -> Dict[str, Any]:
+        description = self._parse_description()
+        name = self._expect("name")
+        self._expect("punct", ":")
+        value_type = self._parse_type()
+
+        default_value = None
+        if self._skip("punct", "="):
+            start = self.tokens[self.index][2]
+            self._parse_value()
+            end = self.tokens[self.index][2]
+            default_value = self.text[start:end].strip().rstrip(",").strip()
+
+        self._parse_directives()
+        return {
+            "name": name,
+            "description": description,
+            "type": value_type,
+            "defaultValue": default_value,
+        }
+
+    def _parse_type(self) -> Dict[str, Any]:
+        if self._skip("punct", "["):
+            type_ref = {"kind": "LIST", "name": None, "ofType": self._parse_type()}
+            self._expect("punct", "]")
+        else:
+            type_ref = self._named_ref(self._expect("name"))
+
+        if self._skip("punct", "!"):
+            type_ref = {"kind": "NON_NULL", "name": None, "ofType": type_ref}
+        return type_ref
+
+    def _named_ref(self, name: str) -> Dict[str, Any]:
+        type_ref = {"kind": None, "name": name, "ofType": None}
+        self.named_refs.append(type_ref)
+        return type_ref
+
+    # Directives and values
+
+    def _parse_directives(self) -> List[Dict[str, Any]]:
+        directives = []
+        while self._skip("punct", "@"):
+            name = self._expect("name")
+            arguments = {}
+            if self._skip("punct", "("):
+                while not self._skip("punct", ")"):
+                    arg_name = self._expect("name")
+                    self._expect("punct", ":")
+                    arguments[arg_name] = self._parse_value()
+            directives.append({"name": name, "arguments": arguments})
+        return directives
+
+    def _parse_value(self) -> Any:
+        kind, value, _ = self.tokens[self.index]
+
+        if kind in ("string", "number"):
+            self.index += 1
+            return value
+
+        if kind == "name":
+            self.index += 1
+            return {"true": True, "false": False, "null": None}.get(value, value)
+
+        if self._skip("punct", "$"):
+            return "$" + self._expect("name")
+
+        if self._skip("punct", "["):
+            items = []
+            while not self._skip("punct", "]"):
+                items.append(self._parse_value())
+            return items
+
+        if self._skip("punct", "{"):
+            fields = {}
+            while not self._skip("punct", "}"):
+                field_name = self._expect("name")
+                self._expect("punct", ":")
+                fields[field_name] = self._parse_value()
+            return fields
+
+        raise self._error(f"Unexpected value {value!r}")
+
+    def _merge_type(self, type_def: Dict[str, Any], is_extension: bool):
+        """Add a type definition, merging it with earlier definitions or extensions"""
+        existing = self.types.get(type_def["name"])
+        if existing is None:
+            self.types[type_def["name"]] = type_def
+            return
+
+        if existing["kind"] != type_def["kind"]:
+            raise self._error(
+                f"Type {type_def['name']!r} redefined as {type_def['kind']} "
+                f"(was {existing['kind']})"
+            )
+
+        if not is_extension and type_def.get("description"):
+            existing["description"] = type_def["description"]
+
+        for key in (
+            "fields",
+            "inputFields",
+            "enumValues",
+            "interfaces",
+            "possibleTypes",
+            "appliedDirectives",
+        ):
+            if key in type_def:
+                existing.setdefault(key, []).extend(type_def[key])
+
+
+def parse_sdl(text: str) -> Dict[str, Any]:
+    """Parse GraphQL SDL into an introspection-style ``__schema`` dictionary"""
+    # Parsing allocates millions of small acyclic containers on large schemas;
+    # pausing the cycle collector avoids repeatedly rescanning them
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return SDLParser(text).parse()
+    finally:
+        if gc_was_enabled:
+            gc.enable()
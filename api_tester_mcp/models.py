@@ -1,7 +1,7 @@
 """Configuration and data models for the API Tester MCP server"""
 
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from pydantic import BaseModel, Field
 
@@ -58,6 +58,8 @@ class ApiEndpoint(BaseModel):
     responses: Dict[str, Dict[str, Any]] = Field(default_factory=dict)
     tags: List[str] = Field(default_factory=list)
     auth_required: bool = False
+    operation_id: Optional[str] = None
+    service: Optional[str] = None  # Source service of multi-file ingests
 
 
 class TestScenario(BaseModel):
@@ -67,6 +69,7 @@ class TestScenario(BaseModel):
     name: str
     objective: str
     endpoint: ApiEndpoint
+    kind: Optional[str] = None  # positive, unauthorized, invalid_method, ...
     steps: List[str]
     expected_outcome: str
     pass_criteria: List[str]
@@ -84,10 +87,11 @@ class TestCase(BaseModel):
     method: str
     url: str
     headers: Dict[str, str] = Field(default_factory=dict)
-    body: Optional[Union[str, Dict[str, Any]]] = None
+    body: Optional[Union[str, Dict[str, Any], List[Any]]] = None
     expected_status: int = 200
     assertions: List[Dict[str, Any]] = Field(default_factory=list)
     timeout: int = 30
+    payload_size: Optional[int] = None  # Body streamed to this size in bytes
     language: TestLanguage = TestLanguage.PYTHON
     framework: TestFramework = TestFramework.REQUESTS
     generated_code: Optional[str] = (
@@ -105,6 +109,8 @@ class TestResult(BaseModel):
     response_body: Optional[str] = None
     response_headers: Optional[Dict[str, str]] = None
     error_message: Optional[str] = None
+    request_bytes: Optional[int] = None  # Body bytes sent by streamed uploads
+    upload_throughput: Optional[float] = None  # Bytes per second
     assertions_passed: int = 0
     assertions_failed: int = 0
     assertion_details: List[Dict[str, Any]] = Field(default_factory=list)
@@ -116,9 +122,26 @@ class TestSession(BaseModel):
     id: str
     spec_type: SpecType
     spec_content: Dict[str, Any]
-    scenarios: List[TestScenario] = Field(default_factory=list)
-    test_cases: List[TestCase] = Field(default_factory=list)
+    spec_file_path: Optional[str] = None
+    spec_streamed: bool = False  # Paths are re-read from spec_file_path on demand
+    # Per-file summaries when a directory or glob of specifications was ingested
+    spec_sources: List[Dict[str, Any]] = Field(default_factory=list)
+    # Environment variable analysis computed at ingest time
+    env_analysis: Optional[Dict[str, Any]] = None
+    # Compact ScenarioRecord / TestCaseRecord entries (see records.py); use
+    # their to_model() methods when a full pydantic model is needed
+    scenarios: List[Any] = Field(default_factory=list)
+    test_cases: List[Any] = Field(default_factory=list)
     env_vars: Dict[str, str] = Field(default_factory=dict)
+    # Seed of the generated test data; each test case derives its own from it
+    seed: Optional[int] = None
+    # Options the scenarios were generated with (negative tests, edge cases,
+    # boundary and pairwise budgets, payload sizes)
+    scenario_context: Optional[Tuple[Any, ...]] = None
+    # Test code files written by the last generate_test_cases, one per shard
+    # and part, and the number of shards the suite was split into
+    code_files: List[str] = Field(default_factory=list)
+    shard_count: Optional[int] = None
     status: StatusType = StatusType.PENDING
     created_at: str
     completed_at: Optional[str] = None
@@ -0,0 +1,317 @@
+"""Pairwise combinations of parameter values (IPOG covering arrays)"""
+
+import heapq
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+from .boundaries import (
+    Resolver,
+    iter_parameters,
+    matches_pattern,
+    numeric_limits,
+    sample_value,
+    schema_type,
+)
+from .models import ApiEndpoint
+
+# Pairwise scenarios generated per endpoint unless configured otherwise
+DEFAULT_PAIRWISE_BUDGET = 25
+
+# Enum values beyond this many are left out of a parameter's domain
+MAX_DOMAIN_VALUES = 8
+
+# Stands for "parameter not sent" in the domain of an optional parameter
+OMITTED = object()
+
+_LOCATION_KEYS = {"path": "path_params", "query": "query", "header": "headers"}
+
+
+class ParameterDomain(NamedTuple):
+    """Values a parameter takes in pairwise combinations"""
+
+    location: str  # query, path or header
+    name: str
+    values: Tuple[Any, ...]  # OMITTED when an optional parameter is left out
+
+
+def _domain_values(schema: Any, resolve: Resolver) -> List[Any]:
+    """Distinct valid values that exercise different behaviour of a parameter"""
+    schema = resolve(schema)
+    if not isinstance(schema, dict):
+        return []
+    if schema.get("enum"):
+        return list(schema["enum"][:MAX_DOMAIN_VALUES])
+
+    type_name = schema_type(schema)
+    if type_name == "boolean":
+        return [True, False]
+    if type_name == "array":
+        items = resolve(schema.get("items", {}))
+        if isinstance(items, dict) and items.get("enum"):
+            return [[value] for value in items["enum"][:MAX_DOMAIN_VALUES]]
+
+    value = sample_value(schema, resolve)
+    pattern = schema.get("pattern")
+    if type_name == "string" and isinstance(pattern, str):
+        # A value the server would reject does not belong in a valid request
+        if not isinstance(value, str) or not matches_pattern(pattern, value):
+            return []
+
+    values = [value]
+    if type_name in ("integer", "number"):
+        integer = type_name == "integer"
+        low, high = numeric_limits(schema, 1 if integer else 0.01)
+        values.extend(value for value in (low, high) if value is not None)
+        if integer:
+            values = [int(value) for value in values]
+
+    distinct = []
+    for value in values:
+        if value is not None and value not in distinct:
+            distinct.append(value)
+    return distinct
+
+
+def parameter_domains(
+    endpoint: ApiEndpoint, resolve: Resolver
+) -> List[ParameterDomain]:
+    """
+    Value domains of the query, path and header parameters of an endpoint.
+
+    Enums contribute their values, booleans both values, numbers their sample
+    and limits, and optional parameters may also be omitted. A required
+    parameter without a valid value (e.g. a pattern no match could be
+    generated for) gets an empty domain.
+    """
+    domains = []
+    for location, name, schema, required in iter_parameters(endpoint, resolve):
+        values = _domain_values(schema, resolve)
+        if not required:
+            values.append(OMITTED)
+        if values or required:
+            domains.append(ParameterDomain(location, name, tuple(values)))
+    return domains
+
+
+def covering_array(sizes: Sequence[int]) -> List[List[int]]:
+    """
+    Rows of value indexes that cover every pair of values of any two columns.
+
+    Implements IPOG: the first two columns (taken largest domain first) start
+    as their full cross product, then each further column is added by choosing
+    for every row the value that covers the most uncovered pairs (horizontal
+    growth), and pairs still uncovered are placed in rows with a free slot or
+    in new rows (vertical growth). Rows whose pairs all appear in other rows
+    are dropped at the end. The result is close to minimal and takes
+    polynomial time, so 30+ columns finish in milliseconds.
+    """
+    if not sizes or min(sizes) < 1:
+        return []
+    if len(sizes) == 1:
+        return [[value] for value in range(sizes[0])]
+
+    order = sorted(range(len(sizes)), key=lambda column: -sizes[column])
+    ordered = [sizes[column] for column in order]
+
+    rows: List[List[Optional[int]]] = [
+        [a, b] for a in range(ordered[0]) for b in range(ordered[1])
+    ]
+    for k in range(2, len(ordered)):
+        size = ordered[k]
+        uncovered: List[Set[Tuple[int, int]]] = [
+            {(a, b) for a in range(ordered[j]) for b in range(size)} for j in range(k)
+        ]
+
+        # Horizontal growth: extend each row with its most useful value, and
+        # give its free slots the values that make that value most useful
+        for row in rows:
+            best_value, best_gain, best_fills = 0, -1, {}
+            for value in range(size):
+                gain, fills = 0, {}
+                for j in range(k):
+                    if row[j] is not None:
+                        if (row[j], value) in uncovered[j]:
+                            gain += 1
+                    else:
+                        fill = next((a for a, b in uncovered[j] if b == value), None)
+                        if fill is not None:
+                            fills[j] = fill
+                            gain += 1
+                if gain > best_gain:
+                    best_value, best_gain, best_fills = value, gain, fills
+            for j, fill in best_fills.items():
+                row[j] = fill
+            row.append(best_value)
+            for j in range(k):
+                if row[j] is not None:
+                    uncovered[j].discard((row[j], best_value))
+
+        # Vertical growth: fill free slots, or add rows for the pairs left
+        for j in range(k):
+            for a, b in sorted(uncovered[j]):
+                for row in rows:
+                    if row[k] == b and row[j] is None:
+                        row[j] = a
+                        break
+                else:
+                    row = [None] * (k + 1)
+                    row[j], row[k] = a, b
+                    rows.append(row)
+
+    # Free slots take any value; spreading them varies the requests more
+    filled_rows = [
+        [
+            value if value is not None else index % ordered[column]
+            for column, value in enumerate(row)
+        ]
+        for index, row in enumerate(rows)
+    ]
+    filled_rows = _drop_redundant_rows(filled_rows)
+
+    result = []
+    for filled in filled_rows:
+        original = [0] * len(sizes)
+        for position, column in enumerate(order):
+            original[column] = filled[position]
+        result.append(original)
+    return result
+
+
+def _drop_redundant_rows(rows: List[List[int]]) -> List[List[int]]:
+    """Remove rows whose pairs are all covered by other rows, latest first"""
+    columns = range(len(rows[0])) if rows else range(0)
+    counts: Dict[Tuple[int, int, int, int], int] = {}
+    for row in rows:
+        for i in columns:
+            for j in range(i + 1, len(row)):
+                key = (i, row[i], j, row[j])
+                counts[key] = counts.get(key, 0) + 1
+
+    kept = []
+    for row in reversed(rows):
+        pairs = [
+            (i, row[i], j, row[j]) for i in columns for j in range(i + 1, len(row))
+        ]
+        if all(counts[pair] > 1 for pair in pairs):
+            for pair in pairs:
+                counts[pair] -= 1
+        else:
+            kept.append(row)
+    kept.reverse()
+    return kept
+
+
+def _row_pairs(row: Sequence[int]) -> Set[Tuple[int, int, int, int]]:
+    """(column, value, column, value) pairs of a row"""
+    return {
+        (i, row[i], j, row[j]) for i in range(len(row)) for j in range(i + 1, len(row))
+    }
+
+
+def select_rows(rows: List[List[int]], budget: int) -> List[List[int]]:
+    """
+    At most budget rows, picked greedily by the pairs they add to those
+    already picked, so a truncated covering array keeps as many pairs as it
+    can. Gains only shrink as rows are picked, so stale heap entries are
+    re-scored lazily instead of re-scoring every row each round.
+    """
+    if len(rows) <= budget:
+        return rows
+
+    row_pairs = [_row_pairs(row) for row in rows]
+    heap = [(-len(pairs), index) for index, pairs in enumerate(row_pairs)]
+    heapq.heapify(heap)
+    covered: Set[Tuple[int, int, int, int]] = set()
+    selected: List[List[int]] = []
+    while heap and len(selected) < budget:
+        negative_gain, index = heapq.heappop(heap)
+        gain = len(row_pairs[index] - covered)
+        if gain < -negative_gain:
+            heapq.heappush(heap, (-gain, index))
+            continue
+        selected.append(rows[index])
+        covered |= row_pairs[index]
+    return selected
+
+
+class PairwiseCoverage(NamedTuple):
+    """Value pairs of an endpoint's varying parameters its combinations cover"""
+
+    covered: int
+    total: int
+
+
+def pair_coverage(sizes: Sequence[int], rows: List[List[int]]) -> PairwiseCoverage:
+    """Distinct value pairs of rows against all pairs of columns of these sizes"""
+    total = sum(
+        sizes[i] * sizes[j] for i in range(len(sizes)) for j in range(i + 1, len(sizes))
+    )
+    covered: Set[Tuple[int, int, int, int]] = set()
+    for row in rows:
+        covered |= _row_pairs(row)
+    return PairwiseCoverage(len(covered), total)
+
+
+def coverage_summary(
+    coverages: Sequence[Tuple[str, PairwiseCoverage]],
+) -> Dict[str, Any]:
+    """Pairs covered over all endpoints, and the endpoints the budget truncated"""
+    covered = sum(coverage.covered for _, coverage in coverages)
+    total = sum(coverage.total for _, coverage in coverages)
+    return {
+        "pairs_covered": covered,
+        "pairs_total": total,
+        "ratio": round(covered / total, 4) if total else 1.0,
+        "truncated_endpoints": [
+            {
+                "endpoint": endpoint,
+                "pairs_covered": coverage.covered,
+                "pairs_total": coverage.total,
+            }
+            for endpoint, coverage in coverages
+            if coverage.covered < coverage.total
+        ],
+    }
+
+
+def pairwise_inputs(
+    endpoint: ApiEndpoint,
+    budget: int = DEFAULT_PAIRWISE_BUDGET,
+    resolve: Resolver = lambda obj: obj,
+) -> Tuple[List[Dict[str, Any]], Optional[PairwiseCoverage]]:
+    """
+    Test data of the pairwise combinations of an endpoint's parameters, and
+    the value pairs they cover (None when the endpoint gets no combinations).
+
+    Parameters with a single value are sent with it in every combination.
+    Endpoints with fewer than two varying parameters get no combinations, as
+    their positive scenario already covers them, and neither do endpoints
+    with a required parameter that has no valid value. When the covering
+    array has more rows than the budget, the rows adding the most uncovered
+    pairs are kept.
+    """
+    if budget <= 0:
+        return [], None
+
+    domains = parameter_domains(endpoint, resolve)
+    if any(not domain.values for domain in domains):
+        return [], None
+    varying = [domain for domain in domains if len(domain.values) > 1]
+    if len(varying) < 2:
+        return [], None
+
+    sizes = [len(domain.values) for domain in varying]
+    rows = select_rows(covering_array(sizes), budget)
+    fixed = [domain for domain in domains if len(domain.values) == 1]
+
+    inputs = []
+    for row in rows:
+        test_data: Dict[str, Any] = {"path_params": {}, "query": {}, "headers": {}}
+        chosen = [(domain, domain.values[0]) for domain in fixed]
+        chosen.extend(
+            (domain, domain.values[value]) for domain, value in zip(varying, row)
+        )
+        for domain, value in chosen:
+            if value is not OMITTED:
+                test_data[_LOCATION_KEYS[domain.location]][domain.name] = value
+        inputs.append(test_data)
+    return inputs, pair_coverage(sizes, rows)
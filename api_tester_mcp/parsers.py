@@ -1,13 +1,144 @@
 """Specification parsers for OpenAPI/Swagger and Postman collections"""
 
 import json
+import os
 import re
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Union
 
 import yaml
 
+from .boundaries import DEFAULT_BOUNDARY_BUDGET, boundary_inputs, describe_value
+from .graphql_sdl import parse_sdl
 from .models import ApiEndpoint, SpecType, TestScenario
-from .utils import generate_id, logger
+from .pairwise import DEFAULT_PAIRWISE_BUDGET, PairwiseCoverage, pairwise_inputs
+from .payloads import DEFAULT_PAYLOAD_SIZES, format_size, payload_timeout
+from .streaming import iter_json_members, read_json_skeleton
+from .utils import (
+    endpoint_signature,
+    generate_stable_id,
+    logger,
+    read_spec_prefix,
+    sniff_spec_type,
+)
+
+HTTP_METHODS = ["get", "post", "put", "delete", "patch", "head", "options"]
+
+# JSON specifications at least this large are streamed path by path
+STREAMING_THRESHOLD_BYTES = 64 * 1024 * 1024
+
+
+# Postman {{variable}} references
+_POSTMAN_VARIABLE = re.compile(r"\{\{([^}]+)\}\}")
+
+# OpenAPI {parameter} path templates
+_PATH_TEMPLATE = re.compile(r"\{([^}]+)\}")
+
+
+class OpenApiScan:
+    """
+    Server variables, path template variables and whether any operation
+    declares its own security, collected while the parser walks the paths.
+    """
+
+    __slots__ = ("server_vars", "path_vars", "operation_security")
+
+    def __init__(self):
+        # Variable name -> (server URL, default value)
+        self.server_vars: Dict[str, tuple] = {}
+        # Variable name -> first path it appears in
+        self.path_vars: Dict[str, str] = {}
+        self.operation_security = False
+
+    def add_servers(self, servers: Any):
+        for server in servers if isinstance(servers, list) else ():
+            if not isinstance(server, dict):
+                continue
+            for name, variable in (server.get("variables") or {}).items():
+                default = (
+                    variable.get("default") if isinstance(variable, dict) else None
+                )
+                self.server_vars.setdefault(name, (server.get("url", ""), default))
+
+    def add_path(self, path: str):
+        if "{" in path:
+            for var in _PATH_TEMPLATE.findall(path):
+                self.path_vars.setdefault(var, path)
+
+    def add_operation(self, operation: Dict[str, Any]):
+        if not self.operation_security and operation.get("security"):
+            self.operation_security = True
+
+
+def scan_openapi_document(spec_data: Dict[str, Any]) -> OpenApiScan:
+    """Scan an already parsed OpenAPI/Swagger document"""
+    scan = OpenApiScan()
+    scan.add_servers(spec_data.get("servers"))
+    for path, path_obj in spec_data.get("paths", {}).items():
+        scan.add_path(path)
+        for method, operation in path_obj.items():
+            if method.lower() in HTTP_METHODS:
+                scan.add_operation(operation)
+    return scan
+
+
+class PostmanScan:
+    """
+    Flattened Postman items together with the template variables and
+    request-level auth types the environment analysis needs.
+    """
+
+    __slots__ = ("items", "template_vars", "auth_types")
+
+    def __init__(self):
+        self.items: List[Dict[str, Any]] = []
+        # Dicts keep first-seen order, unlike sets
+        self.template_vars: Dict[str, None] = {}
+        self.auth_types: Dict[str, None] = {}
+
+    def _collect(self, request: Dict[str, Any]):
+        request_auth = request.get("auth")
+        if request_auth:
+            self.auth_types[request_auth.get("type", "").lower()] = None
+
+        texts = []
+        url = request.get("url", {})
+        if isinstance(url, str):
+            texts.append(url)
+        elif isinstance(url, dict):
+            texts.append(url.get("raw", ""))
+            texts.extend(param.get("value") or "" for param in url.get("query", []))
+        texts.extend(header.get("value") or "" for header in request.get("header", []))
+        body = request.get("body", {})
+        if isinstance(body, dict):
+            texts.append(body.get("raw") or "")
+
+        for text in texts:
+            if "{{" in text:
+                self.template_vars.update(
+                    dict.fromkeys(_POSTMAN_VARIABLE.findall(text))
+                )
+
+
+def scan_postman_items(items: List[Dict[str, Any]]) -> PostmanScan:
+    """
+    Flatten nested Postman folders in one iterative pass, keeping request order,
+    and collect the data for the environment analysis along the way.
+    """
+    scan = PostmanScan()
+    stack = [iter(items)]
+    while stack:
+        for item in stack[-1]:
+            if "item" in item:
+                # Folder: continue with its children, then with its siblings
+                stack.append(iter(item["item"]))
+                break
+            scan.items.append(item)
+            request = item.get("request")
+            if isinstance(request, dict):
+                scan._collect(request)
+        else:
+            stack.pop()
+    return scan
 
 
 class SpecificationParser:
@@ -18,6 +149,8 @@ class SpecificationParser:
         self.spec_data = {}
         self.base_url = ""
         self.endpoints = []
+        # Environment analysis data collected during parsing
+        self.scan: Optional[Union[OpenApiScan, PostmanScan]] = None
 
     def parse(self, content: str, spec_type: SpecType) -> List[ApiEndpoint]:
         """Parse specification content and return endpoints"""
@@ -27,7 +160,18 @@ class SpecificationParser:
                 self.spec_data = json.loads(content)
             except json.JSONDecodeError:
                 # Try YAML
-                self.spec_data = yaml.safe_load(content)
+                try:
+                    self.spec_data = yaml.safe_load(content)
+                except yaml.YAMLError:
+                    if spec_type != SpecType.GRAPHQL:
+                        raise
+                    self.spec_data = None
+
+                # GraphQL SDL is kept as text under the "schema" key
+                if spec_type == SpecType.GRAPHQL and not isinstance(
+                    self.spec_data, dict
+                ):
+                    self.spec_data = {"schema": content}
 
             self.spec_type = spec_type
 
@@ -44,31 +188,26 @@ class SpecificationParser:
             logger.error(f"Failed to parse specification: {str(e)}")
             raise
 
+    def analyze_env_vars(self) -> Dict[str, Any]:
+        """Environment variable analysis of the last parsed specification"""
+        return analyze_required_env_vars(
+            self.spec_data, self.spec_type, self.base_url, self.scan
+        )
+
     def _parse_openapi(self) -> List[ApiEndpoint]:
         """Parse OpenAPI/Swagger specification"""
         endpoints = []
 
-        # Extract base URL
-        if "servers" in self.spec_data and self.spec_data["servers"]:
-            self.base_url = self.spec_data["servers"][0].get("url", "")
-        elif "host" in self.spec_data:
-            scheme = self.spec_data.get("schemes", ["https"])[0]
-            base_path = self.spec_data.get("basePath", "")
-            self.base_url = f"{scheme}://{self.spec_data['host']}{base_path}"
+        self.scan = OpenApiScan()
+        self._extract_openapi_base_url()
 
         # Parse paths
         paths = self.spec_data.get("paths", {})
         for path, path_obj in paths.items():
+            self.scan.add_path(path)
             for method, operation in path_obj.items():
-                if method.lower() in [
-                    "get",
-                    "post",
-                    "put",
-                    "delete",
-                    "patch",
-                    "head",
-                    "options",
-                ]:
+                if method.lower() in HTTP_METHODS:
+                    self.scan.add_operation(operation)
                     endpoint = self._create_openapi_endpoint(
                         path, method.upper(), operation
                     )
@@ -76,6 +215,74 @@ class SpecificationParser:
 
         return endpoints
 
+    def iter_openapi_file(
+        self, file_path: str, spec_type: SpecType = SpecType.OPENAPI
+    ) -> Iterator[ApiEndpoint]:
+        """
+        Stream endpoints from a JSON OpenAPI/Swagger file one path at a time.
+
+        Everything except ``paths`` is loaded up front so servers, global security
+        and components are available for $ref resolution, while path items are
+        decoded and released one by one. Once the stream is exhausted, spec_data
+        holds a lightweight index of paths and methods in place of ``paths``,
+        and scan holds what the environment analysis needs.
+        """
+        self.spec_data = read_json_skeleton(file_path, skip_keys=("paths",))
+        if "openapi" not in self.spec_data and "swagger" not in self.spec_data:
+            raise ValueError(
+                "Streaming mode only supports JSON OpenAPI/Swagger documents"
+            )
+
+        self.spec_type = spec_type
+        self.scan = OpenApiScan()
+        self._extract_openapi_base_url()
+
+        path_index = {}
+        for path, path_obj in iter_json_members(file_path, "paths"):
+            if not isinstance(path_obj, dict):
+                continue
+
+            self.scan.add_path(path)
+            methods = path_index.setdefault(path, {})
+            for method, operation in path_obj.items():
+                if method.lower() in HTTP_METHODS:
+                    methods[method] = {}
+                    self.scan.add_operation(operation)
+                    yield self._create_openapi_endpoint(path, method.upper(), operation)
+
+        self.spec_data["paths"] = path_index
+
+    def _extract_openapi_base_url(self):
+        """Extract base URL from OpenAPI servers or Swagger host settings"""
+        if self.scan is not None:
+            self.scan.add_servers(self.spec_data.get("servers"))
+        if "servers" in self.spec_data and self.spec_data["servers"]:
+            self.base_url = self.spec_data["servers"][0].get("url", "")
+        elif "host" in self.spec_data:
+            scheme = self.spec_data.get("schemes", ["https"])[0]
+            base_path = self.spec_data.get("basePath", "")
+            self.base_url = f"{scheme}://{self.spec_data['host']}{base_path}"
+
+    def _resolve_ref(self, obj: Any, max_depth: int = 10) -> Any:
+        """Resolve a local reference such as #/components/parameters/Limit"""
+        for _ in range(max_depth):
+            if not isinstance(obj, dict) or not isinstance(obj.get("$ref"), str):
+                break
+
+            ref = obj["$ref"]
+            if not ref.startswith("#/"):
+                break
+
+            target = self.spec_data
+            for part in ref[2:].split("/"):
+                part = part.replace("~1", "/").replace("~0", "~")
+                if not isinstance(target, dict) or part not in target:
+                    return obj
+                target = target[part]
+            obj = target
+
+        return obj
+
     def _create_openapi_endpoint(
         self, path: str, method: str, operation: Dict[str, Any]
     ) -> ApiEndpoint:
@@ -83,12 +290,14 @@ class SpecificationParser:
         # Extract parameters
         parameters = []
         if "parameters" in operation:
-            parameters.extend(operation["parameters"])
+            parameters.extend(
+                self._resolve_ref(param) for param in operation["parameters"]
+            )
 
         # Extract request body
         request_body = None
         if "requestBody" in operation:
-            request_body = operation["requestBody"]
+            request_body = self._resolve_ref(operation["requestBody"])
 
         # Extract responses
         responses = operation.get("responses", {})
@@ -106,6 +315,7 @@ class SpecificationParser:
             responses=responses,
             tags=operation.get("tags", []),
             auth_required=auth_required,
+            operation_id=operation.get("operationId"),
         )
 
     def _parse_postman(self) -> List[ApiEndpoint]:
@@ -119,32 +329,16 @@ class SpecificationParser:
                 self.base_url = var.get("value", "")
                 break
 
-        # Parse items (requests)
-        items = self._flatten_postman_items(self.spec_data.get("item", []))
+        # Parse items (requests); the scan is kept for the environment analysis
+        self.scan = scan_postman_items(self.spec_data.get("item", []))
 
-        for item in items:
+        for item in self.scan.items:
             if "request" in item:
                 endpoint = self._create_postman_endpoint(item)
                 endpoints.append(endpoint)
 
         return endpoints
 
-    def _flatten_postman_items(
-        self, items: List[Dict[str, Any]]
-    ) -> List[Dict[str, Any]]:
-        """Flatten nested Postman collection items"""
-        flattened = []
-
-        for item in items:
-            if "item" in item:
-                # This is a folder, recurse
-                flattened.extend(self._flatten_postman_items(item["item"]))
-            else:
-                # This is a request
-                flattened.append(item)
-
-        return flattened
-
     def _create_postman_endpoint(self, item: Dict[str, Any]) -> ApiEndpoint:
         """Create ApiEndpoint from Postman request"""
         request = item["request"]
@@ -220,41 +414,7 @@ class SpecificationParser:
 
         try:
             schema_data = self.spec_data.get("data", {}).get("__schema", {})
-            query_type = schema_data.get("queryType", {})
-            mutation_type = schema_data.get("mutationType", {})
-            subscription_type = schema_data.get("subscriptionType", {})
-
-            # Parse types to find Query, Mutation, and Subscription fields
-            types = schema_data.get("types", [])
-            type_map = {t.get("name"): t for t in types}
-
-            # Process Query type
-            if query_type and query_type.get("name") in type_map:
-                query_fields = type_map[query_type["name"]].get("fields", [])
-                for field in query_fields:
-                    endpoint = self._create_graphql_endpoint("query", field, "Query")
-                    endpoints.append(endpoint)
-
-            # Process Mutation type
-            if mutation_type and mutation_type.get("name") in type_map:
-                mutation_fields = type_map[mutation_type["name"]].get("fields", [])
-                for field in mutation_fields:
-                    endpoint = self._create_graphql_endpoint(
-                        "mutation", field, "Mutation"
-                    )
-                    endpoints.append(endpoint)
-
-            # Process Subscription type
-            if subscription_type and subscription_type.get("name") in type_map:
-                subscription_fields = type_map[subscription_type["name"]].get(
-                    "fields", []
-                )
-                for field in subscription_fields:
-                    endpoint = self._create_graphql_endpoint(
-                        "subscription", field, "Subscription"
-                    )
-                    endpoints.append(endpoint)
-
+            endpoints = self._parse_graphql_schema_data(schema_data)
         except Exception as e:
             logger.error(f"Failed to parse GraphQL introspection: {str(e)}")
 
@@ -265,54 +425,62 @@ class SpecificationParser:
         endpoints = []
 
         try:
-            # For SDL, we need to parse the schema text
-            # This is a simplified parser for basic SDL patterns
             schema_text = (
                 self.spec_data
                 if isinstance(self.spec_data, str)
                 else str(self.spec_data.get("schema", ""))
             )
 
-            # Extract Query type fields
-            query_match = re.search(
-                r"type\s+Query\s*\{([^}]+)\}", schema_text, re.MULTILINE | re.DOTALL
-            )
-            if query_match:
-                query_fields = self._parse_sdl_fields(query_match.group(1))
-                for field in query_fields:
-                    endpoint = self._create_graphql_endpoint("query", field, "Query")
-                    endpoints.append(endpoint)
+            # The SDL parser produces the same shape as an introspection result
+            endpoints = self._parse_graphql_schema_data(parse_sdl(schema_text))
 
-            # Extract Mutation type fields
-            mutation_match = re.search(
-                r"type\s+Mutation\s*\{([^}]+)\}", schema_text, re.MULTILINE | re.DOTALL
-            )
-            if mutation_match:
-                mutation_fields = self._parse_sdl_fields(mutation_match.group(1))
-                for field in mutation_fields:
-                    endpoint = self._create_graphql_endpoint(
-                        "mutation", field, "Mutation"
-                    )
-                    endpoints.append(endpoint)
+        except Exception as e:
+            logger.error(f"Failed to parse GraphQL SDL: {str(e)}")
 
-            # Extract Subscription type fields
-            subscription_match = re.search(
-                r"type\s+Subscription\s*\{([^}]+)\}",
-                schema_text,
-                re.MULTILINE | re.DOTALL,
-            )
-            if subscription_match:
-                subscription_fields = self._parse_sdl_fields(
-                    subscription_match.group(1)
+        return endpoints
+
+    def _parse_graphql_schema_data(
+        self, schema_data: Dict[str, Any]
+    ) -> List[ApiEndpoint]:
+        """Create endpoints for the root operation fields of an introspection schema"""
+        endpoints = []
+
+        query_type = schema_data.get("queryType", {})
+        mutation_type = schema_data.get("mutationType", {})
+        subscription_type = schema_data.get("subscriptionType", {})
+
+        # Parse types to find Query, Mutation, and Subscription fields
+        types = schema_data.get("types", [])
+        type_map = {t.get("name"): t for t in types}
+
+        # Process Query type
+        if query_type and query_type.get("name") in type_map:
+            query_fields = type_map[query_type["name"]].get("fields") or []
+            for field in query_fields:
+                endpoint = self._create_graphql_endpoint(
+                    "query", field, "Query", type_map
                 )
-                for field in subscription_fields:
-                    endpoint = self._create_graphql_endpoint(
-                        "subscription", field, "Subscription"
-                    )
-                    endpoints.append(endpoint)
+                endpoints.append(endpoint)
 
-        except Exception as e:
-            logger.error(f"Failed to parse GraphQL SDL: {str(e)}")
+        # Process Mutation type
+        if mutation_type and mutation_type.get("name") in type_map:
+            mutation_fields = type_map[mutation_type["name"]].get("fields") or []
+            for field in mutation_fields:
+                endpoint = self._create_graphql_endpoint(
+                    "mutation", field, "Mutation", type_map
+                )
+                endpoints.append(endpoint)
+
+        # Process Subscription type
+        if subscription_type and subscription_type.get("name") in type_map:
+            subscription_fields = (
+                type_map[subscription_type["name"]].get("fields") or []
+            )
+            for field in subscription_fields:
+                endpoint = self._create_graphql_endpoint(
+                    "subscription", field, "Subscription", type_map
+                )
+                endpoints.append(endpoint)
 
         return endpoints
 
@@ -348,43 +516,12 @@ class SpecificationParser:
 
         return endpoints
 
-    def _parse_sdl_fields(self, fields_text: str) -> List[Dict[str, Any]]:
-        """Parse SDL field definitions from text"""
-        fields = []
-
-        # Simple regex to match field definitions
-        field_pattern = r"(\w+)\s*(\([^)]*\))?\s*:\s*([^\n]+)"
-
-        for match in re.finditer(field_pattern, fields_text):
-            field_name = match.group(1)
-            args_text = match.group(2) or ""
-            return_type = match.group(3).strip()
-
-            # Parse arguments
-            args = []
-            if args_text:
-                args_pattern = r"(\w+)\s*:\s*([^,)]+)"
-                for arg_match in re.finditer(args_pattern, args_text):
-                    args.append(
-                        {
-                            "name": arg_match.group(1),
-                            "type": {"name": arg_match.group(2).strip()},
-                        }
-                    )
-
-            fields.append(
-                {
-                    "name": field_name,
-                    "description": "",
-                    "args": args,
-                    "type": {"name": return_type},
-                }
-            )
-
-        return fields
-
     def _create_graphql_endpoint(
-        self, operation_type: str, field: Dict[str, Any], root_type: str
+        self,
+        operation_type: str,
+        field: Dict[str, Any],
+        root_type: str,
+        type_map: Optional[Dict[str, Dict[str, Any]]] = None,
     ) -> ApiEndpoint:
         """Create ApiEndpoint from GraphQL field"""
 
@@ -400,22 +537,45 @@ class SpecificationParser:
 
         # Convert GraphQL arguments to parameters
         parameters = []
+        variable_properties = {}
+        required_variables = []
         for arg in field_args:
             arg_name = arg.get("name", "")
             arg_type = arg.get("type", {})
             is_required = self._is_graphql_type_non_null(arg_type)
 
-            parameters.append(
-                {
-                    "name": arg_name,
-                    "in": "body",  # GraphQL args are in the request body
-                    "required": is_required,
-                    "type": self._convert_graphql_type(arg_type),
-                    "description": arg.get(
-                        "description", f"GraphQL argument for {field_name}"
-                    ),
-                }
+            parameter = {
+                "name": arg_name,
+                "in": "body",  # GraphQL args are in the request body
+                "required": is_required,
+                "type": self._convert_graphql_type(arg_type),
+                "description": arg.get("description")
+                or f"GraphQL argument for {field_name}",
+            }
+
+            # With the full type map, input objects and enums become real schemas
+            if type_map is not None:
+                parameter["schema"] = self._graphql_type_to_schema(arg_type, type_map)
+                variable_properties[arg_name] = parameter["schema"]
+                if is_required:
+                    required_variables.append(arg_name)
+
+            parameters.append(parameter)
+
+        query_schema = {
+            "type": "string",
+            "description": f"GraphQL {operation_type} string",
+        }
+        variables_schema = {
+            "type": "object",
+            "description": "Variables for the GraphQL operation",
+        }
+        if type_map is not None:
+            query_schema["example"] = self._build_graphql_operation(
+                operation_type, field, type_map
             )
+            variables_schema["properties"] = variable_properties
+            variables_schema["required"] = required_variables
 
         # Create request body structure for GraphQL
         request_body = {
@@ -425,14 +585,8 @@ class SpecificationParser:
                     "schema": {
                         "type": "object",
                         "properties": {
-                            "query": {
-                                "type": "string",
-                                "description": f"GraphQL {operation_type} string",
-                            },
-                            "variables": {
-                                "type": "object",
-                                "description": "Variables for the GraphQL operation",
-                            },
+                            "query": query_schema,
+                            "variables": variables_schema,
                         },
                         "required": ["query"],
                     }
@@ -475,6 +629,7 @@ class SpecificationParser:
             responses=responses,
             tags=[f"GraphQL-{root_type}"],
             auth_required=True,  # Most GraphQL APIs require authentication
+            operation_id=field_name,
         )
 
     def _is_graphql_type_non_null(self, type_obj: Dict[str, Any]) -> bool:
@@ -510,12 +665,137 @@ class SpecificationParser:
 
         return "string"
 
+    def _graphql_type_to_schema(
+        self,
+        type_obj: Dict[str, Any],
+        type_map: Dict[str, Dict[str, Any]],
+        depth: int = 0,
+    ) -> Dict[str, Any]:
+        """Convert a GraphQL input type reference into a JSON schema"""
+        if not isinstance(type_obj, dict):
+            return {"type": "string"}
+
+        kind = type_obj.get("kind")
+        if kind == "NON_NULL":
+            return self._graphql_type_to_schema(
+                type_obj.get("ofType") or {}, type_map, depth
+            )
+        if kind == "LIST":
+            return {
+                "type": "array",
+                "items": self._graphql_type_to_schema(
+                    type_obj.get("ofType") or {}, type_map, depth
+                ),
+                "minItems": 1,
+                "maxItems": 3,
+            }
+
+        type_def = type_map.get(type_obj.get("name"), {})
+        kind = type_def.get("kind", kind)
+
+        if kind == "ENUM":
+            values = [v.get("name") for v in type_def.get("enumValues") or []]
+            return {"type": "string", "enum": values} if values else {"type": "string"}
+
+        if kind == "INPUT_OBJECT":
+            # Recursive input types are cut off to keep generated payloads finite
+            if depth >= 3:
+                return {"type": "object"}
+
+            properties = {}
+            required = []
+            for input_field in type_def.get("inputFields") or []:
+                field_type = input_field.get("type", {})
+                properties[input_field.get("name")] = self._graphql_type_to_schema(
+                    field_type, type_map, depth + 1
+                )
+                if self._is_graphql_type_non_null(field_type):
+                    required.append(input_field.get("name"))
+
+            return {"type": "object", "properties": properties, "required": required}
+
+        schema = {"type": self._convert_graphql_type({**type_obj, "kind": kind})}
+        if type_obj.get("name") == "ID":
+            schema["format"] = "uuid"
+        return schema
+
+    def _graphql_type_to_sdl(self, type_obj: Dict[str, Any]) -> str:
+        """Render a GraphQL type reference as it is written in a document"""
+        kind = type_obj.get("kind")
+        if kind == "NON_NULL":
+            return self._graphql_type_to_sdl(type_obj.get("ofType") or {}) + "!"
+        if kind == "LIST":
+            return "[" + self._graphql_type_to_sdl(type_obj.get("ofType") or {}) + "]"
+        return type_obj.get("name") or "String"
+
+    def _build_graphql_operation(
+        self,
+        operation_type: str,
+        field: Dict[str, Any],
+        type_map: Dict[str, Dict[str, Any]],
+    ) -> str:
+        """Build an executable operation document for a root field"""
+        field_name = field.get("name", "")
+        field_args = field.get("args") or []
+
+        variable_defs = ", ".join(
+            f"${arg['name']}: {self._graphql_type_to_sdl(arg.get('type') or {})}"
+            for arg in field_args
+        )
+        arguments = ", ".join(f"{arg['name']}: ${arg['name']}" for arg in field_args)
+
+        # Composite return types need a selection set; __typename is always valid
+        return_type = field.get("type") or {}
+        while return_type.get("kind") in ("NON_NULL", "LIST"):
+            return_type = return_type.get("ofType") or {}
+        return_kind = type_map.get(return_type.get("name"), {}).get(
+            "kind", return_type.get("kind")
+        )
+        selection = (
+            " { __typename }" if return_kind in ("OBJECT", "INTERFACE", "UNION") else ""
+        )
+
+        operation_name = field_name[:1].upper() + field_name[1:]
+        return (
+            f"{operation_type} {operation_name}"
+            + (f"({variable_defs})" if variable_defs else "")
+            + " { "
+            + field_name
+            + (f"({arguments})" if arguments else "")
+            + selection
+            + " }"
+        )
+
+
+def _scenario_id(
+    endpoint: ApiEndpoint, kind: str, test_data: Optional[Dict[str, Any]] = None
+) -> str:
+    """Stable scenario ID from the endpoint signature, scenario kind and inputs"""
+    return generate_stable_id("scenario", endpoint_signature(endpoint), kind, test_data)
+
 
 class ScenarioGenerator:
     """Generate test scenarios from API endpoints"""
 
-    def __init__(self):
+    def __init__(
+        self,
+        spec_data: Optional[Dict[str, Any]] = None,
+        boundary_budget: int = DEFAULT_BOUNDARY_BUDGET,
+        pairwise_budget: int = DEFAULT_PAIRWISE_BUDGET,
+        payload_sizes: Optional[List[int]] = None,
+    ):
         self.parser = SpecificationParser()
+        # References in parameter and body schemas resolve against the spec
+        if isinstance(spec_data, dict):
+            self.parser.spec_data = spec_data
+        self.boundary_budget = boundary_budget
+        self.pairwise_budget = pairwise_budget
+        self.payload_sizes = (
+            list(DEFAULT_PAYLOAD_SIZES) if payload_sizes is None else payload_sizes
+        )
+        # ("METHOD /path", value pairs covered) of each endpoint with pairwise
+        # scenarios, in generation order
+        self.pairwise_coverage: List[Tuple[str, PairwiseCoverage]] = []
 
     def generate_scenarios(self, endpoints: List[ApiEndpoint]) -> List[TestScenario]:
         """Generate test scenarios from endpoints"""
@@ -525,6 +805,7 @@ class ScenarioGenerator:
             # Generate positive test scenario
             positive_scenario = self._generate_positive_scenario(endpoint)
             scenarios.append(positive_scenario)
+            scenarios.extend(self._generate_pairwise_scenarios(endpoint))
 
             # Generate negative test scenarios
             negative_scenarios = self._generate_negative_scenarios(endpoint)
@@ -538,7 +819,7 @@ class ScenarioGenerator:
 
     def _generate_positive_scenario(self, endpoint: ApiEndpoint) -> TestScenario:
         """Generate positive test scenario"""
-        scenario_id = generate_id()
+        scenario_id = _scenario_id(endpoint, "positive")
 
         steps = [
             f"1. Send {endpoint.method} request to {endpoint.path}",
@@ -568,6 +849,7 @@ class ScenarioGenerator:
 
         return TestScenario(
             id=scenario_id,
+            kind="positive",
             name=f"Positive test for {endpoint.method} {endpoint.path}",
             objective=f"Verify that {endpoint.method} {endpoint.path} works correctly with valid input",
             endpoint=endpoint,
@@ -578,6 +860,64 @@ class ScenarioGenerator:
             assertions=assertions,
         )
 
+    def _generate_pairwise_scenarios(self, endpoint: ApiEndpoint) -> List[TestScenario]:
+        """Generate scenarios covering every pair of parameter values"""
+        inputs, coverage = pairwise_inputs(
+            endpoint, self.pairwise_budget, self.parser._resolve_ref
+        )
+        if coverage is not None:
+            label = f"{endpoint.method} {endpoint.path}"
+            self.pairwise_coverage.append((label, coverage))
+            if coverage.covered < coverage.total:
+                logger.warning(
+                    f"pairwise_budget {self.pairwise_budget} covers {coverage.covered}"
+                    f" of {coverage.total} value pairs of {label}; raise it to "
+                    "cover them all"
+                )
+
+        scenarios = []
+        for number, test_data in enumerate(inputs, start=1):
+            values = [
+                f"{name}={describe_value(value)}"
+                for key in ("path_params", "query", "headers")
+                for name, value in test_data[key].items()
+            ]
+            scenarios.append(
+                TestScenario(
+                    id=_scenario_id(endpoint, "pairwise", test_data),
+                    kind="pairwise",
+                    name=f"Pairwise test {number}/{len(inputs)} for {endpoint.method} {endpoint.path}",
+                    objective=f"Verify that {endpoint.method} {endpoint.path} works with "
+                    f"{', '.join(values) or 'no optional parameters'}",
+                    endpoint=endpoint,
+                    steps=[
+                        f"1. Send {endpoint.method} request to {endpoint.path}",
+                        "2. Set the parameters to this combination of valid values",
+                        "3. Verify response status code",
+                    ],
+                    expected_outcome="Request succeeds with valid response",
+                    pass_criteria=[
+                        "Response status code is 2xx",
+                        "Response time is under 5 seconds",
+                    ],
+                    fail_criteria=[
+                        "Response status code is 4xx or 5xx",
+                        "Response time exceeds 5 seconds",
+                    ],
+                    test_data=test_data,
+                    assertions=[
+                        {
+                            "type": "status_code",
+                            "operator": "in",
+                            "value": [200, 201, 202, 204],
+                        },
+                        {"type": "response_time", "operator": "lt", "value": 5000},
+                    ],
+                )
+            )
+
+        return scenarios
+
     def _generate_negative_scenarios(self, endpoint: ApiEndpoint) -> List[TestScenario]:
         """Generate negative test scenarios"""
         scenarios = []
@@ -585,7 +925,8 @@ class ScenarioGenerator:
         # Unauthorized access test
         if endpoint.auth_required:
             scenario = TestScenario(
-                id=generate_id(),
+                id=_scenario_id(endpoint, "unauthorized"),
+                kind="unauthorized",
                 name=f"Unauthorized access test for {endpoint.method} {endpoint.path}",
                 objective="Verify that unauthorized requests are rejected",
                 endpoint=endpoint,
@@ -604,7 +945,8 @@ class ScenarioGenerator:
         # Invalid method test
         if endpoint.method != "GET":
             scenario = TestScenario(
-                id=generate_id(),
+                id=_scenario_id(endpoint, "invalid_method"),
+                kind="invalid_method",
                 name=f"Invalid method test for {endpoint.path}",
                 objective="Verify that invalid HTTP methods are rejected",
                 endpoint=endpoint,
@@ -627,36 +969,130 @@ class ScenarioGenerator:
         """Generate edge case test scenarios"""
         scenarios = []
 
-        # Large payload test (for POST/PUT endpoints)
+        # Large payload tests (for POST/PUT/PATCH endpoints), one per size step
         if endpoint.method in ["POST", "PUT", "PATCH"] and endpoint.request_body:
-            scenario = TestScenario(
-                id=generate_id(),
-                name=f"Large payload test for {endpoint.method} {endpoint.path}",
-                objective="Verify system handles large request payloads gracefully",
-                endpoint=endpoint,
-                steps=[
-                    f"1. Send {endpoint.method} request to {endpoint.path}",
-                    "2. Include a very large request body",
-                    "3. Verify response status code and time",
-                ],
-                expected_outcome="Request is handled appropriately (accepted or rejected gracefully)",
-                pass_criteria=[
-                    "Response status code is either 2xx or 413",
-                    "Response time is reasonable",
-                ],
-                fail_criteria=["Server timeout or crash"],
-                assertions=[
-                    {"type": "status_code", "operator": "in", "value": [200, 201, 413]},
-                    {"type": "response_time", "operator": "lt", "value": 30000},
-                ],
+            for size in self.payload_sizes:
+                label = format_size(size)
+                scenario = TestScenario(
+                    id=_scenario_id(endpoint, "large_payload", {"payload_size": size}),
+                    kind="large_payload",
+                    name=f"Large payload test ({label}) for {endpoint.method} {endpoint.path}",
+                    objective=f"Verify system handles a {label} request payload gracefully",
+                    endpoint=endpoint,
+                    steps=[
+                        f"1. Send {endpoint.method} request to {endpoint.path}",
+                        f"2. Stream a {label} request body with chunked transfer encoding",
+                        "3. Record upload throughput and where the server stopped reading",
+                        "4. Verify response status code and time",
+                    ],
+                    expected_outcome="Request is handled appropriately (accepted or rejected gracefully)",
+                    pass_criteria=[
+                        "Response status code is either 2xx or 413",
+                        "Response time is reasonable",
+                    ],
+                    fail_criteria=[
+                        "Server timeout or crash",
+                        "Connection closed without a response",
+                    ],
+                    test_data={"payload_size": size},
+                    assertions=[
+                        {
+                            "type": "status_code",
+                            "operator": "in",
+                            "value": [200, 201, 202, 204, 413],
+                        },
+                        {
+                            "type": "response_time",
+                            "operator": "lt",
+                            "value": payload_timeout(size) * 1000,
+                        },
+                    ],
+                )
+                scenarios.append(scenario)
+
+        scenarios.extend(self._generate_boundary_scenarios(endpoint))
+
+        return scenarios
+
+    def _generate_boundary_scenarios(self, endpoint: ApiEndpoint) -> List[TestScenario]:
+        """Generate boundary value scenarios from parameter and body constraints"""
+        scenarios = []
+        seen = set()
+
+        inputs = boundary_inputs(
+            endpoint, self.boundary_budget, self.parser._resolve_ref
+        )
+        for case, test_data in inputs:
+            scenario_id = _scenario_id(endpoint, "boundary", test_data)
+            if scenario_id in seen:
+                continue
+            seen.add(scenario_id)
+
+            if case.valid:
+                expected_outcome = "Request succeeds with the value on the boundary"
+                pass_criteria = ["Response status code is 2xx"]
+                fail_criteria = ["Response status code is 4xx or 5xx"]
+                statuses = [200, 201, 202, 204]
+            else:
+                expected_outcome = "Request is rejected with a validation error"
+                pass_criteria = ["Response status code is 400 or 422"]
+                fail_criteria = [
+                    "Response status code is 2xx (invalid input accepted)",
+                    "Response status code is 5xx",
+                ]
+                statuses = [400, 422]
+
+            scenarios.append(
+                TestScenario(
+                    id=scenario_id,
+                    kind="boundary",
+                    name=f"Boundary test for {endpoint.method} {endpoint.path}: {case.description}",
+                    objective=f"Verify that {endpoint.method} {endpoint.path} "
+                    f"{'accepts' if case.valid else 'rejects'} {case.description}",
+                    endpoint=endpoint,
+                    steps=[
+                        f"1. Send {endpoint.method} request to {endpoint.path}",
+                        f"2. Set {case.location} field {case.description}",
+                        "3. Keep every other input valid",
+                        "4. Verify response status code",
+                    ],
+                    expected_outcome=expected_outcome,
+                    pass_criteria=pass_criteria + ["Response time is under 5 seconds"],
+                    fail_criteria=fail_criteria,
+                    test_data=test_data,
+                    assertions=[
+                        {"type": "status_code", "operator": "in", "value": statuses},
+                        {"type": "response_time", "operator": "lt", "value": 5000},
+                    ],
+                )
             )
-            scenarios.append(scenario)
 
         return scenarios
 
 
+def should_stream_spec(file_path: str) -> bool:
+    """
+    Check whether a specification file is a JSON document big enough to stream.
+
+    Documents recognized as Postman or GraphQL are never streamed; streaming
+    only understands OpenAPI/Swagger.
+    """
+    try:
+        if os.path.getsize(file_path) < STREAMING_THRESHOLD_BYTES:
+            return False
+        prefix = read_spec_prefix(file_path)
+    except OSError:
+        return False
+    if prefix.lstrip("\ufeff \t\n\r")[:1] != "{":
+        return False
+    return sniff_spec_type(prefix) in (None, "openapi")
+
+
 def analyze_required_env_vars(
-    spec_data: Dict[str, Any], spec_type: SpecType, base_url: str = ""
+    spec_data: Dict[str, Any],
+    spec_type: SpecType,
+    base_url: str = "",
+    scan: Optional[Union[OpenApiScan, PostmanScan]] = None,
 ) -> Dict[str, Any]:
     """
     Analyze API specification to determine required environment variables
@@ -665,6 +1101,8 @@ def analyze_required_env_vars(
         spec_data: Parsed specification data
         spec_type: Type of specification (OpenAPI, Swagger, Postman)
         base_url: Base URL extracted from spec
+        scan: Data collected by SpecificationParser while parsing, to avoid
+              walking the paths or the collection a second time
 
     Returns:
         Dictionary containing required and optional environment variables with descriptions
@@ -676,11 +1114,15 @@ def analyze_required_env_vars(
     try:
         if spec_type in [SpecType.OPENAPI, SpecType.SWAGGER]:
             required_vars, optional_vars, detected_auth_schemes = (
-                _analyze_openapi_env_vars(spec_data, base_url)
+                _analyze_openapi_env_vars(
+                    spec_data, base_url, scan if isinstance(scan, OpenApiScan) else None
+                )
             )
         elif spec_type == SpecType.POSTMAN:
             required_vars, optional_vars, detected_auth_schemes = (
-                _analyze_postman_env_vars(spec_data, base_url)
+                _analyze_postman_env_vars(
+                    spec_data, base_url, scan if isinstance(scan, PostmanScan) else None
+                )
             )
         elif spec_type == SpecType.GRAPHQL:
             required_vars, optional_vars, detected_auth_schemes = (
@@ -726,7 +1168,50 @@ def analyze_required_env_vars(
         }
 
 
-def _analyze_openapi_env_vars(spec_data: Dict[str, Any], base_url: str) -> tuple:
+def merge_env_analyses(analyses: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Combine the environment variable analyses of several specifications
+
+    A variable required by any specification stays required. Detected values
+    are only kept when every specification that declares the variable agrees.
+    """
+    required_vars: Dict[str, Dict[str, Any]] = {}
+    optional_vars: Dict[str, Dict[str, Any]] = {}
+    detected_auth_schemes: Set[str] = set()
+
+    for analysis in analyses:
+        detected_auth_schemes.update(analysis.get("detected_auth_schemes", []))
+        for target, key in (
+            (required_vars, "required_variables"),
+            (optional_vars, "optional_variables"),
+        ):
+            for var_name, var_info in analysis.get(key, {}).items():
+                existing = target.get(var_name)
+                if existing is None:
+                    target[var_name] = dict(var_info)
+                elif existing.get("detected_value") != var_info.get("detected_value"):
+                    existing.pop("detected_value", None)
+                    existing["description"] = (
+                        f"{var_name} (specifications declare different values)"
+                    )
+
+    for var_name in required_vars:
+        optional_vars.pop(var_name, None)
+
+    return {
+        "required_variables": required_vars,
+        "optional_variables": optional_vars,
+        "detected_auth_schemes": sorted(detected_auth_schemes),
+        "total_vars_needed": len(required_vars),
+        "analysis_summary": _generate_env_analysis_summary(
+            required_vars, optional_vars, detected_auth_schemes
+        ),
+    }
+
+
+def _analyze_openapi_env_vars(
+    spec_data: Dict[str, Any], base_url: str, scan: Optional[OpenApiScan] = None
+) -> tuple:
     """Analyze OpenAPI/Swagger specification for environment variables"""
     required_vars = {}
     optional_vars = {}
@@ -740,8 +1225,11 @@ def _analyze_openapi_env_vars(spec_data: Dict[str, Any], base_url: str) -> tuple
     if not security_schemes:
         security_schemes = spec_data.get("securityDefinitions", {})
 
+    if scan is None:
+        scan = scan_openapi_document(spec_data)
+
     # Analyze security schemes
-    auth_required = bool(global_security) or _has_endpoint_security(spec_data)
+    auth_required = bool(global_security) or scan.operation_security
 
     if auth_required:
         for scheme_name, scheme_def in security_schemes.items():
@@ -779,60 +1267,32 @@ def _analyze_openapi_env_vars(spec_data: Dict[str, Any], base_url: str) -> tuple
                     "auth_scheme": scheme_name,
                 }
 
-    # Check for path parameters that might need environment variables
-    paths = spec_data.get("paths", {})
-    for path, path_obj in paths.items():
-        # Look for templated path parameters
-        template_vars = re.findall(r"\{([^}]+)\}", path)
-        for var in template_vars:
-            if var not in optional_vars and var not in required_vars:
-                optional_vars[var] = {
-                    "description": f"Path parameter value for '{var}' in {path}",
-                    "required": False,
-                    "type": "path_parameter",
-                }
+    # Server URL variables, with their declared defaults
+    for var, (url, default) in scan.server_vars.items():
+        if var not in optional_vars and var not in required_vars:
+            optional_vars[var] = {
+                "description": f"Server variable '{var}' in {url}",
+                "required": False,
+                "type": "server_variable",
+            }
+            if default is not None:
+                optional_vars[var]["detected_value"] = default
 
-        # Check operation-specific security
-        for method, operation in path_obj.items():
-            if method.lower() in [
-                "get",
-                "post",
-                "put",
-                "delete",
-                "patch",
-                "head",
-                "options",
-            ]:
-                op_security = operation.get("security", [])
-                if op_security and not auth_required:
-                    # This endpoint has specific auth requirements
-                    for sec_req in op_security:
-                        for scheme_name in sec_req.keys():
-                            if scheme_name in security_schemes:
-                                scheme_def = security_schemes[scheme_name]
-                                scheme_type = scheme_def.get("type", "").lower()
-                                detected_auth_schemes.add(scheme_type)
-
-                                if (
-                                    scheme_type == "http"
-                                    and scheme_def.get("scheme") == "bearer"
-                                ):
-                                    optional_vars["auth_bearer"] = {
-                                        "description": f"Bearer token for {scheme_name} authentication (required for some endpoints)",
-                                        "required": False,
-                                        "auth_scheme": scheme_name,
-                                    }
-                                elif scheme_type == "apikey":
-                                    optional_vars["auth_apikey"] = {
-                                        "description": f"API key for {scheme_name} authentication (required for some endpoints)",
-                                        "required": False,
-                                        "auth_scheme": scheme_name,
-                                    }
+    # Check for path parameters that might need environment variables
+    for var, path in scan.path_vars.items():
+        if var not in optional_vars and var not in required_vars:
+            optional_vars[var] = {
+                "description": f"Path parameter value for '{var}' in {path}",
+                "required": False,
+                "type": "path_parameter",
+            }
 
     return required_vars, optional_vars, detected_auth_schemes
 
 
-def _analyze_postman_env_vars(spec_data: Dict[str, Any], base_url: str) -> tuple:
+def _analyze_postman_env_vars(
+    spec_data: Dict[str, Any], base_url: str, scan: Optional[PostmanScan] = None
+) -> tuple:
     """Analyze Postman collection for environment variables"""
     required_vars = {}
     optional_vars = {}
@@ -895,65 +1355,29 @@ def _analyze_postman_env_vars(spec_data: Dict[str, Any], base_url: str) -> tuple
                 "auth_scheme": "basic",
             }
 
-    # Check request-level auth and variables
-    items = _flatten_postman_items_for_analysis(spec_data.get("item", []))
-    template_vars = set()
-
-    for item in items:
-        if "request" in item:
-            request = item["request"]
+    # Check request-level auth and variables, reusing the parser's traversal
+    if scan is None:
+        scan = scan_postman_items(spec_data.get("item", []))
 
-            # Check request-level auth
-            request_auth = request.get("auth", {})
-            if request_auth and not collection_auth:
-                auth_type = request_auth.get("type", "").lower()
-                detected_auth_schemes.add(auth_type)
-
-                if auth_type == "bearer" and "auth_bearer" not in required_vars:
-                    optional_vars["auth_bearer"] = {
-                        "description": "Bearer token for request-level authentication",
-                        "required": False,
-                        "auth_scheme": "bearer",
-                    }
-                elif auth_type == "apikey" and "auth_apikey" not in required_vars:
-                    optional_vars["auth_apikey"] = {
-                        "description": "API key for request-level authentication",
-                        "required": False,
-                        "auth_scheme": "apikey",
-                    }
+    if not collection_auth:
+        for auth_type in scan.auth_types:
+            detected_auth_schemes.add(auth_type)
 
-            # Extract template variables from URL
-            url = request.get("url", {})
-            if isinstance(url, str):
-                url_vars = re.findall(r"\{\{([^}]+)\}\}", url)
-                template_vars.update(url_vars)
-            elif isinstance(url, dict):
-                raw_url = url.get("raw", "")
-                url_vars = re.findall(r"\{\{([^}]+)\}\}", raw_url)
-                template_vars.update(url_vars)
-
-                # Check query parameters
-                for query_param in url.get("query", []):
-                    param_value = query_param.get("value", "")
-                    query_vars = re.findall(r"\{\{([^}]+)\}\}", param_value)
-                    template_vars.update(query_vars)
-
-            # Check headers for template variables
-            for header in request.get("header", []):
-                header_value = header.get("value", "")
-                header_vars = re.findall(r"\{\{([^}]+)\}\}", header_value)
-                template_vars.update(header_vars)
-
-            # Check request body for template variables
-            body = request.get("body", {})
-            if isinstance(body, dict):
-                body_raw = body.get("raw", "")
-                if body_raw:
-                    body_vars = re.findall(r"\{\{([^}]+)\}\}", body_raw)
-                    template_vars.update(body_vars)
+            if auth_type == "bearer" and "auth_bearer" not in required_vars:
+                optional_vars["auth_bearer"] = {
+                    "description": "Bearer token for request-level authentication",
+                    "required": False,
+                    "auth_scheme": "bearer",
+                }
+            elif auth_type == "apikey" and "auth_apikey" not in required_vars:
+                optional_vars["auth_apikey"] = {
+                    "description": "API key for request-level authentication",
+                    "required": False,
+                    "auth_scheme": "apikey",
+                }
 
     # Add template variables as optional (unless they're already identified as auth)
-    for var in template_vars:
+    for var in scan.template_vars:
         if var not in required_vars and var not in optional_vars:
             if "auth" in var.lower() or "token" in var.lower() or "key" in var.lower():
                 var_type = "auth"
@@ -1062,38 +1486,6 @@ def _analyze_graphql_env_vars(spec_data: Dict[str, Any], base_url: str) -> tuple
     return required_vars, optional_vars, detected_auth_schemes
 
 
-def _flatten_postman_items_for_analysis(
-    items: List[Dict[str, Any]],
-) -> List[Dict[str, Any]]:
-    """Flatten nested Postman collection items for analysis"""
-    flattened = []
-    for item in items:
-        if "item" in item:
-            flattened.extend(_flatten_postman_items_for_analysis(item["item"]))
-        else:
-            flattened.append(item)
-    return flattened
-
-
-def _has_endpoint_security(spec_data: Dict[str, Any]) -> bool:
-    """Check if any endpoints have security requirements"""
-    paths = spec_data.get("paths", {})
-    for path_obj in paths.values():
-        for method, operation in path_obj.items():
-            if method.lower() in [
-                "get",
-                "post",
-                "put",
-                "delete",
-                "patch",
-                "head",
-                "options",
-            ]:
-                if operation.get("security"):
-                    return True
-    return False
-
-
 def _generate_env_analysis_summary(
     required_vars: Dict, optional_vars: Dict, detected_auth_schemes: Set
 ) -> str:
@@ -0,0 +1,193 @@
+"""Large request bodies streamed in chunks instead of built in memory"""
+
+import json
+import re
+import time
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Sequence, Union
+
+# Size of the pieces a large body is sent in
+PAYLOAD_CHUNK_SIZE = 64 * 1024
+
+# Large payload steps of the edge case scenarios unless configured otherwise;
+# multi-megabyte steps are opt-in through payload_sizes
+DEFAULT_PAYLOAD_SIZES = (1024, 1024 * 1024)
+
+MAX_PAYLOAD_SIZE = 1024 * 1024 * 1024
+
+# Slowest upload rate (bytes per second) a large payload test still waits for
+MIN_UPLOAD_RATE = 1024 * 1024
+
+_SIZE_UNITS = {"": 1, "B": 1, "KB": 1024, "MB": 1024**2, "GB": 1024**3}
+_SIZE = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([KMG]?B?)\s*$", re.IGNORECASE)
+
+# Bytes of filler per chunk; slicing a shared block keeps memory constant
+_FILLER = b"A" * PAYLOAD_CHUNK_SIZE
+
+
+def parse_size(value: Union[int, str]) -> int:
+    """Bytes of a size given as a number or a string such as "512KB" or "1.5 MB\" """
+    if isinstance(value, int):
+        size = value
+    else:
+        match = _SIZE.match(str(value))
+        if not match:
+            raise ValueError(
+                f"Invalid payload size '{value}', use e.g. 1024, 64KB or 100MB"
+            )
+        number, unit = match.groups()
+        size = int(float(number) * _SIZE_UNITS[unit.upper()])
+    if size < 1 or size > MAX_PAYLOAD_SIZE:
+        raise ValueError(
+            f"Payload size {value} is out of range (1 byte to {format_size(MAX_PAYLOAD_SIZE)})"
+        )
+    return size
+
+
+def parse_sizes(values: Optional[Sequence[Union[int, str]]]) -> List[int]:
+    """Distinct sizes in ascending order; the defaults when none are given"""
+    if values is None:
+        return list(DEFAULT_PAYLOAD_SIZES)
+    return sorted({parse_size(value) for value in values})
+
+
+def format_size(size: float) -> str:
+    """Human readable size: 512 B, 64 KB, 1.5 MB"""
+    for unit in ("GB", "MB", "KB"):
+        if size >= _SIZE_UNITS[unit]:
+            return f"{size / _SIZE_UNITS[unit]:.4g} {unit}"
+    return f"{size:.4g} B"
+
+
+def payload_timeout(size: int, base: int = 30) -> int:
+    """Request timeout in seconds that leaves room to upload size bytes"""
+    return base + size // MIN_UPLOAD_RATE
+
+
+class LargePayload:
+    """
+    JSON body of an exact size, produced piece by piece.
+
+    The schema-generated body is kept and its first string property (or a new
+    "padding" property) is filled up to the requested size, so the request
+    still resembles a real one. Only one chunk of filler exists in memory
+    whatever the size, and the bytes handed to the connection and the time it
+    took are recorded while the body is consumed.
+    """
+
+    def __init__(self, body: Any, size: int, chunk_size: int = PAYLOAD_CHUNK_SIZE):
+        fields = dict(body) if isinstance(body, dict) else {}
+        padded = next(
+            (name for name, value in fields.items() if isinstance(value, str)),
+            "padding",
+        )
+        fields.pop(padded, None)
+        rest = ",".join(
+            f"{json.dumps(name)}:{json.dumps(value)}" for name, value in fields.items()
+        )
+
+        self.size = size
+        self.chunk_size = min(chunk_size, PAYLOAD_CHUNK_SIZE)
+        self.prefix = "{" + json.dumps(padded) + ':"'
+        self.suffix = '"' + ("," + rest if rest else "") + "}"
+        self.padding = max(0, size - len(self.prefix) - len(self.suffix))
+        self.bytes_sent = 0
+        self.started: Optional[float] = None
+        self.finished: Optional[float] = None
+
+    @property
+    def total_size(self) -> int:
+        """Bytes of the whole body; the size unless the body alone is larger"""
+        return len(self.prefix) + self.padding + len(self.suffix)
+
+    def chunks(self) -> Iterator[bytes]:
+        """The body in pieces of at most chunk_size bytes"""
+        yield self.prefix.encode("utf-8")
+        remaining = self.padding
+        while remaining > 0:
+            piece = min(remaining, self.chunk_size)
+            yield _FILLER[:piece]
+            remaining -= piece
+        yield self.suffix.encode("utf-8")
+
+    async def stream(self) -> AsyncIterator[bytes]:
+        """The body as an async iterator, sent with chunked transfer encoding"""
+        self.started = time.perf_counter()
+        for chunk in self.chunks():
+            yield chunk
+            self.bytes_sent += len(chunk)
+        self.finished = time.perf_counter()
+
+    @property
+    def upload_seconds(self) -> Optional[float]:
+        """Time the connection took to accept the body, or until it stopped"""
+        if self.started is None:
+            return None
+        return (self.finished or time.perf_counter()) - self.started
+
+    @property
+    def throughput(self) -> Optional[float]:
+        """Bytes per second accepted by the connection"""
+        seconds = self.upload_seconds
+        if not seconds or not self.bytes_sent:
+            return None
+        return self.bytes_sent / seconds
+
+
+def payload_summary(
+    test_cases: Sequence[Any], results: Sequence[Any]
+) -> List[Dict[str, Any]]:
+    """
+    Outcome of the large payload tests per size step.
+
+    For each size: how many tests ran and passed, the response statuses,
+    the bytes the server accepted before answering or disconnecting, and
+    the upload throughput.
+    """
+    sizes = {case.id: case.payload_size for case in test_cases if case.payload_size}
+    steps: Dict[int, Dict[str, Any]] = {}
+    for result in results:
+        size = sizes.get(result.test_case_id)
+        if size is None:
+            continue
+        step = steps.setdefault(
+            size,
+            {
+                "payload_size": size,
+                "label": format_size(size),
+                "tests": 0,
+                "passed": 0,
+                "statuses": {},
+                "connection_errors": 0,
+                "min_bytes_accepted": None,
+                "throughputs": [],
+            },
+        )
+        step["tests"] += 1
+        step["passed"] += result.status == "passed"
+        if result.response_status is not None:
+            status = str(result.response_status)
+            step["statuses"][status] = step["statuses"].get(status, 0) + 1
+        else:
+            step["connection_errors"] += 1
+        if result.request_bytes is not None:
+            accepted = step["min_bytes_accepted"]
+            step["min_bytes_accepted"] = (
+                result.request_bytes
+                if accepted is None
+                else min(accepted, result.request_bytes)
+            )
+        if result.upload_throughput:
+            step["throughputs"].append(result.upload_throughput)
+
+    summary = []
+    for size in sorted(steps):
+        step = steps[size]
+        throughputs = step.pop("throughputs")
+        step["average_throughput"] = (
+            round(sum(throughputs) / len(throughputs), 1) if throughputs else None
+        )
+        step["average_throughput_label"] = (
+            f"{format_size(step['average_throughput'])}/s" if throughputs else None
+        )
+        summary.append(step)
+    return summary
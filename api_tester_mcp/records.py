@@ -0,0 +1,303 @@
+"""Compact in-memory records for scenarios and test cases"""
+
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from .models import (
+    ApiEndpoint,
+    TestCase,
+    TestFramework,
+    TestLanguage,
+    TestScenario,
+)
+
+# Distinct criteria and assertion lists are few; the cap only guards misuse
+_SHARED_LIMIT = 4096
+_shared_values: Dict[Any, Tuple[Any, ...]] = {}
+
+
+def _shared(values: Any) -> Tuple[Any, ...]:
+    """
+    Return a tuple equal to values, reusing an existing one where possible.
+
+    Criteria and assertion lists are repeated verbatim by every scenario of the
+    same kind, so equal sequences share one tuple across records.
+    """
+    value = tuple(values or ())
+    key: Any = value
+    try:
+        hash(key)
+    except TypeError:
+        # Assertion dicts are not hashable; their repr is an equivalent key
+        key = repr(value)
+    shared = _shared_values.get(key)
+    if shared is None:
+        if len(_shared_values) >= _SHARED_LIMIT:
+            _shared_values.clear()
+        shared = _shared_values[key] = value
+    return shared
+
+
+class ScenarioRecord:
+    """
+    Slotted counterpart of TestScenario.
+
+    The endpoint is referenced by its index in the session's endpoint table
+    instead of being embedded, and attribute names match TestScenario so code
+    that only reads scenarios can use records directly.
+    """
+
+    __slots__ = (
+        "id",
+        "name",
+        "objective",
+        "endpoint_index",
+        "endpoints",
+        "kind",
+        "steps",
+        "expected_outcome",
+        "pass_criteria",
+        "fail_criteria",
+        "test_data",
+        "assertions",
+    )
+
+    def __init__(
+        self,
+        id: str,
+        name: str,
+        objective: str,
+        endpoint_index: int,
+        endpoints: List[ApiEndpoint],
+        steps: Tuple[str, ...],
+        expected_outcome: str,
+        pass_criteria: Tuple[str, ...],
+        fail_criteria: Tuple[str, ...],
+        test_data: Optional[Dict[str, Any]] = None,
+        assertions: Tuple[Dict[str, Any], ...] = (),
+        kind: Optional[str] = None,
+    ):
+        self.id = id
+        self.name = name
+        self.objective = objective
+        self.endpoint_index = endpoint_index
+        self.endpoints = endpoints
+        self.kind = kind
+        self.steps = steps
+        self.expected_outcome = expected_outcome
+        self.pass_criteria = pass_criteria
+        self.fail_criteria = fail_criteria
+        self.test_data = test_data
+        self.assertions = assertions
+
+    @property
+    def endpoint(self) -> ApiEndpoint:
+        return self.endpoints[self.endpoint_index]
+
+    @classmethod
+    def from_model(
+        cls,
+        scenario: TestScenario,
+        endpoint_index: int,
+        endpoints: List[ApiEndpoint],
+    ) -> "ScenarioRecord":
+        return cls(
+            id=scenario.id,
+            name=scenario.name,
+            objective=scenario.objective,
+            endpoint_index=endpoint_index,
+            endpoints=endpoints,
+            steps=tuple(scenario.steps),
+            expected_outcome=scenario.expected_outcome,
+            pass_criteria=_shared(scenario.pass_criteria),
+            fail_criteria=_shared(scenario.fail_criteria),
+            test_data=scenario.test_data,
+            assertions=_shared(scenario.assertions),
+            kind=scenario.kind,
+        )
+
+    def relink(
+        self, endpoint_index: int, endpoints: List[ApiEndpoint]
+    ) -> "ScenarioRecord":
+        """Copy of this record referring to an endpoint of another table"""
+        return ScenarioRecord(
+            id=self.id,
+            name=self.name,
+            objective=self.objective,
+            endpoint_index=endpoint_index,
+            endpoints=endpoints,
+            steps=self.steps,
+            expected_outcome=self.expected_outcome,
+            pass_criteria=self.pass_criteria,
+            fail_criteria=self.fail_criteria,
+            test_data=self.test_data,
+            assertions=self.assertions,
+            kind=self.kind,
+        )
+
+    def to_model(self) -> TestScenario:
+        """Materialize the full pydantic model, endpoint included"""
+        return TestScenario(
+            id=self.id,
+            name=self.name,
+            objective=self.objective,
+            endpoint=self.endpoint,
+            kind=self.kind,
+            steps=list(self.steps),
+            expected_outcome=self.expected_outcome,
+            pass_criteria=list(self.pass_criteria),
+            fail_criteria=list(self.fail_criteria),
+            test_data=self.test_data,
+            assertions=list(self.assertions),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-ready form that refers to the endpoint by index"""
+        return {
+            "id": self.id,
+            "name": self.name,
+            "objective": self.objective,
+            "endpoint_index": self.endpoint_index,
+            "kind": self.kind,
+            "steps": list(self.steps),
+            "expected_outcome": self.expected_outcome,
+            "pass_criteria": list(self.pass_criteria),
+            "fail_criteria": list(self.fail_criteria),
+            "test_data": self.test_data,
+            "assertions": list(self.assertions),
+        }
+
+
+class TestCaseRecord:
+    """Slotted counterpart of TestCase that also remembers its endpoint index"""
+
+    __slots__ = (
+        "id",
+        "scenario_id",
+        "endpoint_index",
+        "name",
+        "method",
+        "url",
+        "headers",
+        "body",
+        "expected_status",
+        "assertions",
+        "timeout",
+        "payload_size",
+        "language",
+        "framework",
+        "generated_code",
+    )
+
+    def __init__(
+        self,
+        id: str,
+        scenario_id: str,
+        endpoint_index: Optional[int],
+        name: str,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        body: Optional[Union[str, Dict[str, Any], List[Any]]],
+        expected_status: int,
+        assertions: Tuple[Dict[str, Any], ...],
+        timeout: int,
+        language: TestLanguage,
+        framework: TestFramework,
+        generated_code: Optional[str] = None,
+        payload_size: Optional[int] = None,
+    ):
+        self.id = id
+        self.scenario_id = scenario_id
+        self.endpoint_index = endpoint_index
+        self.name = name
+        self.method = method
+        self.url = url
+        self.headers = headers
+        self.body = body
+        self.expected_status = expected_status
+        self.assertions = assertions
+        self.timeout = timeout
+        self.payload_size = payload_size
+        self.language = language
+        self.framework = framework
+        self.generated_code = generated_code
+
+    @classmethod
+    def from_model(
+        cls, test_case: TestCase, endpoint_index: Optional[int] = None
+    ) -> "TestCaseRecord":
+        return cls(
+            id=test_case.id,
+            scenario_id=test_case.scenario_id,
+            endpoint_index=endpoint_index,
+            name=test_case.name,
+            method=test_case.method,
+            url=test_case.url,
+            headers=test_case.headers,
+            body=test_case.body,
+            expected_status=test_case.expected_status,
+            assertions=_shared(test_case.assertions),
+            timeout=test_case.timeout,
+            language=test_case.language,
+            framework=test_case.framework,
+            generated_code=test_case.generated_code,
+            payload_size=test_case.payload_size,
+        )
+
+    def relink(self, endpoint_index: Optional[int]) -> "TestCaseRecord":
+        """Copy of this record referring to another endpoint position"""
+        return TestCaseRecord(
+            id=self.id,
+            scenario_id=self.scenario_id,
+            endpoint_index=endpoint_index,
+            name=self.name,
+            method=self.method,
+            url=self.url,
+            headers=self.headers,
+            body=self.body,
+            expected_status=self.expected_status,
+            assertions=self.assertions,
+            timeout=self.timeout,
+            language=self.language,
+            framework=self.framework,
+            generated_code=self.generated_code,
+            payload_size=self.payload_size,
+        )
+
+    def to_model(self) -> TestCase:
+        """Materialize the pydantic model"""
+        return TestCase(
+            id=self.id,
+            scenario_id=self.scenario_id,
+            name=self.name,
+            method=self.method,
+            url=self.url,
+            headers=self.headers,
+            body=self.body,
+            expected_status=self.expected_status,
+            assertions=list(self.assertions),
+            timeout=self.timeout,
+            payload_size=self.payload_size,
+            language=self.language,
+            framework=self.framework,
+            generated_code=self.generated_code,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-ready form with the same keys as TestCase.model_dump()"""
+        return {
+            "id": self.id,
+            "scenario_id": self.scenario_id,
+            "name": self.name,
+            "method": self.method,
+            "url": self.url,
+            "headers": self.headers,
+            "body": self.body,
+            "expected_status": self.expected_status,
+            "assertions": list(self.assertions),
+            "timeout": self.timeout,
+            "payload_size": self.payload_size,
+            "language": self.language.value,
+            "framework": self.framework.value,
+            "generated_code": self.generated_code,
+        }
@@ -1,13 +1,74 @@
 """HTML report generation for test results"""
 
+import gzip
 import json
+import os
+import zlib
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, Optional, Sequence, Tuple
 
 from jinja2 import Template
 
+from .exports import (
+    write_junit_xml,
+    write_load_samples_columnar,
+    write_load_samples_csv,
+)
 from .models import TestResult, TestSession
 
+# Template output pieces joined into each chunk written to a report file
+REPORT_BUFFER_SIZE = 4096
+
+# Rows per page of a paginated report, in the browser and in page resources
+REPORT_PAGE_SIZE = 100
+
+# Result counts above which "auto" report mode writes a paginated report
+PAGINATED_REPORT_THRESHOLD = 10000
+
+REPORT_MODES = ("auto", "full", "paginated")
+
+
+def report_sidecar_paths(report_file: str) -> Tuple[str, str]:
+    """Data file (gzip NDJSON rows) and page index file of a paginated report"""
+    base = os.path.splitext(report_file)[0]
+    return f"{base}.ndjson.gz", f"{base}.index.json"
+
+
+def read_report_page(report_file: str, page: int) -> Dict[str, Any]:
+    """
+    Rows of one page of a paginated report.
+
+    The data file is compressed with a full flush at the start of every page
+    and the index holds those offsets, so a page is read by seeking to its
+    offset and decompressing only its own rows.
+    """
+    data_file, index_file = report_sidecar_paths(report_file)
+    with open(index_file, "r", encoding="utf-8") as f:
+        index = json.load(f)
+
+    offsets = index["offsets"]
+    if page < 1 or page > len(offsets):
+        raise ValueError(f"Page {page} is out of range (1 to {len(offsets)})")
+
+    with open(data_file, "rb") as f:
+        f.seek(offsets[page - 1])
+        compressed = (
+            f.read(offsets[page] - offsets[page - 1])
+            if page < len(offsets)
+            else f.read()
+        )
+    # Raw deflate from a full flush point; the gzip trailer is left unused
+    text = zlib.decompressobj(-zlib.MAX_WBITS).decompress(compressed)
+
+    return {
+        "page": page,
+        "page_size": index["page_size"],
+        "total_pages": len(offsets),
+        "total_rows": index["rows"],
+        "rows": [json.loads(line) for line in text.splitlines() if line],
+    }
+
 
 class ReportGenerator:
     """Generate HTML reports for test results"""
@@ -16,22 +77,160 @@ class ReportGenerator:
         self.html_template = self._get_html_template()
 
     def generate_api_test_report(
-        self, results: List[TestResult], session: TestSession
+        self, results: Iterable[TestResult], session: TestSession
     ) -> str:
         """Generate HTML report for API test results"""
-        # Calculate summary statistics
-        total_tests = len(results)
-        passed_tests = sum(1 for r in results if r.status == "passed")
-        failed_tests = sum(1 for r in results if r.status == "failed")
-        total_time = sum(r.execution_time for r in results)
-        avg_time = total_time / total_tests if total_tests > 0 else 0
+        return self.html_template.render(**self._api_report_data(results, session))
+
+    def write_api_test_report(
+        self, results: Iterable[TestResult], session: TestSession, file_path: str
+    ):
+        """
+        Render the API test report straight into a file.
+
+        Result rows are formatted one at a time while the template output is
+        written in chunks, so neither the rows nor the document are held in
+        memory. Results are iterated once for the summary and once per status,
+        so they must be a collection rather than a one-shot iterator. Blocking;
+        run it in a thread from async code.
+        """
+        self._write(self._api_report_data(results, session), file_path)
+        # A paginated report written earlier under the same name is replaced
+        for sidecar in report_sidecar_paths(file_path):
+            if os.path.exists(sidecar):
+                os.remove(sidecar)
+
+    def write_paginated_api_test_report(
+        self, results: Iterable[TestResult], session: TestSession, file_path: str
+    ) -> str:
+        """
+        Write the API test report as a small HTML page plus its rows.
+
+        The rows go to a gzip-compressed NDJSON data file next to the report,
+        one result per line, which the page loads and shows a page at a time
+        with status and text filters. A page index allows reading single
+        pages without decompressing the rest. Returns the data file path.
+        """
+        data_file, index_file = report_sidecar_paths(file_path)
+        offsets = []
+        rows = 0
+        with (
+            open(data_file, "wb") as raw,
+            gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=6) as data,
+        ):
+            lines = []
+            for result in results:
+                if rows % REPORT_PAGE_SIZE == 0:
+                    if lines:
+                        data.write("".join(lines).encode("utf-8"))
+                        lines.clear()
+                    # Pages start at a full flush so each decompresses alone
+                    data.flush(zlib.Z_FULL_FLUSH)
+                    offsets.append(raw.tell())
+                lines.append(json.dumps(self._report_row(result)) + "\n")
+                rows += 1
+            if lines:
+                data.write("".join(lines).encode("utf-8"))
 
-        # Group results by status
-        passed_results = [r for r in results if r.status == "passed"]
-        failed_results = [r for r in results if r.status == "failed"]
+        with open(index_file, "w", encoding="utf-8") as f:
+            json.dump(
+                {"rows": rows, "page_size": REPORT_PAGE_SIZE, "offsets": offsets}, f
+            )
 
-        # Generate report data
-        report_data = {
+        report_data = self._api_report_data(results, session)
+        report_data.update(
+            paginated=True,
+            data_file=os.path.basename(data_file),
+            page_size=REPORT_PAGE_SIZE,
+        )
+        self._write(report_data, file_path)
+        return data_file
+
+    def generate_load_test_report(
+        self, results: Dict[str, Any], session: TestSession
+    ) -> str:
+        """Generate HTML report for load test results"""
+        return self.html_template.render(**self._load_report_data(results, session))
+
+    def write_load_test_report(
+        self, results: Dict[str, Any], session: TestSession, file_path: str
+    ):
+        """Render the load test report straight into a file"""
+        self._write(self._load_report_data(results, session), file_path)
+
+    def write_api_test_exports(
+        self,
+        results: Sequence[TestResult],
+        test_cases: Iterable[Any],
+        session: TestSession,
+        directory: str,
+    ) -> Dict[str, str]:
+        """
+        Write the API test results for CI next to the HTML report.
+
+        Produces junit_<session>.xml, which test result viewers of CI systems
+        read. Returns the paths written by format.
+        """
+        junit_file = os.path.join(directory, f"junit_{session.id}.xml")
+        with open(junit_file, "w", encoding="utf-8") as f:
+            write_junit_xml(
+                results,
+                test_cases,
+                f"api_tests_{session.id}",
+                datetime.now().isoformat(timespec="seconds"),
+                f,
+            )
+        return {"junit": junit_file}
+
+    def write_load_test_exports(
+        self, results: Dict[str, Any], session: TestSession, directory: str
+    ) -> Dict[str, str]:
+        """
+        Write the raw load test samples for analysis next to the HTML report.
+
+        Every request becomes a row of load_samples_<session>.csv and, when
+        pyarrow or numpy is installed, of a Parquet file or .npz archive with
+        the same columns. Returns the paths written by format.
+        """
+        samples = results.get("raw_results", [])
+        base_path = os.path.join(directory, f"load_samples_{session.id}")
+
+        exports = {"csv": f"{base_path}.csv"}
+        with open(exports["csv"], "w", encoding="utf-8", newline="") as f:
+            write_load_samples_csv(samples, f)
+
+        columnar_file = write_load_samples_columnar(samples, base_path)
+        if columnar_file:
+            exports[os.path.splitext(columnar_file)[1][1:]] = columnar_file
+        return exports
+
+    def _write(self, report_data: Dict[str, Any], file_path: str):
+        """Stream the rendered template into a file in chunks"""
+        pieces = self.html_template.generate(**report_data)
+        with open(file_path, "w", encoding="utf-8") as file:
+            while True:
+                chunk = list(islice(pieces, REPORT_BUFFER_SIZE))
+                if not chunk:
+                    break
+                file.write("".join(chunk))
+
+    def _api_report_data(
+        self, results: Iterable[TestResult], session: TestSession
+    ) -> Dict[str, Any]:
+        """Template context of an API test report; result rows are generated lazily"""
+        # Calculate summary statistics in a single pass
+        total_tests = passed_tests = failed_tests = 0
+        total_time = 0.0
+        for result in results:
+            total_tests += 1
+            total_time += result.execution_time
+            if result.status == "passed":
+                passed_tests += 1
+            elif result.status == "failed":
+                failed_tests += 1
+        avg_time = total_time / total_tests if total_tests > 0 else 0
+
+        return {
             "title": "API Test Report",
             "timestamp": datetime.now().isoformat(),
             "summary": {
@@ -44,9 +243,10 @@ class ReportGenerator:
                 "total_time": total_time,
                 "average_time": avg_time,
             },
+            # Group results by status
             "results": {
-                "passed": self._format_api_results(passed_results),
-                "failed": self._format_api_results(failed_results),
+                "passed": self._format_api_results(results, "passed"),
+                "failed": self._format_api_results(results, "failed"),
             },
             "session_info": {
                 "id": session.id,
@@ -57,17 +257,15 @@ class ReportGenerator:
             },
         }
 
-        return self.html_template.render(**report_data)
-
-    def generate_load_test_report(
+    def _load_report_data(
         self, results: Dict[str, Any], session: TestSession
-    ) -> str:
-        """Generate HTML report for load test results"""
+    ) -> Dict[str, Any]:
+        """Template context of a load test report"""
         summary = results.get("summary", {})
         response_times = results.get("response_times", {})
         status_codes = results.get("status_codes", {})
 
-        report_data = {
+        return {
             "title": "Load Test Report",
             "timestamp": datetime.now().isoformat(),
             "summary": summary,
@@ -81,27 +279,30 @@ class ReportGenerator:
             "is_load_test": True,
         }
 
-        return self.html_template.render(**report_data)
-
-    def _format_api_results(self, results: List[TestResult]) -> List[Dict[str, Any]]:
-        """Format API test results for HTML display"""
-        formatted_results = []
-
+    def _format_api_results(
+        self, results: Iterable[TestResult], status: str
+    ) -> Iterator[Dict[str, Any]]:
+        """Format the API test results with a status for HTML display, lazily"""
         for result in results:
-            formatted_result = {
-                "test_case_id": result.test_case_id,
-                "status": result.status,
-                "execution_time": f"{result.execution_time:.3f}s",
-                "response_status": result.response_status,
-                "assertions_passed": result.assertions_passed,
-                "assertions_failed": result.assertions_failed,
-                "assertion_details": result.assertion_details,
-                "error_message": result.error_message,
-                "response_preview": self._get_response_preview(result.response_body),
-            }
-            formatted_results.append(formatted_result)
+            if result.status == status:
+                yield self._report_row(result)
 
-        return formatted_results
+    def _report_row(self, result: TestResult) -> Dict[str, Any]:
+        """Format an API test result for display"""
+        return {
+            "test_case_id": result.test_case_id,
+            "status": result.status,
+            "execution_time": f"{result.execution_time:.3f}s",
+            "response_status": result.response_status,
+            "assertions_passed": result.assertions_passed,
+            "assertions_failed": result.assertions_failed,
+            "assertion_details": [
+                {"passed": detail["passed"], "message": detail["message"]}
+                for detail in result.assertion_details
+            ],
+            "error_message": result.error_message,
+            "response_preview": self._get_response_preview(result.response_body),
+        }
 
     def _get_response_preview(
         self, response_body: Optional[str], max_length: int = 200
@@ -390,6 +591,30 @@ class ReportGenerator:
             color: #424242;
         }
         
+        .table-controls {
+            display: flex;
+            flex-wrap: wrap;
+            align-items: center;
+            gap: 10px;
+            margin-bottom: 20px;
+        }
+        
+        .table-controls input[type="search"] {
+            flex: 1;
+            min-width: 200px;
+            padding: 6px 10px;
+        }
+        
+        .data-file-picker {
+            display: block;
+            margin-top: 10px;
+            font-style: normal;
+        }
+        
+        #rows .test-result-header {
+            cursor: pointer;
+        }
+        
         @media (max-width: 768px) {
             .container {
                 padding: 10px;
@@ -523,10 +748,158 @@ class ReportGenerator:
             </div>
         </div>
         
-        {% if results.passed %}
+        {% if paginated %}
+        <!-- Rows are loaded from the compressed data file, one page in the DOM at a time -->
         <div class="section">
             <div class="section-header">
-                <h2>✅ Passed Tests ({{ results.passed|length }})</h2>
+                <h2>🧪 Test Results (<span id="row-count">0</span> of {{ summary.total_tests }})</h2>
+            </div>
+            <div class="section-content" id="paged-results" data-file="{{ data_file }}" data-page-size="{{ page_size }}">
+                <div class="table-controls">
+                    <select id="status-filter">
+                        <option value="">All statuses</option>
+                        <option value="passed">Passed</option>
+                        <option value="failed">Failed</option>
+                    </select>
+                    <input id="text-filter" type="search" placeholder="Filter by test case, status code or error">
+                    <button id="prev-page" type="button">‹ Prev</button>
+                    <span id="page-info"></span>
+                    <button id="next-page" type="button">Next ›</button>
+                </div>
+                <div class="no-results" id="load-status">
+                    Loading results from {{ data_file }}…
+                    <label class="data-file-picker">Or open it here: <input id="data-file" type="file" accept=".gz"></label>
+                </div>
+                <div id="rows"></div>
+            </div>
+        </div>
+        <script>
+        {% raw %}
+        (function () {
+            const container = document.getElementById("paged-results");
+            const pageSize = Number(container.dataset.pageSize);
+            const status = document.getElementById("load-status");
+            const rowsElement = document.getElementById("rows");
+            const statusFilter = document.getElementById("status-filter");
+            const textFilter = document.getElementById("text-filter");
+            let rows = [];
+            let filtered = [];
+            let page = 0;
+
+            function element(tag, className, text) {
+                const node = document.createElement(tag);
+                if (className) node.className = className;
+                if (text !== undefined && text !== null) node.textContent = String(text);
+                return node;
+            }
+
+            function detail(label, value) {
+                const item = element("div", "detail-item");
+                item.append(element("span", "detail-label", label + ":"), element("span", "detail-value", value));
+                return item;
+            }
+
+            function renderRow(row) {
+                const result = element("div", "test-result");
+                const header = element("div", "test-result-header " + row.status);
+                header.append(element("div", "test-id", row.test_case_id), element("div", "status-badge " + row.status, row.status));
+                const details = element("div", "test-details");
+                const grid = element("div", "detail-grid");
+                grid.append(
+                    detail("Execution Time", row.execution_time),
+                    detail("Status Code", row.response_status),
+                    detail("Assertions Passed", row.assertions_passed),
+                    detail("Assertions Failed", row.assertions_failed)
+                );
+                details.append(grid);
+                if (row.error_message) {
+                    details.append(element("div", "assertion failed", "Error: " + row.error_message));
+                }
+                if (row.assertion_details && row.assertion_details.length) {
+                    const assertions = element("div", "assertions");
+                    for (const assertion of row.assertion_details) {
+                        assertions.append(element("div", "assertion " + (assertion.passed ? "passed" : "failed"), assertion.message));
+                    }
+                    details.append(assertions);
+                }
+                if (row.response_preview) {
+                    details.append(element("div", "response-preview", row.response_preview));
+                }
+                details.hidden = true;
+                header.addEventListener("click", () => { details.hidden = !details.hidden; });
+                result.append(header, details);
+                return result;
+            }
+
+            function render() {
+                const pages = Math.max(1, Math.ceil(filtered.length / pageSize));
+                page = Math.min(page, pages - 1);
+                const start = page * pageSize;
+                rowsElement.replaceChildren(...filtered.slice(start, start + pageSize).map(renderRow));
+                document.getElementById("row-count").textContent = filtered.length;
+                document.getElementById("page-info").textContent = "Page " + (page + 1) + " of " + pages;
+            }
+
+            function applyFilter() {
+                const wanted = statusFilter.value;
+                const text = textFilter.value.trim().toLowerCase();
+                filtered = rows.filter((row) =>
+                    (!wanted || row.status === wanted) &&
+                    (!text || [row.test_case_id, row.response_status, row.error_message]
+                        .some((value) => value !== null && value !== undefined && String(value).toLowerCase().includes(text)))
+                );
+                page = 0;
+                render();
+            }
+
+            async function load(stream) {
+                rows = [];
+                const reader = stream
+                    .pipeThrough(new DecompressionStream("gzip"))
+                    .pipeThrough(new TextDecoderStream())
+                    .getReader();
+                let buffer = "";
+                for (;;) {
+                    const chunk = await reader.read();
+                    if (chunk.done) break;
+                    const lines = (buffer + chunk.value).split("\\n");
+                    buffer = lines.pop();
+                    for (const line of lines) {
+                        if (line) rows.push(JSON.parse(line));
+                    }
+                    status.textContent = "Loaded " + rows.length + " results…";
+                }
+                if (buffer) rows.push(JSON.parse(buffer));
+                status.hidden = true;
+                applyFilter();
+            }
+
+            statusFilter.addEventListener("change", applyFilter);
+            textFilter.addEventListener("input", applyFilter);
+            document.getElementById("prev-page").addEventListener("click", () => { if (page > 0) { page -= 1; render(); } });
+            document.getElementById("next-page").addEventListener("click", () => { page += 1; render(); });
+            document.getElementById("data-file").addEventListener("change", (event) => {
+                const file = event.target.files[0];
+                if (file) load(file.stream());
+            });
+
+            // Browsers refuse fetch() for file:// pages; the picker is the fallback
+            fetch(container.dataset.file)
+                .then((response) => {
+                    if (!response.ok) throw new Error(response.statusText);
+                    return load(response.body);
+                })
+                .catch(() => {
+                    status.firstChild.textContent = "Open " + container.dataset.file + " from the report folder to view the results. ";
+                });
+        })();
+        {% endraw %}
+        </script>
+        {% else %}
+        {% if summary.passed_tests %}
+        <div class="section">
+            <div class="section-header">
+                <h2>✅ Passed Tests ({{ summary.passed_tests }})</h2>
             </div>
             <div class="section-content">
                 {% for result in results.passed %}
@@ -571,10 +944,10 @@ class ReportGenerator:
         </div>
         {% endif %}
         
-        {% if results.failed %}
+        {% if summary.failed_tests %}
         <div class="section">
             <div class="section-header">
-                <h2>❌ Failed Tests ({{ results.failed|length }})</h2>
+                <h2>❌ Failed Tests ({{ summary.failed_tests }})</h2>
             </div>
             <div class="section-content">
                 {% for result in results.failed %}
@@ -627,7 +1000,7 @@ class ReportGenerator:
         </div>
         {% endif %}
         
-        {% if not results.passed and not results.failed %}
+        {% if not summary.passed_tests and not summary.failed_tests %}
         <div class="section">
             <div class="section-content">
                 <div class="no-results">No test results to display</div>
@@ -635,6 +1008,7 @@ class ReportGenerator:
         </div>
         {% endif %}
         {% endif %}
+        {% endif %}
     </div>
 </body>
 </html>
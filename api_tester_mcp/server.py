@@ -1,34 +1,85 @@
 """Main MCP server implementation using FastMCP"""
 
+import asyncio
 import json
 import os
+import time
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
+from urllib.parse import urlsplit
 
-import yaml
 from fastmcp import FastMCP
 from fastmcp.prompts import Prompt
 from fastmcp.resources import Resource
 from pydantic import BaseModel
 
-from .code_generators import generate_package_files, get_supported_combinations
+from .boundaries import DEFAULT_BOUNDARY_BUDGET
+from .catalog import EndpointCatalog
+from .code_generators import (
+    enable_template_bytecode_cache,
+    generate_package_files,
+    get_supported_combinations,
+    write_test_code_files,
+)
+from .fuzzing import (
+    DEFAULT_HUGE_STRING_LENGTH,
+    DEFAULT_NESTING_DEPTH,
+    FUZZ_MUTATORS,
+    FuzzExecutor,
+    FuzzSeed,
+    MutationEngine,
+    save_corpus,
+    seed_test_data,
+)
 from .models import (
+    ApiEndpoint,
     SpecType,
     StatusType,
-    TestCase,
     TestFramework,
     TestLanguage,
     TestResult,
-    TestScenario,
     TestSession,
 )
-from .parsers import ScenarioGenerator, SpecificationParser, analyze_required_env_vars
-from .reports import ReportGenerator
+from .pairwise import DEFAULT_PAIRWISE_BUDGET, coverage_summary
+from .parsers import (
+    ScenarioGenerator,
+    SpecificationParser,
+    analyze_required_env_vars,
+    merge_env_analyses,
+    should_stream_spec,
+)
+from .payloads import parse_sizes, payload_summary
+from .records import ScenarioRecord, TestCaseRecord
+from .reports import (
+    PAGINATED_REPORT_THRESHOLD,
+    REPORT_MODES,
+    ReportGenerator,
+    read_report_page,
+    report_sidecar_paths,
+)
+from .sharding import (
+    DURATIONS_FILENAME,
+    SHARD_STRATEGIES,
+    estimate_duration,
+    load_durations,
+    record_durations,
+    shard_test_cases,
+)
+from .spec_collection import (
+    assign_service_names,
+    collection_root,
+    discover_spec_files,
+    is_spec_collection,
+    parse_spec_files,
+)
+from .spec_diff import SpecDiff
 from .test_execution import LoadTestExecutor, TestCaseGenerator, TestExecutor
 from .utils import (
     ProgressTracker,
     extract_error_details,
     generate_id,
+    generate_seed,
+    generate_stable_id,
     logger,
     merge_env_vars,
     validate_spec_type,
@@ -40,6 +91,8 @@ mcp = FastMCP("API Tester MCP")
 
 # Global state
 current_session: Optional[TestSession] = None
+session_catalog: Optional[EndpointCatalog] = None  # Indexed endpoints of the session
+session_diff: Optional[SpecDiff] = None  # Changes since the previous incremental ingest
 test_results: List[TestResult] = []
 load_test_results: Dict[str, Any] = {}
 report_generator = ReportGenerator()
@@ -262,11 +315,21 @@ def check_directory_access(directory_path: str) -> Dict[str, Any]:
 # Pydantic models for tool parameters
 class IngestSpecParams(BaseModel):
     spec_type: Optional[str] = "openapi"  # openapi, swagger, postman
-    file_path: str  # Path to the API specification file (JSON or YAML)
+    file_path: str  # Specification file (JSON or YAML), directory or glob pattern
     preferred_language: Optional[str] = "python"  # python, typescript, javascript
     preferred_framework: Optional[str] = (
         "requests"  # pytest, requests, playwright, jest, cypress, supertest
     )
+    streaming: Optional[bool] = (
+        None  # Stream large JSON OpenAPI files path by path (auto-detected if None)
+    )
+    max_workers: Optional[int] = (
+        None  # Parser processes for directories and globs (CPU count if None)
+    )
+    incremental: bool = (
+        False  # Keep scenarios and test cases of endpoints unchanged since the last ingest
+    )
+    seed: Optional[int] = None  # Seed for reproducible test data (random if None)
 
 
 class SetEnvVarsParams(BaseModel):
@@ -286,20 +349,67 @@ class GenerateScenariosParams(BaseModel):
         True  # Generate failure scenarios (invalid data, unauthorized access)
     )
     include_edge_cases: bool = True  # Generate boundary and edge case scenarios
+    boundary_budget: int = (
+        DEFAULT_BOUNDARY_BUDGET  # Boundary value scenarios per endpoint, 0 for none
+    )
+    pairwise_budget: int = (
+        DEFAULT_PAIRWISE_BUDGET  # Parameter combinations per endpoint, 0 for none
+    )
+    payload_sizes: Optional[List[Union[int, str]]] = (
+        None  # Large payload steps, e.g. ["1KB", "10MB", "200MB"]; [] for none
+    )
+    incremental: bool = True  # Reuse scenarios carried over by an incremental ingest
+
+
+class EndpointSelectorParams(BaseModel):
+    tags: Optional[List[str]] = None  # Only endpoints with any of these tags
+    methods: Optional[List[str]] = None  # ["GET", "POST"] or None for all
+    path_glob: Optional[str] = None  # "/pets/**", "/pets/*/photos" or "/pets/42"
+    operation_ids: Optional[List[str]] = None  # OpenAPI operationIds
+    services: Optional[List[str]] = None  # Source services of multi-file ingests
+
+
+class SuiteLayoutParams(BaseModel):
+    max_tests_per_file: Optional[int] = (
+        None  # Split the test code into files of at most this many test cases
+    )
+    shard_by: Optional[str] = None  # tag, path_prefix or balanced
+    shard_count: Optional[int] = None  # Number of balanced shards
+    shard_path_depth: int = 1  # Path segments that make up a path_prefix shard
 
 
-class GenerateTestCasesParams(BaseModel):
+class GenerateTestCasesParams(EndpointSelectorParams, SuiteLayoutParams):
     scenario_ids: Optional[List[str]] = None
+    incremental: bool = True  # Reuse test cases carried over by an incremental ingest
+
+
+class GetTestCaseCodeParams(EndpointSelectorParams):
+    test_case_ids: Optional[List[str]] = (
+        None  # ["test_case_1", "test_case_2"] or None for all selected
+    )
 
 
-class RunApiTestsParams(BaseModel):
+class GenerateTestCodeBatchParams(EndpointSelectorParams, SuiteLayoutParams):
+    test_case_ids: Optional[List[str]] = (
+        None  # ["test_case_1", "test_case_2"] or None for all selected
+    )
+    combinations: Optional[List[str]] = (
+        None  # ["python/pytest", "typescript/playwright"] or None for all supported
+    )
+    max_workers: Optional[int] = None  # Rendering processes (CPU count if None)
+
+
+class RunApiTestsParams(EndpointSelectorParams):
     test_case_ids: Optional[List[str]] = (
         None  # ["test_case_1", "test_case_2"] or None for all
     )
     max_concurrent: int = 10  # Number of concurrent requests (1-50)
+    report_mode: str = (
+        "auto"  # "full", "paginated" or "auto" (paginated above 10000 results)
+    )
 
 
-class RunLoadTestsParams(BaseModel):
+class RunLoadTestsParams(EndpointSelectorParams):
     test_case_ids: Optional[List[str]] = (
         None  # ["test_case_1", "test_case_2"] or None for all
     )
@@ -308,6 +418,19 @@ class RunLoadTestsParams(BaseModel):
     ramp_up: int = 10  # Ramp up time in seconds
 
 
+class RunFuzzTestsParams(EndpointSelectorParams):
+    iterations: int = 1000  # Mutated requests to send
+    max_concurrent: int = 50  # Requests in flight at once
+    mutators: Optional[List[str]] = (
+        None  # Subset of type_confusion, huge_string, unicode, null, deep_nesting
+    )
+    huge_string_length: int = DEFAULT_HUGE_STRING_LENGTH  # Characters
+    nesting_depth: int = DEFAULT_NESTING_DEPTH  # Levels of nested arrays/objects
+    timeout: float = 10.0  # Seconds before a request counts as a hang
+    minimize: bool = True  # Shrink the request that reproduces each crash
+    seed: Optional[int] = None  # Mutation seed (session seed if None)
+
+
 # MCP Tools
 @mcp.tool()
 async def ingest_spec(params: IngestSpecParams) -> Dict[str, Any]:
@@ -320,17 +443,30 @@ async def ingest_spec(params: IngestSpecParams) -> Dict[str, Any]:
                   If not provided, the function will attempt to auto-detect from the file content.
         file_path: Path to the API specification file (JSON or YAML format).
                   Can be absolute or relative path. The file must exist and be readable.
+                  A directory or glob pattern (e.g. "services/**/openapi.yaml") ingests
+                  every specification it contains into one session; the type of each
+                  file is detected and its endpoints are tagged with the service name.
         preferred_language: Preferred programming language for test generation (python, typescript, javascript)
         preferred_framework: Preferred testing framework (pytest, playwright, jest, etc.)
+        streaming: Parse a JSON OpenAPI/Swagger file path by path with bounded memory.
+                  Enabled automatically for very large JSON files when not provided.
+        max_workers: Number of processes parsing the files of a directory or glob.
+                  Defaults to the CPU count.
+        incremental: Diff the new endpoints against the active session by method, path
+                  and content hash. Scenarios, test cases and environment variables of
+                  unchanged endpoints are carried over, so later generation steps only
+                  work on added and changed endpoints. The diff is returned as 'spec_diff'.
 
     Returns:
         Dictionary with ingestion results, session information, and environment variable analysis.
         Includes the original file path in the 'spec_file_path' field for reference.
+        Directory and glob ingests also list per-file service, spec type, endpoint
+        count and parse time under 'files'.
 
     Raises:
         Returns error dictionary if file doesn't exist, can't be read, or has invalid format.
     """
-    global current_session, ingested_file_directory
+    global current_session, session_catalog, session_diff, ingested_file_directory
 
     try:
         # Log provided parameters
@@ -341,6 +477,9 @@ async def ingest_spec(params: IngestSpecParams) -> Dict[str, Any]:
             f"preferred_framework: {params.preferred_framework}"
         )
 
+        if is_spec_collection(params.file_path):
+            return await _ingest_spec_collection(params)
+
         # Check if file exists
         if not os.path.exists(params.file_path):
             return {
@@ -348,136 +487,134 @@ async def ingest_spec(params: IngestSpecParams) -> Dict[str, Any]:
                 "error": f"Specification file not found: {params.file_path}",
             }
 
-        # Read file content
-        try:
-            with open(params.file_path, "r", encoding="utf-8") as file:
-                content = file.read()
-            logger.info(f"Successfully read specification file: {params.file_path}")
+        use_streaming = (
+            params.streaming
+            if params.streaming is not None
+            else should_stream_spec(params.file_path)
+        )
 
-            # Capture the directory of the ingested file to use as workspace directory
+        if use_streaming:
+            # Large JSON OpenAPI/Swagger documents are parsed path by path
             ingested_file_directory = os.path.dirname(os.path.abspath(params.file_path))
             logger.info(
-                f"Set workspace directory to ingested file location: {ingested_file_directory}"
+                f"Streaming specification file, workspace directory: {ingested_file_directory}"
             )
 
-        except Exception as e:
-            return {
-                "success": False,
-                "error": f"Failed to read specification file {params.file_path}: {str(e)}",
-            }
+            spec_type_to_use = (params.spec_type or "openapi").lower()
+            if spec_type_to_use not in ["openapi", "swagger"]:
+                return {
+                    "success": False,
+                    "error": "Streaming ingestion only supports JSON OpenAPI/Swagger specifications",
+                }
 
-        # Use provided spec_type or auto-detect
-        spec_type_to_use = params.spec_type or "openapi"
+            parser = SpecificationParser()
+            spec_type = SpecType(spec_type_to_use)
+            if params.incremental:
+                # Diffing needs the endpoints now rather than when scenarios are built
+                catalog = EndpointCatalog(
+                    parser.iter_openapi_file(params.file_path, spec_type)
+                )
+                endpoint_summaries = [
+                    _summarize_endpoint(ep) for ep in catalog.endpoints
+                ]
+            else:
+                endpoint_summaries = [
+                    _summarize_endpoint(ep)
+                    for ep in parser.iter_openapi_file(params.file_path, spec_type)
+                ]
 
-        # Auto-detect spec type if needed or validate provided type
-        detected_type = validate_spec_type(content)
-        if detected_type:
-            if params.spec_type and detected_type != params.spec_type.lower():
-                logger.warning(
-                    f"Detected spec type '{detected_type}' differs from provided '{params.spec_type}', using detected type"
+                # The catalog is filled when scenarios re-stream the file
+                catalog = None
+            spec_data = parser.spec_data
+        else:
+            # Read file content
+            try:
+                with open(params.file_path, "r", encoding="utf-8") as file:
+                    content = file.read()
+                logger.info(f"Successfully read specification file: {params.file_path}")
+
+                # Capture the directory of the ingested file to use as workspace directory
+                ingested_file_directory = os.path.dirname(
+                    os.path.abspath(params.file_path)
+                )
+                logger.info(
+                    f"Set workspace directory to ingested file location: {ingested_file_directory}"
                 )
-            spec_type_to_use = detected_type
 
-        # Validate final spec type
-        if spec_type_to_use.lower() not in ["openapi", "swagger", "postman", "graphql"]:
-            return {
-                "success": False,
-                "error": f"Unsupported specification type: {spec_type_to_use}. Supported types: openapi, swagger, postman, graphql",
-            }
+            except Exception as e:
+                return {
+                    "success": False,
+                    "error": f"Failed to read specification file {params.file_path}: {str(e)}",
+                }
 
-        # Parse specification
-        parser = SpecificationParser()
-        spec_type = SpecType(spec_type_to_use.lower())
-        endpoints = parser.parse(content, spec_type)
+            # Use provided spec_type or auto-detect
+            spec_type_to_use = params.spec_type or "openapi"
 
-        if not endpoints:
+            # Auto-detect spec type if needed or validate provided type
+            detected_type = validate_spec_type(content)
+            if detected_type:
+                if params.spec_type and detected_type != params.spec_type.lower():
+                    logger.warning(
+                        f"Detected spec type '{detected_type}' differs from provided '{params.spec_type}', using detected type"
+                    )
+                spec_type_to_use = detected_type
+
+            # Validate final spec type
+            if spec_type_to_use.lower() not in [
+                "openapi",
+                "swagger",
+                "postman",
+                "graphql",
+            ]:
+                return {
+                    "success": False,
+                    "error": f"Unsupported specification type: {spec_type_to_use}. Supported types: openapi, swagger, postman, graphql",
+                }
+
+            # Parse specification
+            parser = SpecificationParser()
+            spec_type = SpecType(spec_type_to_use.lower())
+            endpoints = parser.parse(content, spec_type)
+            catalog = EndpointCatalog(endpoints)
+
+            # Reuse the document loaded by the parser; GraphQL SDL is kept as
+            # {"schema": text} so it fits the session model
+            spec_data = parser.spec_data
+
+            endpoint_summaries = [_summarize_endpoint(ep) for ep in endpoints]
+
+        if not endpoint_summaries:
             return {
                 "success": False,
                 "error": "No API endpoints found in the specification",
             }
 
-        # Analyze required environment variables
-        if spec_type == SpecType.GRAPHQL:
-            # For GraphQL, pass the original content for analysis
-            spec_data = content if isinstance(content, str) else str(content)
-            try:
-                # Try to parse as JSON first (for introspection results)
-                if content.strip().startswith("{"):
-                    spec_data = json.loads(content)
-            except json.JSONDecodeError:
-                # Keep as string for SDL parsing
-                pass
-        else:
-            spec_data = (
-                json.loads(content)
-                if content.strip().startswith("{")
-                else yaml.safe_load(content)
-            )
+        env_analysis = parser.analyze_env_vars()
 
-        env_analysis = analyze_required_env_vars(spec_data, spec_type, parser.base_url)
-
-        # Parse language and framework preferences
-        preferred_language = TestLanguage.PYTHON  # default
-        if params.preferred_language:
-            try:
-                preferred_language = TestLanguage(params.preferred_language.lower())
-            except ValueError:
-                logger.warning(
-                    f"Invalid language '{params.preferred_language}', using default: python"
-                )
-
-        preferred_framework = TestFramework.REQUESTS  # default
-        if params.preferred_framework:
-            try:
-                preferred_framework = TestFramework(params.preferred_framework.lower())
-            except ValueError:
-                logger.warning(
-                    f"Invalid framework '{params.preferred_framework}', using default: requests"
-                )
+        preferred_language, preferred_framework = _resolve_preferences(params)
+        diff = _diff_previous_session(catalog) if params.incremental else None
 
         # Create new session
         session_id = generate_id()
+        session_catalog = catalog
+        session_diff = diff
         current_session = TestSession(
             id=session_id,
             spec_type=spec_type,
             spec_content=spec_data,
+            spec_file_path=os.path.abspath(params.file_path),
+            spec_streamed=use_streaming,
+            env_analysis=env_analysis,
             created_at=datetime.now().isoformat(),
             preferred_language=preferred_language,
             preferred_framework=preferred_framework,
+            # Incremental ingests keep configuring the same API
+            env_vars=dict(current_session.env_vars) if diff is not None else {},
+            seed=_resolve_seed(params, diff),
         )
 
-        logger.info(f"Created new session {session_id} with {len(endpoints)} endpoints")
-
-        # Generate helpful message about environment variables
-        env_message = []
-        required_vars = env_analysis.get("required_variables", {})
-        if required_vars:
-            env_message.append(
-                f"⚠️  {len(required_vars)} required environment variable(s) detected:"
-            )
-            for var_name, var_info in required_vars.items():
-                if "detected_value" in var_info:
-                    env_message.append(
-                        f"   • {var_name}: {var_info['description']} (Suggested: {var_info['detected_value']})"
-                    )
-                else:
-                    env_message.append(f"   • {var_name}: {var_info['description']}")
-            env_message.append(
-                "💡 Use set_env_vars() for configuration with automatic validation and guidance."
-            )
-        else:
-            env_message.append(
-                "✅ No authentication or environment variables required."
-            )
-
-        # Add workspace directory information to the setup message
-        env_message.append("")
-        env_message.append(
-            f"📁 Workspace directory set to API specification file location:"
-        )
-        env_message.append(f"   {ingested_file_directory}")
-        env_message.append(
-            "   Generated files (scenarios, test cases, reports) will be saved here."
+        logger.info(
+            f"Created new session {session_id} with {len(endpoint_summaries)} endpoints"
         )
 
         return {
@@ -488,19 +625,14 @@ async def ingest_spec(params: IngestSpecParams) -> Dict[str, Any]:
             "spec_type": spec_type.value,
             "preferred_language": preferred_language.value,
             "preferred_framework": preferred_framework.value,
-            "endpoints_count": len(endpoints),
-            "endpoints": [
-                {
-                    "path": ep.path,
-                    "method": ep.method,
-                    "summary": ep.summary,
-                    "auth_required": ep.auth_required,
-                }
-                for ep in endpoints
-            ],
+            "endpoints_count": len(endpoint_summaries),
+            "endpoints": endpoint_summaries,
+            "streamed": use_streaming,
+            "seed": current_session.seed,
+            "spec_diff": diff.summary() if diff is not None else None,
             "base_url": parser.base_url,
             "environment_analysis": env_analysis,
-            "setup_message": "\n".join(env_message),
+            "setup_message": _build_setup_message(env_analysis),
         }
 
     except Exception as e:
@@ -512,6 +644,358 @@ async def ingest_spec(params: IngestSpecParams) -> Dict[str, Any]:
         }
 
 
+def _session_catalog() -> EndpointCatalog:
+    """Endpoint catalog of the active session, built on first use when streamed"""
+    global session_catalog
+
+    if session_catalog is None:
+        # Streamed sessions re-read the original file to build the catalog
+        parser = SpecificationParser()
+        session_catalog = EndpointCatalog(
+            parser.iter_openapi_file(
+                current_session.spec_file_path, current_session.spec_type
+            )
+        )
+    return session_catalog
+
+
+def _endpoint_selectors(params: EndpointSelectorParams) -> Dict[str, Any]:
+    """Extract the catalog selector arguments from tool parameters"""
+    return {
+        "tags": params.tags,
+        "methods": params.methods,
+        "path_glob": params.path_glob,
+        "operation_ids": params.operation_ids,
+        "services": params.services,
+    }
+
+
+def _summarize_endpoint(endpoint: ApiEndpoint) -> Dict[str, Any]:
+    """Build the short endpoint description returned by ingest_spec"""
+    summary = {
+        "path": endpoint.path,
+        "method": endpoint.method,
+        "summary": endpoint.summary,
+        "auth_required": endpoint.auth_required,
+    }
+    if endpoint.service:
+        summary["service"] = endpoint.service
+    return summary
+
+
+def _resolve_preferences(params: IngestSpecParams) -> tuple:
+    """Parse the preferred language and framework, falling back to defaults"""
+    preferred_language = TestLanguage.PYTHON  # default
+    if params.preferred_language:
+        try:
+            preferred_language = TestLanguage(params.preferred_language.lower())
+        except ValueError:
+            logger.warning(
+                f"Invalid language '{params.preferred_language}', using default: python"
+            )
+
+    preferred_framework = TestFramework.REQUESTS  # default
+    if params.preferred_framework:
+        try:
+            preferred_framework = TestFramework(params.preferred_framework.lower())
+        except ValueError:
+            logger.warning(
+                f"Invalid framework '{params.preferred_framework}', using default: requests"
+            )
+
+    return preferred_language, preferred_framework
+
+
+def _resolve_seed(params: IngestSpecParams, diff: Optional[SpecDiff]) -> int:
+    """Test data seed of a new session; incremental ingests keep the previous one"""
+    if params.seed is not None:
+        return params.seed
+    if diff is not None and current_session.seed is not None:
+        return current_session.seed
+    return generate_seed()
+
+
+def _code_filename(
+    language: TestLanguage,
+    framework: TestFramework,
+    session_id: str,
+    part: Optional[int] = None,
+    shard: Optional[str] = None,
+) -> str:
+    """
+    Name of a generated test code file; shards are named and parts of a split
+    suite or shard are numbered
+    """
+    if language == TestLanguage.PYTHON:
+        if framework == TestFramework.PYTEST:
+            prefix, extension = "test_api", ".py"
+        else:
+            prefix, extension = "api_tests", ".py"
+    elif language == TestLanguage.TYPESCRIPT:
+        if framework == TestFramework.PLAYWRIGHT:
+            prefix, extension = "api_tests", ".spec.ts"
+        else:
+            prefix, extension = "api_tests", ".test.ts"
+    elif language == TestLanguage.JAVASCRIPT:
+        if framework == TestFramework.CYPRESS:
+            prefix, extension = "api_tests", ".cy.js"
+        else:
+            prefix, extension = "api_tests", ".test.js"
+    else:
+        prefix, extension = "api_tests", ".txt"
+
+    suffix = f"_{shard}" if shard else ""
+    if part is not None:
+        suffix += f"_part{part}"
+    return f"{prefix}_{session_id}{suffix}{extension}"
+
+
+def _suite_layout_error(params: SuiteLayoutParams) -> Optional[str]:
+    """Validate the sharding options of a code generation request"""
+    if params.shard_by and params.shard_by not in SHARD_STRATEGIES:
+        return (
+            f"Invalid shard_by '{params.shard_by}'. "
+            f"Use one of: {', '.join(SHARD_STRATEGIES)}"
+        )
+    if params.shard_by == "balanced" and not (
+        params.shard_count and params.shard_count > 0
+    ):
+        return "shard_count must be a positive number for balanced sharding"
+    return None
+
+
+def _shard_suite(
+    test_cases: List[TestCaseRecord],
+    params: SuiteLayoutParams,
+    durations: Dict[str, float],
+) -> Dict[Optional[str], List[TestCaseRecord]]:
+    """Shards of a suite; an unsharded suite is a single shard named None"""
+    if not params.shard_by:
+        return {None: test_cases}
+    return shard_test_cases(
+        test_cases,
+        session_catalog.endpoints,
+        params.shard_by,
+        params.shard_count,
+        durations,
+        params.shard_path_depth,
+    )
+
+
+def _plan_code_files(
+    shard_cases: List[TestCaseRecord],
+    params: SuiteLayoutParams,
+    language: TestLanguage,
+    framework: TestFramework,
+    session_id: str,
+    shard: Optional[str] = None,
+) -> List[tuple]:
+    """
+    File names and test cases of one shard, split into parts of at most
+    max_tests_per_file test cases when requested
+    """
+    per_file = len(shard_cases) or 1
+    if params.max_tests_per_file and params.max_tests_per_file > 0:
+        per_file = params.max_tests_per_file
+    parts = range(0, len(shard_cases), per_file)
+    return [
+        (
+            _code_filename(
+                language,
+                framework,
+                session_id,
+                number if len(parts) > 1 else None,
+                shard,
+            ),
+            shard_cases[offset : offset + per_file],
+        )
+        for number, offset in enumerate(parts, start=1)
+    ]
+
+
+def _build_setup_message(env_analysis: Dict[str, Any]) -> str:
+    """Generate helpful message about environment variables"""
+    env_message = []
+    required_vars = env_analysis.get("required_variables", {})
+    if required_vars:
+        env_message.append(
+            f"⚠️  {len(required_vars)} required environment variable(s) detected:"
+        )
+        for var_name, var_info in required_vars.items():
+            if "detected_value" in var_info:
+                env_message.append(
+                    f"   • {var_name}: {var_info['description']} (Suggested: {var_info['detected_value']})"
+                )
+            else:
+                env_message.append(f"   • {var_name}: {var_info['description']}")
+        env_message.append(
+            "💡 Use set_env_vars() for configuration with automatic validation and guidance."
+        )
+    else:
+        env_message.append("✅ No authentication or environment variables required.")
+
+    # Add workspace directory information to the setup message
+    env_message.append("")
+    env_message.append(
+        f"📁 Workspace directory set to API specification file location:"
+    )
+    env_message.append(f"   {ingested_file_directory}")
+    env_message.append(
+        "   Generated files (scenarios, test cases, reports) will be saved here."
+    )
+
+    return "\n".join(env_message)
+
+
+def _diff_previous_session(catalog: EndpointCatalog) -> Optional[SpecDiff]:
+    """
+    Diff a newly ingested catalog against the active session and carry over the
+    scenarios and test cases of unchanged endpoints.
+    """
+    if current_session is None or session_catalog is None:
+        return None
+
+    diff = SpecDiff(session_catalog.endpoints, catalog.endpoints)
+    diff.carry_over(
+        current_session.scenarios,
+        current_session.test_cases,
+        catalog.endpoints,
+        current_session.scenario_context,
+        (
+            current_session.preferred_language,
+            current_session.preferred_framework,
+            dict(current_session.env_vars),
+            current_session.seed,
+        ),
+    )
+    logger.info(
+        f"Spec diff: {len(diff.added)} added, {len(diff.changed)} changed, "
+        f"{len(diff.removed)} removed, {len(diff.unchanged)} unchanged endpoints"
+    )
+    return diff
+
+
+async def _ingest_spec_collection(params: IngestSpecParams) -> Dict[str, Any]:
+    """
+    Ingest every specification of a directory or glob pattern into one session.
+
+    Files are detected and parsed in a process pool, and their endpoints are
+    merged into a single catalog with each endpoint tagged by its service.
+    """
+    global current_session, session_catalog, session_diff, ingested_file_directory
+
+    started = time.perf_counter()
+    root = collection_root(params.file_path)
+    files = discover_spec_files(params.file_path)
+    if not files:
+        return {
+            "success": False,
+            "error": f"No specification files found for: {params.file_path}",
+        }
+
+    results = await parse_spec_files(
+        assign_service_names(files, root), params.max_workers
+    )
+
+    catalog = EndpointCatalog()
+    sources = []
+    endpoints_by_type: Dict[str, int] = {}
+    for result in results:
+        for endpoint in result["endpoints"]:
+            catalog.add(endpoint)
+        if result["endpoints"]:
+            endpoints_by_type[result["spec_type"]] = endpoints_by_type.get(
+                result["spec_type"], 0
+            ) + len(result["endpoints"])
+
+        source = {key: value for key, value in result.items() if key != "endpoints"}
+        source["endpoints_count"] = len(result["endpoints"])
+        sources.append(source)
+
+    failed = [source for source in sources if "error" in source]
+    for source in failed:
+        logger.warning(
+            f"Failed to parse specification {source['file_path']}: {source['error']}"
+        )
+
+    if not len(catalog):
+        return {
+            "success": False,
+            "error": "No API endpoints found in the specifications",
+            "files": sources,
+        }
+
+    ingested_file_directory = root
+    logger.info(f"Set workspace directory to collection root: {root}")
+
+    # A session has one spec type; mixed collections use the dominant one
+    spec_type = SpecType(max(endpoints_by_type, key=endpoints_by_type.get))
+    env_analysis = merge_env_analyses(
+        [
+            source["environment_analysis"]
+            for source in sources
+            if "environment_analysis" in source
+        ]
+    )
+    preferred_language, preferred_framework = _resolve_preferences(params)
+    diff = _diff_previous_session(catalog) if params.incremental else None
+
+    session_id = generate_id()
+    session_catalog = catalog
+    session_diff = diff
+    current_session = TestSession(
+        id=session_id,
+        spec_type=spec_type,
+        spec_content={},
+        spec_file_path=os.path.abspath(params.file_path),
+        spec_sources=sources,
+        env_analysis=env_analysis,
+        created_at=datetime.now().isoformat(),
+        preferred_language=preferred_language,
+        preferred_framework=preferred_framework,
+        # Incremental ingests keep configuring the same API
+        env_vars=dict(current_session.env_vars) if diff is not None else {},
+        seed=_resolve_seed(params, diff),
+    )
+
+    parse_times = [source["parse_time_ms"] for source in sources]
+    logger.info(
+        f"Created new session {session_id} with {len(catalog)} endpoints "
+        f"from {len(sources) - len(failed)} of {len(files)} files"
+    )
+
+    return {
+        "success": True,
+        "session_id": session_id,
+        "spec_file_path": params.file_path,
+        "workspace_directory": ingested_file_directory,
+        "spec_type": spec_type.value,
+        "preferred_language": preferred_language.value,
+        "preferred_framework": preferred_framework.value,
+        "endpoints_count": len(catalog),
+        "endpoints": [_summarize_endpoint(ep) for ep in catalog.endpoints],
+        "services": catalog.services(),
+        "seed": current_session.seed,
+        "files": [
+            {
+                key: value
+                for key, value in source.items()
+                if key != "environment_analysis"
+            }
+            for source in sources
+        ],
+        "files_count": len(files),
+        "failed_files_count": len(failed),
+        "skipped_files_count": sum("skipped" in source for source in sources),
+        "total_parse_time_ms": round(sum(parse_times), 2),
+        "slowest_parse_time_ms": max(parse_times),
+        "wall_time_ms": round((time.perf_counter() - started) * 1000, 2),
+        "spec_diff": diff.summary() if diff is not None else None,
+        "environment_analysis": env_analysis,
+        "setup_message": _build_setup_message(env_analysis),
+    }
+
+
 @mcp.tool()
 async def set_env_vars(params: SetEnvVarsParams) -> Dict[str, Any]:
     """
@@ -551,12 +1035,12 @@ async def set_env_vars(params: SetEnvVarsParams) -> Dict[str, Any]:
         }
 
     try:
-        # Analyze the specification for environment variables
-        env_analysis = analyze_required_env_vars(
-            current_session.spec_content,
-            current_session.spec_type,
-            "",  # base_url will be extracted from spec_content
-        )
+        # The analysis is made while ingesting; older sessions compute it once
+        env_analysis = current_session.env_analysis
+        if env_analysis is None:
+            env_analysis = current_session.env_analysis = analyze_required_env_vars(
+                current_session.spec_content, current_session.spec_type
+            )
 
         # Check which variables are already set
         current_vars = current_session.env_vars
@@ -753,11 +1237,17 @@ async def generate_scenarios(params: GenerateScenariosParams) -> Dict[str, Any]:
     Args:
         include_negative_tests: Whether to include negative test scenarios
         include_edge_cases: Whether to include edge case scenarios
+        payload_sizes: Body sizes of the large payload scenarios (bytes or
+                  strings such as "64KB"), 1 KB and 1 MB by default
+        incremental: After an incremental ingest, keep the scenarios of unchanged
+                  endpoints (and their ids) and only generate for added or changed ones.
+                  Applies to the first generation after the ingest, and only when it
+                  uses the options the carried scenarios were generated with
 
     Returns:
         Dictionary with generated scenarios information including file paths
     """
-    global current_session
+    global current_session, session_catalog
 
     if not current_session:
         return {
@@ -766,30 +1256,78 @@ async def generate_scenarios(params: GenerateScenariosParams) -> Dict[str, Any]:
         }
 
     try:
-        # Parse endpoints from session
-        parser = SpecificationParser()
-        endpoints = parser.parse(
-            json.dumps(current_session.spec_content), current_session.spec_type
-        )
+        session_catalog = _session_catalog()
+
+        try:
+            payload_sizes = parse_sizes(params.payload_sizes)
+        except ValueError as e:
+            return {"success": False, "error": str(e)}
+
+        endpoints = session_catalog.endpoints
+        session_catalog.reset_scenarios()
 
         # Generate scenarios
-        generator = ScenarioGenerator()
+        generator = ScenarioGenerator(
+            current_session.spec_content,
+            params.boundary_budget,
+            params.pairwise_budget,
+            payload_sizes,
+        )
         progress = ProgressTracker(len(endpoints), "Scenario Generation")
         progress.start()
 
+        # Unchanged endpoints of an incremental ingest keep their scenarios
+        # when they were generated with the same options
+        scenario_context = (
+            params.include_negative_tests,
+            params.include_edge_cases,
+            params.boundary_budget,
+            params.pairwise_budget,
+            tuple(payload_sizes),
+        )
+        carried = {}
+        if session_diff is not None:
+            reusable = session_diff.reusable_scenarios(scenario_context)
+            if params.incremental:
+                carried = reusable
+        reused_count = 0
+
         scenarios = []
-        for endpoint in endpoints:
+        for endpoint_index, endpoint in enumerate(endpoints):
+            records = carried.get(endpoint_index)
+            if records is not None:
+                session_catalog.link_scenarios(records)
+                scenarios.extend(records)
+                reused_count += len(records)
+                progress.update(
+                    f"Reused scenarios for {endpoint.method} {endpoint.path}"
+                )
+                continue
+
             # Generate positive scenario
-            positive_scenario = generator._generate_positive_scenario(endpoint)
-            scenarios.append(positive_scenario)
+            endpoint_scenarios = [generator._generate_positive_scenario(endpoint)]
+            endpoint_scenarios.extend(generator._generate_pairwise_scenarios(endpoint))
 
             if params.include_negative_tests:
                 negative_scenarios = generator._generate_negative_scenarios(endpoint)
-                scenarios.extend(negative_scenarios)
+                endpoint_scenarios.extend(negative_scenarios)
 
             if params.include_edge_cases:
                 edge_scenarios = generator._generate_edge_case_scenarios(endpoint)
-                scenarios.extend(edge_scenarios)
+                endpoint_scenarios.extend(edge_scenarios)
+
+            # Keep compact records that refer to the endpoint by catalog index
+            records = [
+                ScenarioRecord.from_model(scenario, endpoint_index, endpoints)
+                for scenario in endpoint_scenarios
+            ]
+            for record in records:
+                if record.id in session_catalog.scenarios.by_id:
+                    # Exact duplicate endpoints (e.g. repeated Postman requests)
+                    # share a signature; their position tells them apart
+                    record.id = generate_stable_id(record.id, endpoint_index)
+            session_catalog.link_scenarios(records)
+            scenarios.extend(records)
 
             progress.update(
                 f"Generated scenarios for {endpoint.method} {endpoint.path}"
@@ -797,9 +1335,13 @@ async def generate_scenarios(params: GenerateScenariosParams) -> Dict[str, Any]:
 
         # Save scenarios to session
         current_session.scenarios = scenarios
+        current_session.scenario_context = scenario_context
 
-        # Prepare scenarios data for serialization
-        scenarios_data = [scenario.model_dump() for scenario in scenarios]
+        # Prepare scenarios data for serialization; each endpoint is written once
+        scenarios_data = {
+            "endpoints": [endpoint.model_dump() for endpoint in endpoints],
+            "scenarios": [scenario.to_dict() for scenario in scenarios],
+        }
 
         # Dynamically ensure scenarios directory exists in workspace
         scenarios_dir = ensure_workspace_output_dir("scenarios")
@@ -825,11 +1367,14 @@ async def generate_scenarios(params: GenerateScenariosParams) -> Dict[str, Any]:
             "success": True,
             "session_id": current_session.id,
             "scenarios_count": len(scenarios),
+            "reused_scenarios_count": reused_count,
+            "pairwise_coverage": coverage_summary(generator.pairwise_coverage),
             "scenarios": [
                 {
                     "id": scenario.id,
                     "name": scenario.name,
                     "objective": scenario.objective,
+                    "kind": scenario.kind,
                     "endpoint": f"{scenario.endpoint.method} {scenario.endpoint.path}",
                     "steps_count": len(scenario.steps),
                     "assertions_count": len(scenario.assertions),
@@ -871,9 +1416,22 @@ async def generate_test_cases(params: GenerateTestCasesParams) -> Dict[str, Any]
 
     Args:
         scenario_ids: Optional list of specific scenario IDs to generate test cases for
+        tags, methods, path_glob, operation_ids: Optional endpoint selectors. A path glob
+                  supports * within a segment, ** across segments and concrete paths
+                  such as /pets/42 matching the template /pets/{petId}.
+        incremental: After an incremental ingest, reuse the test cases of carried-over
+                  scenarios instead of generating them again
+        max_tests_per_file: Split the test code into numbered files of at most this
+                  many test cases each; by default everything goes into one file
+        shard_by: Split the suite into one file per shard for parallel runners:
+                  "tag" (first endpoint tag), "path_prefix" (leading path segments,
+                  see shard_path_depth) or "balanced" (shard_count shards of similar
+                  duration, using execution times recorded by run_api_tests)
+        shard_count: Number of shards for shard_by="balanced"
 
     Returns:
-        Dictionary with generated test cases information including generated code and file paths.
+        Dictionary with generated test cases information and file paths. The suite code is
+        written to one file; use get_test_case_code for the code of single test cases.
         Uses the preferred_language and preferred_framework from the active session (set during ingest_spec).
     """
     global current_session
@@ -890,21 +1448,20 @@ async def generate_test_cases(params: GenerateTestCasesParams) -> Dict[str, Any]
             "error": "No scenarios available. Please generate scenarios first.",
         }
 
-    try:
-        # Filter scenarios if specific IDs provided
-        scenarios_to_process = current_session.scenarios
-        if params.scenario_ids:
-            scenarios_to_process = [
-                scenario
-                for scenario in current_session.scenarios
-                if scenario.id in params.scenario_ids
-            ]
+    layout_error = _suite_layout_error(params)
+    if layout_error:
+        return {"success": False, "error": layout_error}
 
-            if not scenarios_to_process:
-                return {
-                    "success": False,
-                    "error": "No matching scenarios found for provided IDs",
-                }
+    try:
+        # Resolve scenario IDs and endpoint selectors through the catalog indexes
+        scenarios_to_process = session_catalog.select_scenarios(
+            params.scenario_ids, **_endpoint_selectors(params)
+        )
+        if not scenarios_to_process:
+            return {
+                "success": False,
+                "error": "No matching scenarios found for provided IDs or selectors",
+            }
 
         # Use session's preferred language and framework (set during ingest_spec)
         language = current_session.preferred_language
@@ -916,23 +1473,51 @@ async def generate_test_cases(params: GenerateTestCasesParams) -> Dict[str, Any]
         # Generate test cases
         base_url = current_session.env_vars.get("baseUrl", "")
         generator = TestCaseGenerator(
-            base_url, current_session.env_vars, language, framework
+            base_url,
+            current_session.env_vars,
+            language,
+            framework,
+            seed=current_session.seed,
         )
 
+        # Test cases carried over by an incremental ingest are reused when they
+        # were generated for the same language, framework, variables and seed
+        carried = {}
+        if (
+            params.incremental
+            and session_diff is not None
+            and session_diff.test_case_context
+            == (language, framework, current_session.env_vars, current_session.seed)
+        ):
+            carried = session_diff.test_cases
+        reused_count = 0
+
         progress = ProgressTracker(len(scenarios_to_process), "Test Case Generation")
         progress.start()
 
         test_cases = []
         for scenario in scenarios_to_process:
-            test_case = generator._scenario_to_test_case(scenario)
-            test_cases.append(test_case)
+            records = carried.get(scenario.id)
+            if records is not None:
+                test_cases.extend(records)
+                reused_count += len(records)
+                progress.update(f"Reused test case for {scenario.name}")
+                continue
+
+            # Per-test-case code is rendered on request by get_test_case_code
+            test_case = generator._scenario_to_test_case(scenario, render_code=False)
+            test_cases.append(
+                TestCaseRecord.from_model(test_case, scenario.endpoint_index)
+            )
             progress.update(f"Generated test case for {scenario.name}")
 
         # Save test cases to session
         current_session.test_cases = test_cases
+        session_catalog.reset_test_cases()
+        session_catalog.link_test_cases(test_cases)
 
         # Prepare test cases data for serialization
-        test_cases_data = [test_case.model_dump() for test_case in test_cases]
+        test_cases_data = [test_case.to_dict() for test_case in test_cases]
 
         # Dynamically ensure test_cases directory exists in workspace
         test_cases_dir = ensure_workspace_output_dir("test_cases")
@@ -957,6 +1542,7 @@ async def generate_test_cases(params: GenerateTestCasesParams) -> Dict[str, Any]
         # Also generate and save the actual test code files to workspace
         code_files_created = []
         code_files_failed = []
+        shards_summary = []
         try:
             # Generate test code using the test case generator
             session_info = {
@@ -965,35 +1551,42 @@ async def generate_test_cases(params: GenerateTestCasesParams) -> Dict[str, Any]
                 "auth_token": current_session.env_vars.get("auth_bearer", ""),
             }
 
-            test_code = generator.code_generator.generate_test_code(
-                test_cases, session_info
-            )
-
-            # Determine appropriate filename based on language/framework
-            if language == TestLanguage.PYTHON:
-                if framework == TestFramework.PYTEST:
-                    code_filename = f"test_api_{current_session.id}.py"
-                else:
-                    code_filename = f"api_tests_{current_session.id}.py"
-            elif language == TestLanguage.TYPESCRIPT:
-                if framework == TestFramework.PLAYWRIGHT:
-                    code_filename = f"api_tests_{current_session.id}.spec.ts"
-                else:
-                    code_filename = f"api_tests_{current_session.id}.test.ts"
-            elif language == TestLanguage.JAVASCRIPT:
-                if framework == TestFramework.CYPRESS:
-                    code_filename = f"api_tests_{current_session.id}.cy.js"
-                else:
-                    code_filename = f"api_tests_{current_session.id}.test.js"
-            else:
-                code_filename = f"api_tests_{current_session.id}.txt"
-
-            # Save the code file to workspace root
-            code_file_path = os.path.join(workspace_dir, code_filename)
-            with open(code_file_path, "w", encoding="utf-8") as f:
-                f.write(test_code)
-            code_files_created.append(code_file_path)
-            logger.info(f"Successfully saved test code to workspace: {code_file_path}")
+            # Shard the suite for parallel runners when requested
+            durations: Dict[str, float] = {}
+            if params.shard_by:
+                durations = load_durations(
+                    os.path.join(test_cases_dir, DURATIONS_FILENAME)
+                )
+            shards = _shard_suite(test_cases, params, durations)
+
+            # Stream the code into the workspace root
+            for shard, shard_cases in shards.items():
+                shard_files = []
+                for code_filename, file_cases in _plan_code_files(
+                    shard_cases, params, language, framework, current_session.id, shard
+                ):
+                    code_file_path = os.path.join(workspace_dir, code_filename)
+                    with open(code_file_path, "w", encoding="utf-8") as f:
+                        generator.code_generator.write_test_code(
+                            file_cases, session_info, f
+                        )
+                    shard_files.append(code_file_path)
+                    logger.info(
+                        f"Successfully saved test code to workspace: {code_file_path}"
+                    )
+                code_files_created.extend(shard_files)
+
+                if shard is not None:
+                    shards_summary.append(
+                        {
+                            "name": shard,
+                            "test_cases_count": len(shard_cases),
+                            "recorded_duration": estimate_duration(
+                                shard_cases, durations
+                            ),
+                            "files": [os.path.basename(f) for f in shard_files],
+                        }
+                    )
 
         except Exception as e:
             error_msg = f"Failed to generate test code file: {str(e)}"
@@ -1002,12 +1595,20 @@ async def generate_test_cases(params: GenerateTestCasesParams) -> Dict[str, Any]
 
         progress.finish()
 
+        # Remembered so generate_project_files copies every file and configures
+        # the runner for the shards
+        current_session.code_files = code_files_created
+        current_session.shard_count = len(shards_summary) or None
+
         return {
             "success": True,
             "session_id": current_session.id,
             "language": language_str,
             "framework": framework_str,
             "test_cases_count": len(test_cases),
+            "reused_test_cases_count": reused_count,
+            "shard_by": params.shard_by,
+            "shards": shards_summary,
             "test_cases": [
                 {
                     "id": test_case.id,
@@ -1019,14 +1620,13 @@ async def generate_test_cases(params: GenerateTestCasesParams) -> Dict[str, Any]
                     "assertions_count": len(test_case.assertions),
                     "language": test_case.language.value,
                     "framework": test_case.framework.value,
-                    "has_generated_code": bool(test_case.generated_code),
                 }
                 for test_case in test_cases
             ],
             "test_cases_file": test_cases_file,
             "workspace_directory": workspace_dir,
             "test_cases_directory": test_cases_dir,
-            "generated_code_available": all(tc.generated_code for tc in test_cases),
+            "generated_code_available": bool(code_files_created),
             "file_created": test_cases_file_created,
             "file_path": (
                 test_cases_file if test_cases_file_created else "Failed to create"
@@ -1057,6 +1657,225 @@ async def generate_test_cases(params: GenerateTestCasesParams) -> Dict[str, Any]
         }
 
 
+@mcp.tool()
+async def get_test_case_code(params: GetTestCaseCodeParams) -> Dict[str, Any]:
+    """
+    Get the standalone test code of individual test cases.
+
+    Code is rendered when first requested and kept with the test case, so
+    generate_test_cases only has to render the suite file.
+
+    Args:
+        test_case_ids: Optional list of specific test case IDs
+        tags, methods, path_glob, operation_ids, services: Optional endpoint selectors
+
+    Returns:
+        Dictionary with the generated code of each matching test case
+    """
+    if not current_session:
+        return {
+            "success": False,
+            "error": "No active session. Please ingest a specification first.",
+        }
+
+    if not current_session.test_cases:
+        return {
+            "success": False,
+            "error": "No test cases available. Please generate test cases first.",
+        }
+
+    try:
+        test_cases = session_catalog.select_test_cases(
+            params.test_case_ids, **_endpoint_selectors(params)
+        )
+        if not test_cases:
+            return {
+                "success": False,
+                "error": "No matching test cases found for provided IDs or selectors",
+            }
+
+        base_url = current_session.env_vars.get("baseUrl", "")
+        generators: Dict[tuple, TestCaseGenerator] = {}
+        rendered_count = 0
+        for test_case in test_cases:
+            if test_case.generated_code is None:
+                key = (test_case.language, test_case.framework)
+                if key not in generators:
+                    generators[key] = TestCaseGenerator(
+                        base_url, current_session.env_vars, *key
+                    )
+                test_case.generated_code = generators[key].render_test_case_code(
+                    test_case
+                )
+                rendered_count += 1
+
+        return {
+            "success": True,
+            "session_id": current_session.id,
+            "test_cases_count": len(test_cases),
+            "rendered_count": rendered_count,
+            "test_cases": [
+                {
+                    "id": test_case.id,
+                    "scenario_id": test_case.scenario_id,
+                    "name": test_case.name,
+                    "language": test_case.language.value,
+                    "framework": test_case.framework.value,
+                    "generated_code": test_case.generated_code,
+                }
+                for test_case in test_cases
+            ],
+        }
+
+    except Exception as e:
+        error_details = extract_error_details(e)
+        logger.error(f"Failed to render test case code: {error_details}")
+        return {
+            "success": False,
+            "error": f"Failed to render test case code: {error_details['message']}",
+        }
+
+
+@mcp.tool()
+async def generate_test_code_batch(
+    params: GenerateTestCodeBatchParams,
+) -> Dict[str, Any]:
+    """
+    Render the test suite for several language/framework combinations, or as
+    several shards, in parallel worker processes.
+
+    Rendering runs outside the event loop, so other tool calls are served while
+    a large batch is written.
+
+    Args:
+        combinations: "language/framework" pairs such as "python/pytest"; all
+                  supported combinations when omitted
+        test_case_ids: Optional list of specific test case IDs
+        tags, methods, path_glob, operation_ids, services: Optional endpoint selectors
+        max_tests_per_file, shard_by, shard_count, shard_path_depth: Split each
+                  suite into files the same way generate_test_cases does
+        max_workers: Number of rendering processes (CPU count by default)
+
+    Returns:
+        Dictionary with the files written for each combination and shard
+    """
+    if not current_session:
+        return {
+            "success": False,
+            "error": "No active session. Please ingest a specification first.",
+        }
+
+    if not current_session.test_cases:
+        return {
+            "success": False,
+            "error": "No test cases available. Please generate test cases first.",
+        }
+
+    layout_error = _suite_layout_error(params)
+    if layout_error:
+        return {"success": False, "error": layout_error}
+
+    supported = [
+        f"{combination['language']}/{combination['framework']}"
+        for combination in get_supported_combinations()
+    ]
+    requested = list(dict.fromkeys(params.combinations or supported))
+    unsupported = [name for name in requested if name not in supported]
+    if unsupported:
+        return {
+            "success": False,
+            "error": f"Unsupported combinations: {', '.join(unsupported)}. "
+            f"Use any of: {', '.join(supported)}",
+        }
+
+    try:
+        test_cases = session_catalog.select_test_cases(
+            params.test_case_ids, **_endpoint_selectors(params)
+        )
+        if not test_cases:
+            return {
+                "success": False,
+                "error": "No matching test cases found for provided IDs or selectors",
+            }
+
+        durations: Dict[str, float] = {}
+        if params.shard_by:
+            durations = load_durations(
+                os.path.join(
+                    ensure_workspace_output_dir("test_cases"), DURATIONS_FILENAME
+                )
+            )
+        shards = _shard_suite(test_cases, params, durations)
+
+        workspace_dir = get_workspace_dir()
+        session_info = {
+            "id": current_session.id,
+            "base_url": current_session.env_vars.get("baseUrl", ""),
+            "auth_token": current_session.env_vars.get("auth_bearer", ""),
+        }
+
+        jobs = []
+        job_shards = []
+        for name in requested:
+            language_str, framework_str = name.split("/")
+            language = TestLanguage(language_str)
+            framework = TestFramework(framework_str)
+            for shard, shard_cases in shards.items():
+                for code_filename, file_cases in _plan_code_files(
+                    shard_cases, params, language, framework, current_session.id, shard
+                ):
+                    jobs.append(
+                        (
+                            language,
+                            framework,
+                            file_cases,
+                            session_info,
+                            os.path.join(workspace_dir, code_filename),
+                        )
+                    )
+                    job_shards.append(shard)
+
+        started = time.time()
+        results = await write_test_code_files(jobs, params.max_workers)
+        elapsed = time.time() - started
+
+        files_written = []
+        files_failed = []
+        for shard, result in zip(job_shards, results):
+            result["shard"] = shard
+            if "error" in result:
+                files_failed.append(result)
+                logger.error(
+                    f"Failed to write test code {result['file_path']}: {result['error']}"
+                )
+            else:
+                files_written.append(result)
+
+        return {
+            "success": bool(files_written),
+            "session_id": current_session.id,
+            "combinations": requested,
+            "test_cases_count": len(test_cases),
+            "shards": [shard for shard in shards if shard is not None],
+            "workspace_directory": workspace_dir,
+            "code_files_created": [result["file_path"] for result in files_written],
+            "files": files_written,
+            "files_failed": files_failed,
+            "elapsed_time": round(elapsed, 3),
+            "message": f"Wrote {len(files_written)} test code files for "
+            f"{len(requested)} combinations"
+            + (f" | Failed: {len(files_failed)}" if files_failed else ""),
+        }
+
+    except Exception as e:
+        error_details = extract_error_details(e)
+        logger.error(f"Failed to generate test code batch: {error_details}")
+        return {
+            "success": False,
+            "error": f"Failed to generate test code batch: {error_details['message']}",
+        }
+
+
 @mcp.tool()
 async def run_api_tests(params: RunApiTestsParams) -> Dict[str, Any]:
     """
@@ -1065,7 +1884,12 @@ async def run_api_tests(params: RunApiTestsParams) -> Dict[str, Any]:
     Args:
         test_case_ids: Optional list of specific test case IDs to run.
                       If not provided, runs all test cases.
+        tags, methods, path_glob, operation_ids: Optional endpoint selectors, combined
+                      with test_case_ids when both are given.
         max_concurrent: Maximum number of concurrent requests (default: 10)
+        report_mode: "full" for a single HTML report, "paginated" for a small
+                      HTML page that loads its rows from a compressed data file,
+                      or "auto" to paginate above 10000 results (default)
 
     Returns:
         Dictionary with test execution results and report information
@@ -1084,21 +1908,23 @@ async def run_api_tests(params: RunApiTestsParams) -> Dict[str, Any]:
             "error": "No test cases available. Please generate test cases first.",
         }
 
-    try:
-        # Filter test cases if specific IDs provided
-        test_cases_to_run = current_session.test_cases
-        if params.test_case_ids:
-            test_cases_to_run = [
-                test_case
-                for test_case in current_session.test_cases
-                if test_case.id in params.test_case_ids
-            ]
+    if params.report_mode not in REPORT_MODES:
+        return {
+            "success": False,
+            "error": f"Invalid report_mode '{params.report_mode}', use one of: "
+            f"{', '.join(REPORT_MODES)}",
+        }
 
-            if not test_cases_to_run:
-                return {
-                    "success": False,
-                    "error": "No matching test cases found for provided IDs",
-                }
+    try:
+        # Resolve test case IDs and endpoint selectors through the catalog indexes
+        test_cases_to_run = session_catalog.select_test_cases(
+            params.test_case_ids, **_endpoint_selectors(params)
+        )
+        if not test_cases_to_run:
+            return {
+                "success": False,
+                "error": "No matching test cases found for provided IDs or selectors",
+            }
 
         # Execute tests
         current_session.status = StatusType.RUNNING
@@ -1108,17 +1934,50 @@ async def run_api_tests(params: RunApiTestsParams) -> Dict[str, Any]:
         current_session.status = StatusType.COMPLETED
         current_session.completed_at = datetime.now().isoformat()
 
-        # Generate HTML report
-        html_report = report_generator.generate_api_test_report(
-            test_results, current_session
-        )
+        # Stream the HTML report to disk off the event loop
         reports_dir = ensure_workspace_output_dir("reports")
         report_file = os.path.join(
             reports_dir, f"api_test_report_{current_session.id}.html"
         )
+        report_mode = params.report_mode
+        if report_mode == "auto":
+            report_mode = (
+                "paginated"
+                if len(test_results) > PAGINATED_REPORT_THRESHOLD
+                else "full"
+            )
+        report_data_file = None
+        if report_mode == "paginated":
+            report_data_file = await asyncio.to_thread(
+                report_generator.write_paginated_api_test_report,
+                test_results,
+                current_session,
+                report_file,
+            )
+        else:
+            await asyncio.to_thread(
+                report_generator.write_api_test_report,
+                test_results,
+                current_session,
+                report_file,
+            )
+        exports = await asyncio.to_thread(
+            report_generator.write_api_test_exports,
+            test_results,
+            test_cases_to_run,
+            current_session,
+            reports_dir,
+        )
 
-        with open(report_file, "w", encoding="utf-8") as f:
-            f.write(html_report)
+        # Execution times balance the shards of later generate_test_cases calls
+        durations_file = os.path.join(
+            ensure_workspace_output_dir("test_cases"), DURATIONS_FILENAME
+        )
+        try:
+            record_durations(durations_file, test_results)
+        except Exception as e:
+            logger.warning(f"Failed to record test durations: {str(e)}")
+            durations_file = None
 
         # Calculate summary statistics
         total_tests = len(test_results)
@@ -1142,6 +2001,12 @@ async def run_api_tests(params: RunApiTestsParams) -> Dict[str, Any]:
                 ),
             },
             "report_file": report_file,
+            "report_mode": report_mode,
+            "report_data_file": report_data_file,
+            "export_files": exports,
+            "durations_file": durations_file,
+            # Throughput and server behaviour of each large payload size step
+            "payload_results": payload_summary(test_cases_to_run, test_results),
             "detailed_results": [
                 {
                     "test_case_id": result.test_case_id,
@@ -1151,6 +2016,8 @@ async def run_api_tests(params: RunApiTestsParams) -> Dict[str, Any]:
                     "assertions_passed": result.assertions_passed,
                     "assertions_failed": result.assertions_failed,
                     "error_message": result.error_message,
+                    "request_bytes": result.request_bytes,
+                    "upload_throughput": result.upload_throughput,
                 }
                 for result in test_results
             ],
@@ -1173,7 +2040,10 @@ async def run_load_tests(params: RunLoadTestsParams) -> Dict[str, Any]:
 
     Args:
         test_case_ids: Optional list of specific test case IDs to use for load testing.
-                      If not provided, uses all test cases.
+                      If not provided, uses all test cases. Large payload test cases
+                      only run when listed here.
+        tags, methods, path_glob, operation_ids: Optional endpoint selectors, combined
+                      with test_case_ids when both are given.
         duration: Duration of load test in seconds (default: 60)
         users: Number of concurrent users (default: 10)
         ramp_up: Ramp up time in seconds (default: 10)
@@ -1196,19 +2066,35 @@ async def run_load_tests(params: RunLoadTestsParams) -> Dict[str, Any]:
         }
 
     try:
-        # Filter test cases if specific IDs provided
-        test_cases_to_run = current_session.test_cases
-        if params.test_case_ids:
+        # Resolve test case IDs and endpoint selectors through the catalog indexes
+        test_cases_to_run = session_catalog.select_test_cases(
+            params.test_case_ids, **_endpoint_selectors(params)
+        )
+        if not test_cases_to_run:
+            return {
+                "success": False,
+                "error": "No matching test cases found for provided IDs or selectors",
+            }
+
+        # Large payload test cases would upload their body on every pass of
+        # every virtual user; they only run when listed in test_case_ids
+        listed = set(params.test_case_ids or ())
+        skipped_payload_count = sum(
+            1
+            for test_case in test_cases_to_run
+            if test_case.payload_size and test_case.id not in listed
+        )
+        if skipped_payload_count:
             test_cases_to_run = [
                 test_case
-                for test_case in current_session.test_cases
-                if test_case.id in params.test_case_ids
+                for test_case in test_cases_to_run
+                if not test_case.payload_size or test_case.id in listed
             ]
-
             if not test_cases_to_run:
                 return {
                     "success": False,
-                    "error": "No matching test cases found for provided IDs",
+                    "error": "Only large payload test cases matched. List them in "
+                    "test_case_ids to load test them.",
                 }
 
         # Execute load test
@@ -1221,23 +2107,31 @@ async def run_load_tests(params: RunLoadTestsParams) -> Dict[str, Any]:
         if "error" in load_test_results:
             return {"success": False, "error": load_test_results["error"]}
 
-        # Generate HTML report
-        html_report = report_generator.generate_load_test_report(
-            load_test_results, current_session
-        )
+        # Stream the HTML report to disk off the event loop
         reports_dir = ensure_workspace_output_dir("reports")
         report_file = os.path.join(
             reports_dir, f"load_test_report_{current_session.id}.html"
         )
-
-        with open(report_file, "w", encoding="utf-8") as f:
-            f.write(html_report)
+        await asyncio.to_thread(
+            report_generator.write_load_test_report,
+            load_test_results,
+            current_session,
+            report_file,
+        )
+        exports = await asyncio.to_thread(
+            report_generator.write_load_test_exports,
+            load_test_results,
+            current_session,
+            reports_dir,
+        )
 
         return {
             "success": True,
             "session_id": current_session.id,
             "load_test_results": load_test_results,
+            "skipped_payload_test_cases": skipped_payload_count,
             "report_file": report_file,
+            "export_files": exports,
         }
 
     except Exception as e:
@@ -1249,6 +2143,149 @@ async def run_load_tests(params: RunLoadTestsParams) -> Dict[str, Any]:
         }
 
 
+@mcp.tool()
+async def run_fuzz_tests(params: RunFuzzTestsParams) -> Dict[str, Any]:
+    """
+    Fuzz the API with mutated versions of valid requests.
+
+    Each endpoint contributes one schema-valid request. Mutations replace one body
+    field, query parameter, header or path parameter with a value of the wrong type,
+    a huge string, tricky unicode, null or a deeply nested structure. Responses with
+    a 5xx status, timeouts and dropped connections are crashes, deduplicated by
+    signature; the smallest request reproducing each one is kept in a corpus.
+
+    Args:
+        iterations: Number of mutated requests to send (default: 1000)
+        max_concurrent: Requests in flight at once (default: 50)
+        mutators: Optional subset of the mutators to use
+        huge_string_length: Length of huge strings (default: 65536)
+        nesting_depth: Depth of nested structures (default: 256)
+        timeout: Seconds before a request counts as a hang (default: 10)
+        minimize: Shrink the reproducer of each crash (default: true)
+        seed: Mutation seed; the session seed when not given
+        tags, methods, path_glob, operation_ids, services: Optional endpoint selectors
+
+    Returns:
+        Dictionary with request statistics, distinct crashes and corpus files
+    """
+    if not current_session:
+        return {
+            "success": False,
+            "error": "No active session. Please ingest a specification first.",
+        }
+
+    mutators = params.mutators or list(FUZZ_MUTATORS)
+    unknown = [mutator for mutator in mutators if mutator not in FUZZ_MUTATORS]
+    if unknown:
+        return {
+            "success": False,
+            "error": f"Unknown mutators: {', '.join(unknown)}. "
+            f"Use any of: {', '.join(FUZZ_MUTATORS)}",
+        }
+    if params.iterations < 1 or params.max_concurrent < 1:
+        return {
+            "success": False,
+            "error": "iterations and max_concurrent must be at least 1",
+        }
+
+    try:
+        catalog = _session_catalog()
+        selected = catalog.select(**_endpoint_selectors(params))
+        endpoints = catalog.endpoints
+        indexes = range(len(endpoints)) if selected is None else selected
+        if not indexes:
+            return {
+                "success": False,
+                "error": "No endpoints match the provided selectors",
+            }
+
+        # One valid request per endpoint is the starting point of its mutations
+        scenario_generator = ScenarioGenerator(current_session.spec_content)
+        resolve = scenario_generator.parser._resolve_ref
+        test_case_generator = TestCaseGenerator(
+            current_session.env_vars.get("baseUrl", ""),
+            current_session.env_vars,
+            current_session.preferred_language,
+            current_session.preferred_framework,
+            seed=current_session.seed,
+        )
+        seeds = []
+        for index in indexes:
+            endpoint = endpoints[index]
+            scenario = scenario_generator._generate_positive_scenario(endpoint)
+            scenario.test_data = seed_test_data(endpoint, resolve)
+            test_case = test_case_generator._scenario_to_test_case(
+                scenario, render_code=False
+            )
+            seeds.append(FuzzSeed.from_test_case(test_case, endpoint))
+
+        if not urlsplit(seeds[0].path).scheme:
+            return {
+                "success": False,
+                "error": "No base URL. Please set baseUrl with set_env_vars first.",
+            }
+
+        seed = params.seed if params.seed is not None else current_session.seed
+        engine = MutationEngine(
+            seeds,
+            mutators,
+            params.huge_string_length,
+            params.nesting_depth,
+            seed=seed,
+        )
+        if not engine.seeds:
+            return {
+                "success": False,
+                "error": "The selected endpoints have no body, parameters or headers to mutate",
+            }
+
+        executor = FuzzExecutor(
+            max_concurrent=params.max_concurrent,
+            timeout=params.timeout,
+            minimize=params.minimize,
+        )
+        results = await executor.run(
+            engine.generate(params.iterations), params.iterations
+        )
+
+        fuzz_dir = ensure_workspace_output_dir("fuzz")
+        corpus_files = save_corpus(os.path.join(fuzz_dir, "corpus"), results["crashes"])
+        results_file = os.path.join(fuzz_dir, f"fuzz_results_{current_session.id}.json")
+        with open(results_file, "w", encoding="utf-8") as f:
+            json.dump({"seed": seed, **results}, f, indent=2)
+
+        return {
+            "success": True,
+            "session_id": current_session.id,
+            "seed": seed,
+            "endpoints_fuzzed": len(engine.seeds),
+            **{key: value for key, value in results.items() if key != "crashes"},
+            "crashes": [
+                {
+                    "signature": crash["signature"],
+                    "status": crash["status"],
+                    "count": crash["count"],
+                    "endpoint": crash["request"]["endpoint"],
+                    "mutator": crash["request"]["mutator"],
+                    "location": crash["request"]["location"],
+                    "field": crash["request"]["field"],
+                    "request_size": crash["request_size"],
+                }
+                for crash in results["crashes"]
+            ],
+            "corpus_files": corpus_files,
+            "results_file": results_file,
+        }
+
+    except Exception as e:
+        error_details = extract_error_details(e)
+        logger.error(f"Failed to run fuzz tests: {error_details}")
+        return {
+            "success": False,
+            "error": f"Failed to run fuzz tests: {error_details['message']}",
+        }
+
+
 @mcp.tool()
 async def get_supported_languages() -> Dict[str, Any]:
     """
@@ -1333,8 +2370,11 @@ async def generate_project_files(params: GenerateProjectParams) -> Dict[str, Any
             params.include_examples if params.include_examples is not None else True
         )
 
-        # Generate package files (dependency management, configs, etc.)
-        package_files = generate_package_files(language_enum, framework_enum)
+        # Generate package files (dependency management, configs, etc.), with
+        # the runner parallelized across the shards of a sharded suite
+        package_files = generate_package_files(
+            language_enum, framework_enum, current_session.shard_count
+        )
 
         # Reuse existing test files from project directory (created by generate_test_cases)
         project_dir = get_or_create_project_dir()
@@ -1359,6 +2399,14 @@ async def generate_project_files(params: GenerateProjectParams) -> Dict[str, Any
             else:
                 expected_test_filenames = [f"api_tests_{current_session.id}.test.js"]
 
+        # Shards and parts written by generate_test_cases take precedence
+        if current_session.code_files and all(
+            map(os.path.exists, current_session.code_files)
+        ):
+            expected_test_filenames = [
+                os.path.basename(path) for path in current_session.code_files
+            ]
+
         # Check for existing test files and reuse them
         for filename in expected_test_filenames:
             file_path = os.path.join(project_dir, filename)
@@ -1988,7 +3036,11 @@ async def get_session_status() -> Dict[str, Any]:
         "spec_type": current_session.spec_type.value,
         "created_at": current_session.created_at,
         "completed_at": current_session.completed_at,
-        "endpoints_count": len(current_session.spec_content.get("paths", {})),
+        "endpoints_count": (
+            len(session_catalog)
+            if session_catalog is not None
+            else len(current_session.spec_content.get("paths", {}))
+        ),
         "scenarios_count": len(current_session.scenarios),
         "test_cases_count": len(current_session.test_cases),
         "env_vars": current_session.env_vars,
@@ -2033,10 +3085,17 @@ async def get_report(report_id: str) -> Resource:
         with open(report_file, "r", encoding="utf-8") as f:
             content = f.read()
 
+        description = "HTML test report with detailed results and statistics"
+        if os.path.exists(report_sidecar_paths(report_file)[1]):
+            description = (
+                "Paginated HTML test report; its rows are served by "
+                f"file://reports/{report_id}/pages/{{page}}"
+            )
+
         return Resource(
             uri=f"file://reports/{report_id}",
             name=f"Test Report {report_id}",
-            description="HTML test report with detailed results and statistics",
+            description=description,
             mimeType="text/html",
             text=content,
         )
@@ -2052,6 +3111,54 @@ async def get_report(report_id: str) -> Resource:
         )
 
 
+@mcp.resource("file://reports/{report_id}/pages/{page}")
+async def get_report_page(report_id: str, page: str) -> Resource:
+    """
+    Provide one page of rows of a paginated test report.
+
+    Args:
+        report_id: The report identifier (filename without extension)
+        page: Page number, starting at 1
+
+    Returns:
+        Resource containing the page rows and pagination details as JSON
+    """
+    uri = f"file://reports/{report_id}/pages/{page}"
+    try:
+        report_file = os.path.join(
+            ensure_workspace_output_dir("reports"), f"{report_id}.html"
+        )
+        if not os.path.exists(report_sidecar_paths(report_file)[1]):
+            return Resource(
+                uri=uri,
+                name=f"Report {report_id}",
+                description="Paginated report not found",
+                mimeType="text/plain",
+                text="Paginated report not found. Only reports written with "
+                "report_mode 'paginated' (or 'auto' for large runs) have pages.",
+            )
+
+        content = await asyncio.to_thread(read_report_page, report_file, int(page))
+
+        return Resource(
+            uri=uri,
+            name=f"Test Report {report_id} page {page}",
+            description="Rows of one page of a paginated test report",
+            mimeType="application/json",
+            text=json.dumps(content, indent=2),
+        )
+
+    except Exception as e:
+        logger.error(f"Failed to load page {page} of report {report_id}: {str(e)}")
+        return Resource(
+            uri=uri,
+            name=f"Report {report_id}",
+            description="Error loading report page",
+            mimeType="text/plain",
+            text=f"Error loading report page: {str(e)}",
+        )
+
+
 # List available reports
 @mcp.resource("file://reports")
 async def list_reports() -> Resource:
@@ -2081,6 +3188,8 @@ async def list_reports() -> Resource:
                         "report_id": filename.replace(".html", ""),
                         "modified": datetime.fromtimestamp(mtime).isoformat(),
                         "size": os.path.getsize(file_path),
+                        # Rows of paginated reports are read page by page
+                        "paginated": os.path.exists(report_sidecar_paths(file_path)[1]),
                     }
                 )
 
@@ -2201,6 +3310,10 @@ def main():
 
     parser = argparse.ArgumentParser(description="API Tester MCP Server")
     parser.add_argument("--log-level", default="INFO", help="Log level")
+    parser.add_argument(
+        "--template-cache-dir",
+        help="Directory for compiled code generation templates, reused across restarts",
+    )
 
     args = parser.parse_args()
 
@@ -2209,6 +3322,10 @@ def main():
 
     logging.basicConfig(level=getattr(logging, args.log_level.upper()))
 
+    if args.template_cache_dir:
+        enable_template_bytecode_cache(args.template_cache_dir)
+        logger.info(f"Caching compiled templates in {args.template_cache_dir}")
+
     logger.info("Starting API Tester MCP Server")
 
     env_port = os.environ.get("PORT")
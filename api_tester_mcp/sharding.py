@@ -0,0 +1,171 @@
+"""Splitting generated test suites into shards for parallel test runners"""
+
+import heapq
+import json
+import os
+import re
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+from urllib.parse import urlparse
+
+from .models import ApiEndpoint, TestResult
+
+SHARD_STRATEGIES = ("tag", "path_prefix", "balanced")
+
+# Execution times of previous runs, keyed by test case id
+DURATIONS_FILENAME = "test_durations.json"
+
+_UNSAFE_NAME_CHARS = re.compile(r"[^0-9A-Za-z]+")
+
+
+def shard_name(value: str, default: str) -> str:
+    """Turn a tag or path segment into a file name friendly shard name"""
+    return _UNSAFE_NAME_CHARS.sub("_", value).strip("_").lower() or default
+
+
+def _endpoint_of(
+    test_case: Any, endpoints: Sequence[ApiEndpoint]
+) -> Optional[ApiEndpoint]:
+    index = test_case.endpoint_index
+    return endpoints[index] if index is not None else None
+
+
+def _is_template_segment(segment: str) -> bool:
+    return segment.startswith(("{", ":"))
+
+
+def shard_by_tag(
+    test_cases: Iterable[Any], endpoints: Sequence[ApiEndpoint]
+) -> Dict[str, List[Any]]:
+    """Group test cases by the first tag of their endpoint"""
+    shards: Dict[str, List[Any]] = {}
+    for test_case in test_cases:
+        endpoint = _endpoint_of(test_case, endpoints)
+        tag = endpoint.tags[0] if endpoint is not None and endpoint.tags else ""
+        shards.setdefault(shard_name(tag, "untagged"), []).append(test_case)
+    return shards
+
+
+def shard_by_path_prefix(
+    test_cases: Iterable[Any], endpoints: Sequence[ApiEndpoint], depth: int = 1
+) -> Dict[str, List[Any]]:
+    """
+    Group test cases by the first literal segments of their endpoint path.
+
+    Path parameters end the prefix, so /pets/{petId}/photos is grouped under
+    "pets" whatever the depth. Test cases without an endpoint use their URL.
+    """
+    shards: Dict[str, List[Any]] = {}
+    for test_case in test_cases:
+        endpoint = _endpoint_of(test_case, endpoints)
+        path = endpoint.path if endpoint is not None else urlparse(test_case.url).path
+        prefix = []
+        for segment in path.split("?", 1)[0].split("/"):
+            if len(prefix) == depth or _is_template_segment(segment):
+                break
+            if segment:
+                prefix.append(segment)
+        shards.setdefault(shard_name("_".join(prefix), "root"), []).append(test_case)
+    return shards
+
+
+def balance_shards(
+    test_cases: Sequence[Any],
+    shard_count: int,
+    durations: Optional[Dict[str, float]] = None,
+) -> Dict[str, List[Any]]:
+    """
+    Split test cases into shard_count shards of similar total duration.
+
+    Uses the longest-processing-time rule: test cases are taken from slowest to
+    fastest and each goes to the shard with the least work so far. Test cases
+    without a recorded duration are assumed to take the mean of the recorded
+    ones, so without any history the shards get equal test case counts.
+    Each shard keeps the original test case order.
+    """
+    durations = durations or {}
+    known = [durations[tc.id] for tc in test_cases if tc.id in durations]
+    default = sum(known) / len(known) if known else 1.0
+    estimates = [durations.get(test_case.id, default) for test_case in test_cases]
+
+    shard_count = max(1, min(shard_count, len(test_cases)))
+    loads = [(0.0, shard) for shard in range(shard_count)]
+    assigned: List[List[int]] = [[] for _ in range(shard_count)]
+
+    order = sorted(range(len(test_cases)), key=lambda i: -estimates[i])
+    for position in order:
+        load, shard = heapq.heappop(loads)
+        assigned[shard].append(position)
+        heapq.heappush(loads, (load + estimates[position], shard))
+
+    return {
+        f"shard{number}": [test_cases[i] for i in sorted(positions)]
+        for number, positions in enumerate(assigned, start=1)
+        if positions
+    }
+
+
+def shard_test_cases(
+    test_cases: Sequence[Any],
+    endpoints: Sequence[ApiEndpoint],
+    strategy: str,
+    shard_count: Optional[int] = None,
+    durations: Optional[Dict[str, float]] = None,
+    path_depth: int = 1,
+) -> Dict[str, List[Any]]:
+    """Split test cases with one of SHARD_STRATEGIES"""
+    if strategy == "tag":
+        return shard_by_tag(test_cases, endpoints)
+    if strategy == "path_prefix":
+        return shard_by_path_prefix(test_cases, endpoints, max(1, path_depth))
+    if strategy == "balanced":
+        if not shard_count or shard_count < 1:
+            raise ValueError("shard_count is required for balanced sharding")
+        return balance_shards(test_cases, shard_count, durations)
+    raise ValueError(
+        f"Unsupported shard strategy '{strategy}'. "
+        f"Use one of: {', '.join(SHARD_STRATEGIES)}"
+    )
+
+
+def estimate_duration(
+    test_cases: Iterable[Any], durations: Dict[str, float]
+) -> Optional[float]:
+    """Recorded duration of a shard, or None when none of its tests has run"""
+    recorded = [durations[tc.id] for tc in test_cases if tc.id in durations]
+    return round(sum(recorded), 3) if recorded else None
+
+
+def load_durations(file_path: str) -> Dict[str, float]:
+    """Read recorded execution times; a missing or unreadable file means none"""
+    try:
+        with open(file_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    return {
+        test_case_id: float(duration)
+        for test_case_id, duration in data.items()
+        if isinstance(duration, (int, float))
+    }
+
+
+def record_durations(file_path: str, results: Iterable[TestResult]) -> int:
+    """
+    Merge the execution times of a run into the durations file.
+
+    Test case ids are stable across sessions of the same specification, so
+    times recorded for one session balance the shards of the next.
+    Returns the number of durations written.
+    """
+    durations = load_durations(file_path)
+    count = 0
+    for result in results:
+        durations[result.test_case_id] = round(result.execution_time, 4)
+        count += 1
+
+    os.makedirs(os.path.dirname(file_path) or ".", exist_ok=True)
+    with open(file_path, "w", encoding="utf-8") as f:
+        json.dump(durations, f, indent=2, sort_keys=True)
+    return count
@@ -0,0 +1,188 @@
+"""Discovery and parallel parsing of specification directories and globs"""
+
+import asyncio
+import glob
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from .models import SpecType
+from .parsers import SpecificationParser, should_stream_spec
+from .utils import validate_spec_type
+
+SPEC_FILE_EXTENSIONS = (".json", ".yaml", ".yml", ".graphql", ".graphqls", ".gql")
+
+_GLOB_CHARS = set("*?[")
+
+# Never descended into while walking a collection directory
+_SKIPPED_DIRECTORIES = {"node_modules", "__pycache__"}
+
+# Scenario and test case files this server writes into the workspace
+_GENERATED_FILE = re.compile(r"^(?:scenarios|test_cases)_[0-9a-f-]+\.json$")
+
+# File names that say nothing about the service, e.g. billing/openapi.yaml
+_GENERIC_SPEC_NAMES = {
+    "api",
+    "collection",
+    "index",
+    "openapi",
+    "postman_collection",
+    "schema",
+    "spec",
+    "swagger",
+}
+
+
+def is_spec_collection(path: str) -> bool:
+    """Check whether an ingest path names a directory or a glob pattern"""
+    if os.path.isdir(path):
+        return True
+    return not os.path.exists(path) and bool(_GLOB_CHARS.intersection(path))
+
+
+def collection_root(path: str) -> str:
+    """
+    Directory a collection path is relative to: the directory itself, or the
+    longest leading part of a glob pattern that has no wildcards.
+    """
+    if os.path.isdir(path):
+        return os.path.abspath(path)
+
+    wildcard = min(path.index(char) for char in _GLOB_CHARS if char in path)
+    return os.path.abspath(os.path.dirname(path[:wildcard]) or ".")
+
+
+def _is_candidate_file(filename: str) -> bool:
+    return filename.lower().endswith(
+        SPEC_FILE_EXTENSIONS
+    ) and not _GENERATED_FILE.match(filename)
+
+
+def discover_spec_files(path: str) -> List[str]:
+    """List the candidate specification files of a directory or glob pattern"""
+    if not os.path.isdir(path):
+        return sorted(
+            os.path.abspath(match)
+            for match in glob.glob(path, recursive=True)
+            if os.path.isfile(match) and _is_candidate_file(os.path.basename(match))
+        )
+
+    files = []
+    for directory, subdirectories, filenames in os.walk(os.path.abspath(path)):
+        subdirectories[:] = sorted(
+            name
+            for name in subdirectories
+            if not name.startswith(".") and name not in _SKIPPED_DIRECTORIES
+        )
+        files.extend(
+            os.path.join(directory, filename)
+            for filename in sorted(filenames)
+            if _is_candidate_file(filename)
+        )
+    return files
+
+
+def assign_service_names(files: List[str], root: str) -> Dict[str, str]:
+    """
+    Name the service each file describes.
+
+    The file name is used without extensions unless it is generic (openapi.yaml,
+    schema.graphql, ...), in which case the parent directory names the service.
+    Names that would collide fall back to the path relative to the root.
+    """
+    names = {}
+    for file_path in files:
+        relative = os.path.relpath(file_path, root)
+        directory, filename = os.path.split(relative)
+        stem = filename.split(".", 1)[0]
+        if stem.lower() in _GENERIC_SPEC_NAMES and directory:
+            stem = os.path.basename(directory)
+        names[file_path] = stem
+
+    counts: Dict[str, int] = {}
+    for name in names.values():
+        counts[name] = counts.get(name, 0) + 1
+
+    for file_path, name in names.items():
+        if counts[name] > 1:
+            relative = os.path.relpath(file_path, root)
+            names[file_path] = relative.split(".", 1)[0].replace(os.sep, "/")
+
+    return names
+
+
+def parse_spec_file(file_path: str, service: str) -> Dict[str, Any]:
+    """
+    Detect and parse one file of a collection.
+
+    Runs in a worker process, so only picklable values are returned: the
+    endpoints tagged with their service and a summary of the file. The parsed
+    document is dropped once its environment variables have been analyzed.
+    Files that are not API specifications are reported as skipped.
+    """
+    started = time.perf_counter()
+    result: Dict[str, Any] = {
+        "file_path": file_path,
+        "service": service,
+        "spec_type": None,
+        "endpoints": [],
+    }
+
+    try:
+        parser = SpecificationParser()
+        if should_stream_spec(file_path):
+            spec_type = SpecType.OPENAPI
+            endpoints = list(parser.iter_openapi_file(file_path, spec_type))
+        else:
+            with open(file_path, "r", encoding="utf-8") as file:
+                content = file.read()
+
+            detected_type = validate_spec_type(content)
+            if not detected_type:
+                result["skipped"] = "Not an OpenAPI, Postman or GraphQL specification"
+                return result
+
+            spec_type = SpecType(detected_type)
+            endpoints = parser.parse(content, spec_type)
+
+        for endpoint in endpoints:
+            endpoint.service = service
+
+        result.update(
+            spec_type=spec_type.value,
+            base_url=parser.base_url,
+            endpoints=endpoints,
+            environment_analysis=parser.analyze_env_vars(),
+        )
+    except Exception as e:
+        result["error"] = str(e)
+    finally:
+        result["parse_time_ms"] = round((time.perf_counter() - started) * 1000, 2)
+
+    return result
+
+
+async def parse_spec_files(
+    service_names: Dict[str, str], max_workers: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    Parse the files of a collection, in a process pool when there is more than
+    one file and more than one worker. Results keep the order of service_names.
+    """
+    workers = min(len(service_names), max_workers or os.cpu_count() or 1)
+    if workers <= 1:
+        return [
+            parse_spec_file(file_path, service)
+            for file_path, service in service_names.items()
+        ]
+
+    loop = asyncio.get_running_loop()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return await asyncio.gather(
+            *(
+                loop.run_in_executor(pool, parse_spec_file, file_path, service)
+                for file_path, service in service_names.items()
+            )
+        )
@@ -0,0 +1,163 @@
+"""Structural diff between two ingests of a specification"""
+
+import hashlib
+import json
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .models import ApiEndpoint
+from .records import ScenarioRecord, TestCaseRecord
+
+# Documentation-only fields; they do not affect generated scenarios or tests
+DOCUMENTATION_FIELDS = ("summary", "description")
+
+EndpointKey = Tuple[str, ...]
+
+
+def endpoint_fingerprint(
+    endpoint: ApiEndpoint, ignore_fields: Iterable[str] = DOCUMENTATION_FIELDS
+) -> str:
+    """Hash of the endpoint content, independent of dict ordering"""
+    content = json.dumps(
+        endpoint.model_dump(exclude=set(ignore_fields)),
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.blake2b(content.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def endpoint_keys(endpoints: Iterable[ApiEndpoint]) -> List[EndpointKey]:
+    """
+    Identity of each endpoint across ingests: service, method and path.
+
+    GraphQL operations and duplicated Postman requests share method and path, so
+    repeated keys are told apart by operation id, or by their occurrence count
+    when there is none.
+    """
+    keys = []
+    seen: Dict[EndpointKey, int] = {}
+    for endpoint in endpoints:
+        key: EndpointKey = (
+            endpoint.service or "",
+            endpoint.method.upper(),
+            endpoint.path,
+        )
+        occurrences = seen.get(key, 0)
+        seen[key] = occurrences + 1
+        if occurrences:
+            key += (endpoint.operation_id or f"#{occurrences}",)
+        keys.append(key)
+    return keys
+
+
+def format_endpoint_key(key: EndpointKey) -> str:
+    service, method, path = key[:3]
+    label = f"{method} {path}"
+    if service:
+        label = f"[{service}] {label}"
+    if len(key) > 3:
+        label += f" ({key[3]})"
+    return label
+
+
+class SpecDiff:
+    """
+    Endpoint-level changes between the previous and the new endpoint set.
+
+    Endpoints are matched by endpoint_keys() and compared by fingerprint.
+    Indexes refer to positions in the respective endpoint lists, which are the
+    catalog positions scenario and test case records use.
+    """
+
+    def __init__(
+        self,
+        old_endpoints: Sequence[ApiEndpoint],
+        new_endpoints: Sequence[ApiEndpoint],
+        ignore_fields: Iterable[str] = DOCUMENTATION_FIELDS,
+    ):
+        ignore_fields = tuple(ignore_fields)
+        old_keys = endpoint_keys(old_endpoints)
+        new_keys = endpoint_keys(new_endpoints)
+        old_index = {key: index for index, key in enumerate(old_keys)}
+
+        self.added: List[int] = []
+        self.changed: Dict[int, int] = {}  # new index -> old index
+        self.unchanged: Dict[int, int] = {}  # new index -> old index
+        for new_index, key in enumerate(new_keys):
+            index = old_index.pop(key, None)
+            if index is None:
+                self.added.append(new_index)
+            elif endpoint_fingerprint(
+                old_endpoints[index], ignore_fields
+            ) == endpoint_fingerprint(new_endpoints[new_index], ignore_fields):
+                self.unchanged[new_index] = index
+            else:
+                self.changed[new_index] = index
+        self.removed: List[int] = sorted(old_index.values())
+
+        self._old_keys = old_keys
+        self._new_keys = new_keys
+
+        # Records of unchanged endpoints, filled by carry_over()
+        self.scenarios: Dict[int, List[ScenarioRecord]] = {}
+        self.test_cases: Dict[str, List[TestCaseRecord]] = {}
+        self.scenario_context: Optional[Tuple[Any, ...]] = None
+        self.test_case_context: Optional[Tuple[Any, ...]] = None
+
+    def carry_over(
+        self,
+        scenarios: Iterable[ScenarioRecord],
+        test_cases: Iterable[TestCaseRecord],
+        endpoints: List[ApiEndpoint],
+        scenario_context: Optional[Tuple[Any, ...]],
+        test_case_context: Tuple[Any, ...],
+    ):
+        """
+        Relink the previous session's records of unchanged endpoints to the new
+        endpoint table, keeping their ids.
+
+        scenario_context and test_case_context identify what the scenarios
+        (generation options) and test cases (language, framework, environment
+        variables, seed) were generated with; each is only reusable while its
+        context stays the same.
+        """
+        old_to_new = {old: new for new, old in self.unchanged.items()}
+
+        for scenario in scenarios:
+            new_index = old_to_new.get(scenario.endpoint_index)
+            if new_index is not None:
+                self.scenarios.setdefault(new_index, []).append(
+                    scenario.relink(new_index, endpoints)
+                )
+
+        for test_case in test_cases:
+            new_index = old_to_new.get(test_case.endpoint_index)
+            if new_index is not None:
+                self.test_cases.setdefault(test_case.scenario_id, []).append(
+                    test_case.relink(new_index)
+                )
+
+        self.scenario_context = scenario_context
+        self.test_case_context = test_case_context
+
+    def reusable_scenarios(
+        self, scenario_context: Tuple[Any, ...]
+    ) -> Dict[int, List[ScenarioRecord]]:
+        """
+        Carried scenarios by endpoint index, if they were generated with the
+        given options, else none. They are handed out once: later scenario
+        generations regenerate every endpoint.
+        """
+        scenarios = self.scenarios if scenario_context == self.scenario_context else {}
+        self.scenarios = {}
+        return scenarios
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "added": [format_endpoint_key(self._new_keys[i]) for i in self.added],
+            "changed": [format_endpoint_key(self._new_keys[i]) for i in self.changed],
+            "removed": [format_endpoint_key(self._old_keys[i]) for i in self.removed],
+            "unchanged_count": len(self.unchanged),
+            "reusable_scenarios": sum(map(len, self.scenarios.values())),
+            "reusable_test_cases": sum(map(len, self.test_cases.values())),
+        }
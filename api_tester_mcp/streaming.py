@@ -0,0 +1,165 @@
+"""Incremental JSON reading for very large specification files"""
+
+import json
+from typing import IO, Any, Dict, Iterator, Optional, Sequence, Tuple
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+
+
+class JsonStreamReader:
+    """
+    Read JSON values incrementally from a text stream.
+
+    Only the value currently being decoded is kept in the buffer, so walking the
+    members of a huge object needs memory proportional to its largest member
+    rather than to the whole document.
+    """
+
+    def __init__(self, stream: IO[str], chunk_size: int = 1 << 20):
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self, min_size: int = 0) -> bool:
+        """Drop consumed input and append the next chunk to the buffer"""
+        if self.eof:
+            return False
+
+        if self.pos:
+            self.buffer = self.buffer[self.pos :]
+            self.pos = 0
+
+        chunk = self.stream.read(max(self.chunk_size, min_size))
+        if not chunk:
+            self.eof = True
+            return False
+
+        self.buffer += chunk
+        return True
+
+    def _skip_whitespace(self):
+        """Advance past whitespace, reading more input when needed"""
+        while True:
+            buffer, pos, size = self.buffer, self.pos, len(self.buffer)
+            while pos < size and buffer[pos] in _WHITESPACE:
+                pos += 1
+            self.pos = pos
+            if pos < size or not self._fill():
+                return
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character without consuming it"""
+        self._skip_whitespace()
+        if self.pos < len(self.buffer):
+            return self.buffer[self.pos]
+        return ""
+
+    def expect(self, char: str):
+        """Consume the given structural character or raise ValueError"""
+        found = self.peek()
+        if found != char:
+            raise ValueError(
+                f"Invalid JSON: expected '{char}' but found '{found or 'end of file'}'"
+            )
+        self.pos += 1
+
+    def read_value(self) -> Any:
+        """Decode the next complete JSON value"""
+        self._skip_whitespace()
+        wanted = self.chunk_size
+
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                # The value is most likely cut off at the end of the buffer
+                if not self._fill(wanted):
+                    raise
+                wanted *= 2
+                continue
+
+            # Numbers and literals may continue in the next chunk
+            if end >= len(self.buffer) and not self.eof and self._fill(wanted):
+                continue
+
+            self.pos = end
+            return value
+
+    def iter_object(self) -> Iterator[str]:
+        """
+        Iterate over the keys of the object at the current position.
+
+        The caller must consume each member's value (with read_value or a nested
+        iter_object) before advancing to the next key.
+        """
+        self.expect("{")
+        if self.peek() == "}":
+            self.pos += 1
+            return
+
+        while True:
+            key = self.read_value()
+            if not isinstance(key, str):
+                raise ValueError("Invalid JSON: object keys must be strings")
+            self.expect(":")
+            yield key
+
+            separator = self.peek()
+            if separator == ",":
+                self.pos += 1
+            elif separator == "}":
+                self.pos += 1
+                return
+            else:
+                raise ValueError(
+                    f"Invalid JSON: expected ',' or '}}' but found '{separator or 'end of file'}'"
+                )
+
+    def skip_value(self):
+        """Consume the next value, decoding large objects member by member"""
+        if self.peek() == "{":
+            for _ in self.iter_object():
+                self.read_value()
+        else:
+            self.read_value()
+
+
+def read_json_skeleton(
+    file_path: str, skip_keys: Sequence[str] = ("paths",)
+) -> Dict[str, Any]:
+    """
+    Load the top-level members of a JSON document except the skipped ones.
+
+    Skipped members are consumed one nested member at a time, so a document with
+    a huge ``paths`` object can be inspected without materializing it.
+    """
+    skeleton = {}
+    with open(file_path, "r", encoding="utf-8-sig") as stream:
+        reader = JsonStreamReader(stream)
+        for key in reader.iter_object():
+            if key in skip_keys:
+                reader.skip_value()
+            else:
+                skeleton[key] = reader.read_value()
+    return skeleton
+
+
+def iter_json_members(file_path: str, key: str) -> Iterator[Tuple[str, Any]]:
+    """Yield the members of a top-level JSON object one at a time"""
+    with open(file_path, "r", encoding="utf-8-sig") as stream:
+        reader = JsonStreamReader(stream)
+        for top_level_key in reader.iter_object():
+            if top_level_key != key:
+                reader.skip_value()
+                continue
+
+            if reader.peek() != "{":
+                reader.read_value()
+                return
+
+            for member_key in reader.iter_object():
+                yield member_key, reader.read_value()
+            return
@@ -5,6 +5,7 @@ import json
 import re
 import time
 from typing import Any, Dict, List, Optional
+from urllib.parse import quote, urlencode
 
 import aiohttp
 
@@ -17,7 +18,25 @@ from .models import (
     TestResult,
     TestScenario,
 )
-from .utils import ProgressTracker, generate_id, generate_test_data, logger
+from .payloads import LargePayload, format_size, payload_timeout
+from .utils import (
+    ProgressTracker,
+    fake_data,
+    generate_stable_id,
+    generate_test_data,
+    logger,
+    render_template,
+)
+
+
+def _param_value(value: Any) -> str:
+    """Parameter value as sent in a path, query string or header"""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, list):
+        return ",".join(_param_value(item) for item in value)
+    # Numbers, booleans and objects in their JSON form (true, not True)
+    return json.dumps(value)
 
 
 class TestCaseGenerator:
@@ -29,41 +48,75 @@ class TestCaseGenerator:
         env_vars: Dict[str, str] = None,
         language: TestLanguage = TestLanguage.PYTHON,
         framework: TestFramework = TestFramework.REQUESTS,
+        seed: Optional[int] = None,
     ):
         self.base_url = base_url
         self.env_vars = env_vars or {}
         self.language = language
         self.framework = framework
+        # Test data of each scenario is derived from the seed and its id
+        self.seed = seed
         self.code_generator = CodeGenerator(language, framework)
 
-    def generate_test_cases(self, scenarios: List[TestScenario]) -> List[TestCase]:
-        """Generate test cases from scenarios"""
+    def generate_test_cases(
+        self, scenarios: List[TestScenario], render_code: bool = True
+    ) -> List[TestCase]:
+        """
+        Generate test cases from scenarios.
+
+        With render_code=False the per-test-case code is left empty; it can be
+        rendered later with render_test_case_code().
+        """
         test_cases = []
 
         for scenario in scenarios:
-            test_case = self._scenario_to_test_case(scenario)
+            test_case = self._scenario_to_test_case(scenario, render_code)
             test_cases.append(test_case)
 
         return test_cases
 
-    def _scenario_to_test_case(self, scenario: TestScenario) -> TestCase:
+    def _scenario_to_test_case(
+        self, scenario: TestScenario, render_code: bool = True
+    ) -> TestCase:
         """Convert a scenario to an executable test case"""
         endpoint = scenario.endpoint
 
+        # Scenarios with their own inputs (e.g. boundary values) override the
+        # generated ones
+        test_data = scenario.test_data or {}
+
         # Build URL
-        url = self._build_url(endpoint.path)
+        path = endpoint.path
+        for name, value in test_data.get("path_params", {}).items():
+            path = path.replace(f"{{{name}}}", quote(_param_value(value), safe=""))
+        url = self._build_url(path)
+        query = test_data.get("query")
+        if query:
+            url += "&" if "?" in url else "?"
+            url += urlencode(
+                {name: _param_value(value) for name, value in query.items()}
+            )
 
         # Build headers
         headers = self._build_headers(endpoint)
+        for name, value in test_data.get("headers", {}).items():
+            headers[name] = _param_value(value)
 
         # Build request body
-        body = self._build_request_body(endpoint)
+        if "body" in test_data:
+            body = test_data["body"]
+        else:
+            if self.seed is not None:
+                fake_data.seed(self.seed, scenario.id)
+            body = self._build_request_body(endpoint)
 
         # Determine expected status
         expected_status = self._get_expected_status(scenario)
 
         test_case = TestCase(
-            id=generate_id(),
+            id=generate_stable_id(
+                "test_case", scenario.id, self.language.value, self.framework.value
+            ),
             scenario_id=scenario.id,
             name=scenario.name,
             method=endpoint.method,
@@ -76,31 +129,33 @@ class TestCaseGenerator:
             framework=self.framework,
         )
 
-        # Generate code for this test case
+        # Large payload scenarios stream a body of this size built around the
+        # generated one, and wait longer for it to upload
+        payload_size = test_data.get("payload_size")
+        if payload_size:
+            test_case.payload_size = payload_size
+            test_case.timeout = payload_timeout(payload_size, test_case.timeout)
+
+        if render_code:
+            test_case.generated_code = self.render_test_case_code(test_case)
+
+        return test_case
+
+    def render_test_case_code(self, test_case: TestCase) -> str:
+        """Render the standalone test code of a single test case"""
         session_info = {
             "id": "current_session",
             "base_url": self.base_url,
             "auth_token": self.env_vars.get("auth_bearer", ""),
         }
-        test_case.generated_code = self.code_generator.generate_test_code(
-            [test_case], session_info
-        )
-
-        return test_case
+        return self.code_generator.generate_test_code([test_case], session_info)
 
     def _build_url(self, path: str) -> str:
         """Build full URL from path"""
         base = self.base_url or self.env_vars.get("baseUrl", "")
 
-        # Replace path parameters with actual values
-        url = f"{base.rstrip('/')}{path}"
-
-        # Replace template variables
-        for key, value in self.env_vars.items():
-            url = url.replace(f"{{{key}}}", value)
-            url = url.replace(f"{{{{key}}}}", value)
-
-        return url
+        # Replace path parameters and template variables that have values
+        return render_template(f"{base.rstrip('/')}{path}", self.env_vars)
 
     def _build_headers(self, endpoint: ApiEndpoint) -> Dict[str, str]:
         """Build request headers"""
@@ -241,6 +296,7 @@ class TestExecutor:
         """Execute a single test case"""
         async with semaphore:
             start_time = time.time()
+            payload = None
 
             try:
                 # Prepare request
@@ -251,7 +307,11 @@ class TestExecutor:
                     "timeout": aiohttp.ClientTimeout(total=test_case.timeout),
                 }
 
-                if test_case.body:
+                if test_case.payload_size:
+                    # Streamed with chunked transfer encoding, never held whole
+                    payload = LargePayload(test_case.body, test_case.payload_size)
+                    kwargs["data"] = payload.stream()
+                elif test_case.body:
                     kwargs["json"] = test_case.body
 
                 # Execute request
@@ -268,6 +328,7 @@ class TestExecutor:
                         response_body=response_body,
                         response_headers=dict(response.headers),
                     )
+                    self._record_upload(result, payload)
 
                     # Run assertions
                     self._run_assertions(result, test_case, response, execution_time)
@@ -276,12 +337,28 @@ class TestExecutor:
 
             except Exception as e:
                 execution_time = time.time() - start_time
-                return TestResult(
+                result = TestResult(
                     test_case_id=test_case.id,
                     status="failed",
                     execution_time=execution_time,
                     error_message=str(e),
                 )
+                if payload is not None:
+                    self._record_upload(result, payload)
+                    result.error_message = (
+                        f"Connection failed after {format_size(payload.bytes_sent)} "
+                        f"of {format_size(payload.total_size)}: {e}"
+                    )
+                return result
+
+    @staticmethod
+    def _record_upload(result: TestResult, payload: Optional[LargePayload]):
+        """Record how much of a streamed body was sent and how fast"""
+        if payload is None:
+            return
+        result.request_bytes = payload.bytes_sent
+        if payload.throughput is not None:
+            result.upload_throughput = round(payload.throughput, 1)
 
     def _run_assertions(
         self, result: TestResult, test_case: TestCase, response, execution_time: float
@@ -578,7 +655,11 @@ class LoadTestExecutor:
                         "timeout": aiohttp.ClientTimeout(total=test_case.timeout),
                     }
 
-                    if test_case.body:
+                    if test_case.payload_size:
+                        # Streamed like in functional runs, never held whole
+                        payload = LargePayload(test_case.body, test_case.payload_size)
+                        kwargs["data"] = payload.stream()
+                    elif test_case.body:
                         kwargs["json"] = test_case.body
 
                     async with session.request(**kwargs) as response:
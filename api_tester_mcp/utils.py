@@ -2,18 +2,34 @@
 
 import json
 import logging
+import random
 import re
+import string
 import uuid
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from faker import Faker
 
+try:  # Python 3.11+
+    from re import _constants as sre_constants
+    from re import _parser as sre_parse
+except ImportError:
+    import sre_constants
+    import sre_parse
+
+from .models import ApiEndpoint
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Initialize Faker for test data generation
-fake = Faker()
+# Distinct values pre-generated per Faker provider by FakeDataPool
+FAKE_DATA_POOL_SIZE = 1024
+
+
+# Namespace of the name-based (UUID5) ids of scenarios and test cases
+STABLE_ID_NAMESPACE = uuid.UUID("22fb26f5-bc4e-40a4-87a5-8d712b97dcaa")
 
 
 def generate_id() -> str:
@@ -21,6 +37,68 @@ def generate_id() -> str:
     return str(uuid.uuid4())
 
 
+def generate_seed() -> int:
+    """Generate a random seed for the test data of a session"""
+    return uuid.uuid4().int & 0xFFFFFFFF
+
+
+def generate_stable_id(*parts: Any) -> str:
+    """
+    Generate an ID derived from its parts, identical in every run.
+
+    Parts are serialized as canonical JSON, so dicts with the same content give
+    the same ID regardless of key order.
+    """
+    name = json.dumps(parts, sort_keys=True, separators=(",", ":"), default=str)
+    return str(uuid.uuid5(STABLE_ID_NAMESPACE, name))
+
+
+def endpoint_signature(endpoint: ApiEndpoint) -> List[Optional[str]]:
+    """Identity of an endpoint for stable IDs: service, method, path and operation"""
+    return [
+        endpoint.service,
+        endpoint.method.upper(),
+        endpoint.path,
+        endpoint.operation_id,
+    ]
+
+
+# {{name}} (Postman) and {name} (OpenAPI path parameter) references
+_TEMPLATE_REFERENCE = re.compile(r"\{\{([^{}]+)\}\}|\{([^{}]+)\}")
+
+
+@lru_cache(maxsize=4096)
+def compile_template(text: str) -> Tuple[Union[str, Tuple[str, str]], ...]:
+    """
+    Split text into literal segments and (name, reference) variable segments.
+
+    Compiled templates are cached, so the URLs shared by the scenarios of an
+    endpoint are only scanned once.
+    """
+    segments: List[Union[str, Tuple[str, str]]] = []
+    position = 0
+    for match in _TEMPLATE_REFERENCE.finditer(text):
+        if match.start() > position:
+            segments.append(text[position : match.start()])
+        name = (match.group(1) or match.group(2)).strip()
+        segments.append((name, match.group(0)))
+        position = match.end()
+    if position < len(text):
+        segments.append(text[position:])
+    return tuple(segments)
+
+
+def render_template(text: str, values: Dict[str, str]) -> str:
+    """Substitute the {{name}} and {name} references that have a value"""
+    segments = compile_template(text)
+    if len(segments) == 1 and isinstance(segments[0], str):
+        return text
+    return "".join(
+        segment if isinstance(segment, str) else values.get(segment[0], segment[1])
+        for segment in segments
+    )
+
+
 def validate_json(content: str) -> bool:
     """Validate if content is valid JSON"""
     try:
@@ -30,8 +108,113 @@ def validate_json(content: str) -> bool:
         return False
 
 
+# Characters read from the start of a document to recognize its type
+SPEC_SNIFF_SIZE = 64 * 1024
+
+# JSON strings (with a trailing colon for keys) and brackets; a lone quote is a
+# string cut off by the end of the prefix
+_JSON_SNIFF_TOKEN = re.compile(r'"((?:[^"\\]|\\.)*)"(\s*:)?|([{}\[\]])|"')
+_LEADING_SPACE = re.compile(r"[\ufeff\s]*")
+# Comments and description strings that may precede the first SDL definition
+_LEADING_SDL_TRIVIA = re.compile(
+    r'(?:\s*(?:#[^\n]*|"""[\s\S]*?"""|"(?:[^"\\\n]|\\.)*"))*\s*'
+)
+_YAML_OPENAPI_KEY = re.compile(r"""^["']?(?:openapi|swagger)["']?[ \t]*:""", re.M)
+_SDL_DEFINITION_START = re.compile(
+    r"(?:extend\s+)?(?:schema|type|input|interface|enum|union|scalar|directive)"
+    r"\b(?!\s*:)"
+)
+_GRAPHQL_SDL_PATTERNS = re.compile(
+    "|".join(
+        [
+            r"\btype\s+Query\s*\{",
+            r"\btype\s+Mutation\s*\{",
+            r"\btype\s+Subscription\s*\{",
+            r"\bschema\s*\{",
+            r"\binput\s+\w+\s*\{",
+            r"\benum\s+\w+\s*\{",
+            r"\binterface\s+\w+\s*\{",
+            r"\bunion\s+\w+",
+        ]
+    ),
+    re.IGNORECASE,
+)
+
+
+def sniff_spec_type(prefix: str) -> Optional[str]:
+    """
+    Recognize the specification type from the start of a document.
+
+    Only unambiguous markers decide: a top-level openapi/swagger key, a Postman
+    schema URL in info next to item, a data.__schema introspection root, or SDL
+    that opens with a type system definition. Returns None otherwise.
+    """
+    text = prefix[:SPEC_SNIFF_SIZE]
+    start = _LEADING_SPACE.match(text).end()
+    if start == len(text) or text[start] == "[":
+        return None
+    if text[start] == "{":
+        return _sniff_json(text, start)
+    if _YAML_OPENAPI_KEY.search(text):
+        return "openapi"
+
+    start = _LEADING_SDL_TRIVIA.match(text, start).end()
+    if _SDL_DEFINITION_START.match(text, start) and _GRAPHQL_SDL_PATTERNS.search(text):
+        return "graphql"
+    return None
+
+
+def _sniff_json(text: str, start: int) -> Optional[str]:
+    """Walk the keys of a JSON prefix until one of them gives the type away"""
+    containers: List[Optional[str]] = []  # key of every open container
+    key: Optional[str] = None
+    postman_schema = has_item = False
+
+    for match in _JSON_SNIFF_TOKEN.finditer(text, start):
+        string, colon, bracket = match.groups()
+        if bracket is not None:
+            if bracket in "{[":
+                containers.append(key)
+                key = None
+            else:
+                containers.pop()
+                if not containers:
+                    break
+            continue
+        if string is None:
+            break
+
+        depth = len(containers)
+        if colon:
+            key = string
+            if depth == 1:
+                if string in ("openapi", "swagger"):
+                    return "openapi"
+                has_item = has_item or string == "item"
+            elif depth == 2 and containers[1] == "data" and string == "__schema":
+                return "graphql"
+        elif depth == 2 and containers[1] == "info" and key == "schema":
+            postman_schema = "postman" in string.lower()
+
+        if postman_schema and has_item:
+            return "postman"
+
+    return None
+
+
+def read_spec_prefix(file_path: str) -> str:
+    """Read the part of a specification file that sniff_spec_type() looks at"""
+    with open(file_path, "r", encoding="utf-8", errors="replace") as file:
+        return file.read(SPEC_SNIFF_SIZE)
+
+
 def validate_spec_type(content: str) -> Optional[str]:
     """Detect and validate specification type"""
+    detected = sniff_spec_type(content[:SPEC_SNIFF_SIZE])
+    if detected:
+        return detected
+
+    # The start of the document is ambiguous; parse all of it
     try:
         data = json.loads(content)
     except json.JSONDecodeError:
@@ -74,21 +257,7 @@ def validate_spec_type(content: str) -> Optional[str]:
 
 def _is_graphql_sdl(content: str) -> bool:
     """Check if content is GraphQL Schema Definition Language"""
-    # Look for GraphQL SDL patterns
-    graphql_patterns = [
-        r"\btype\s+Query\s*\{",
-        r"\btype\s+Mutation\s*\{",
-        r"\btype\s+Subscription\s*\{",
-        r"\bschema\s*\{",
-        r"\binput\s+\w+\s*\{",
-        r"\benum\s+\w+\s*\{",
-        r"\binterface\s+\w+\s*\{",
-        r"\bunion\s+\w+",
-    ]
-
-    return any(
-        re.search(pattern, content, re.IGNORECASE) for pattern in graphql_patterns
-    )
+    return _GRAPHQL_SDL_PATTERNS.search(content) is not None
 
 
 def _has_graphql_patterns(data: Dict[str, Any]) -> bool:
@@ -115,120 +284,391 @@ def _has_graphql_patterns(data: Dict[str, Any]) -> bool:
     return False
 
 
+class FakeDataPool:
+    """
+    Pre-generated fake values handed out in constant time.
+
+    Faker formats every value from provider templates, which makes a call cost
+    tens of microseconds (about 0.1 ms for an email or URL). The first request
+    for a provider fills a pool of distinct values, and later requests draw from
+    it with a plain Random instance. UUIDs and numbers come straight from that
+    Random, so ids stay unique. Reseeding makes every following value
+    reproducible.
+
+    Pools of a seeded instance are filled from the seed and the provider alone,
+    so their contents do not depend on which providers were used first.
+    """
+
+    def __init__(
+        self,
+        faker: Optional[Faker] = None,
+        size: int = FAKE_DATA_POOL_SIZE,
+        seed: Optional[int] = None,
+    ):
+        self.faker = faker or Faker()
+        self.size = size
+        self.random = random.Random()
+        self._seed: Any = None
+        self._pools: Dict[Tuple[Any, ...], List[Any]] = {}
+        if seed is not None:
+            self.seed(seed)
+
+    def seed(self, seed: Any, identity: Optional[str] = None):
+        """
+        Reseed the pool.
+
+        Pre-generated values are kept while the seed stays the same. Draws are
+        seeded from the seed and an optional stable identity, such as a scenario
+        id, so the values generated for one identity do not depend on anything
+        generated before them.
+        """
+        if seed != self._seed:
+            self._seed = seed
+            self._pools.clear()
+        self.random.seed(seed if identity is None else f"{seed}:{identity}")
+
+    def take(self, provider: str, *args: Any) -> Any:
+        """A value of a Faker provider, e.g. take("email") or take("text", 20)"""
+        return self.sampler(provider, *args)()
+
+    def sampler(self, provider: str, *args: Any) -> Callable[[], Any]:
+        """Function returning a value of a Faker provider per call"""
+        key = (provider, *args)
+        pools = self._pools
+        random_value = self.random.random
+
+        def sample() -> Any:
+            pool = pools.get(key)
+            if pool is None:
+                if self._seed is not None:
+                    self.faker.seed_instance(f"{self._seed}:{key}")
+                method = getattr(self.faker, provider)
+                pool = pools[key] = [method(*args) for _ in range(self.size)]
+            return pool[int(random_value() * len(pool))]
+
+        return sample
+
+    def uuid(self) -> str:
+        return str(uuid.UUID(int=self.random.getrandbits(128), version=4))
+
+    def boolean(self) -> bool:
+        return self.random.random() < 0.5
+
+    def integer(self, minimum: int, maximum: int) -> int:
+        return minimum + int(self.random.random() * (maximum - minimum + 1))
+
+    def number(self, minimum: float, maximum: float) -> float:
+        return self.random.uniform(minimum, maximum)
+
+    def choice(self, values: List[Any]) -> Any:
+        return values[int(self.random.random() * len(values))]
+
+
+# Source of all generated test data; seeded per session and scenario
+fake_data = FakeDataPool()
+
+
+# Characters drawn for character classes and "." in generated pattern matches
+_PATTERN_ALPHABET = string.ascii_letters + string.digits + string.punctuation + " "
+
+# Repetitions drawn beyond the minimum of a quantifier such as + or {2,}
+_PATTERN_EXTRA_REPEATS = 3
+
+# Draws tried before a pattern generator gives up on a value
+_PATTERN_ATTEMPTS = 3
+
+_CATEGORY_MEMBERS: Dict[Any, Callable[[str], bool]] = {
+    sre_constants.CATEGORY_DIGIT: lambda ch: ch in string.digits,
+    sre_constants.CATEGORY_NOT_DIGIT: lambda ch: ch not in string.digits,
+    sre_constants.CATEGORY_SPACE: str.isspace,
+    sre_constants.CATEGORY_NOT_SPACE: lambda ch: not ch.isspace(),
+    sre_constants.CATEGORY_WORD: lambda ch: ch.isalnum() or ch == "_",
+    sre_constants.CATEGORY_NOT_WORD: lambda ch: not (ch.isalnum() or ch == "_"),
+}
+
+_PatternPlan = Callable[[random.Random, Dict[int, str]], str]
+
+
+class _UnsupportedPattern(Exception):
+    """Regular expression construct the pattern generator cannot produce"""
+
+
+@lru_cache(maxsize=1024)
+def compile_pattern(
+    pattern: str,
+) -> Optional[Callable[[random.Random], Optional[str]]]:
+    """
+    Compile a regular expression into a function that draws a matching string
+    from the Random it is given, so matches are reproducible from a seed.
+
+    Literals, classes, groups, alternations, quantifiers and backreferences
+    are supported. Returns None for invalid patterns and for patterns using
+    lookarounds or conditionals; the function returns None when a drawn
+    string does not match (e.g. because of inline flags).
+    """
+    try:
+        matcher = re.compile(pattern)
+        plan = _pattern_sequence(sre_parse.parse(pattern))
+    except (re.error, _UnsupportedPattern, RecursionError):
+        return None
+
+    def generate(rng: random.Random) -> Optional[str]:
+        for _ in range(_PATTERN_ATTEMPTS):
+            text = plan(rng, {})
+            if matcher.search(text):
+                return text
+        return None
+
+    return generate
+
+
+def _pattern_sequence(items: Any) -> _PatternPlan:
+    """Plan for a parsed (sub)pattern, its parts drawn in order"""
+    plans = [_pattern_item(op, av) for op, av in items]
+    return lambda rng, groups: "".join(plan(rng, groups) for plan in plans)
+
+
+def _pattern_choice(chars: str) -> _PatternPlan:
+    if not chars:
+        raise _UnsupportedPattern("empty character class")
+    return lambda rng, groups: chars[int(rng.random() * len(chars))]
+
+
+def _pattern_item(op: Any, av: Any) -> _PatternPlan:
+    """Plan for one parsed regular expression construct"""
+    if op is sre_constants.LITERAL:
+        text = chr(av)
+        return lambda rng, groups: text
+    if op is sre_constants.NOT_LITERAL:
+        return _pattern_choice(_PATTERN_ALPHABET.replace(chr(av), ""))
+    if op is sre_constants.ANY:
+        return _pattern_choice(_PATTERN_ALPHABET)
+    if op is sre_constants.IN:
+        return _pattern_choice(_class_chars(av))
+    if op is sre_constants.AT:
+        return lambda rng, groups: ""
+    if op is sre_constants.BRANCH:
+        branches = [_pattern_sequence(branch) for branch in av[1]]
+        return lambda rng, groups: branches[int(rng.random() * len(branches))](
+            rng, groups
+        )
+    if op is sre_constants.SUBPATTERN:
+        group, body = av[0], _pattern_sequence(av[-1])
+        if group is None:
+            return body
+
+        def capture(rng: random.Random, groups: Dict[int, str]) -> str:
+            groups[group] = text = body(rng, groups)
+            return text
+
+        return capture
+    if op is sre_constants.GROUPREF:
+        return lambda rng, groups: groups.get(av, "")
+    if op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT) or (
+        op is getattr(sre_constants, "POSSESSIVE_REPEAT", None)
+    ):
+        low, high, body = av[0], av[1], _pattern_sequence(av[2])
+        spread = min(high, low + _PATTERN_EXTRA_REPEATS) - low + 1
+        return lambda rng, groups: "".join(
+            body(rng, groups) for _ in range(low + int(rng.random() * spread))
+        )
+    if op is getattr(sre_constants, "ATOMIC_GROUP", None):
+        return _pattern_sequence(av)
+    raise _UnsupportedPattern(str(op))
+
+
+def _class_chars(items: Any) -> str:
+    """Characters of a character class, from the printable ASCII ones"""
+    negate = bool(items) and items[0][0] is sre_constants.NEGATE
+
+    def member(ch: str) -> bool:
+        code = ord(ch)
+        for op, av in items:
+            if op is sre_constants.LITERAL and code == av:
+                return True
+            if op is sre_constants.RANGE and av[0] <= code <= av[1]:
+                return True
+            if op is sre_constants.CATEGORY and _CATEGORY_MEMBERS.get(
+                av, lambda ch: False
+            )(ch):
+                return True
+        return False
+
+    chars = "".join(ch for ch in _PATTERN_ALPHABET if member(ch) != negate)
+    if not chars and not negate:
+        # Classes of non-ASCII characters only, e.g. [à-ÿ]
+        chars = "".join(
+            chr(av if op is sre_constants.LITERAL else av[0])
+            for op, av in items
+            if op in (sre_constants.LITERAL, sre_constants.RANGE)
+        )
+    return chars
+
+
+# Compiled generator plans, keyed by schema identity. Each schema is kept next
+# to its plan so its id cannot be reused while cached.
+_COMPILED_SCHEMA_LIMIT = 4096
+_compiled_schemas: Dict[int, Tuple[Dict[str, Any], Callable[[], Any]]] = {}
+
+
 def generate_test_data(schema: Dict[str, Any]) -> Dict[str, Any]:
     """Generate test data from JSON schema"""
+    return compile_schema(schema)()
+
+
+def compile_schema(schema: Dict[str, Any]) -> Callable[[], Any]:
+    """
+    Compile a JSON schema into a function that generates one value per call.
+
+    Types, formats, enums and limits are resolved once, so repeated calls only
+    draw the random parts and build the output. Plans are cached per schema
+    object; a schema changed in place after compilation keeps its old plan.
+    """
     if not schema or not isinstance(schema, dict):
-        return {}
+        return dict
 
-    schema_type = schema.get("type", "object")
+    entry = _compiled_schemas.get(id(schema))
+    if entry is not None and entry[0] is schema:
+        return entry[1]
+
+    if len(_compiled_schemas) >= _COMPILED_SCHEMA_LIMIT:
+        _compiled_schemas.clear()
+
+    # Self-referencing schemas reach this placeholder while being compiled
+    compiled: List[Callable[[], Any]] = []
+    _compiled_schemas[id(schema)] = (schema, lambda: compiled[0]())
 
+    schema_type = schema.get("type", "object")
     if schema_type == "object":
-        return _generate_object_data(schema)
+        plan = _compile_object(schema)
     elif schema_type == "array":
-        return _generate_array_data(schema)
+        plan = _compile_array(schema)
     elif schema_type == "string":
-        return _generate_string_data(schema)
+        plan = _compile_string(schema)
     elif schema_type == "integer":
-        return _generate_integer_data(schema)
+        plan = _compile_integer(schema)
     elif schema_type == "number":
-        return _generate_number_data(schema)
+        plan = _compile_number(schema)
     elif schema_type == "boolean":
-        return fake.boolean()
+        plan = fake_data.boolean
     else:
-        return {}
+        plan = dict
 
+    compiled.append(plan)
+    _compiled_schemas[id(schema)] = (schema, plan)
+    return plan
 
-def _generate_object_data(schema: Dict[str, Any]) -> Dict[str, Any]:
-    """Generate object data from schema"""
-    properties = schema.get("properties", {})
-    required = schema.get("required", [])
-    result = {}
 
-    for prop_name, prop_schema in properties.items():
-        if prop_name in required or fake.boolean():
-            result[prop_name] = generate_test_data(prop_schema)
+def _constant(value: Any) -> Callable[[], Any]:
+    return lambda: value
 
+
+def _compile_object(schema: Dict[str, Any]) -> Callable[[], Any]:
+    """Plan for object data: required properties always, others half the time"""
     # Use example if provided
     if "example" in schema:
-        return schema["example"]
+        return _constant(schema["example"])
+
+    required = schema.get("required", [])
+    fields = [
+        (prop_name, prop_name in required, compile_schema(prop_schema))
+        for prop_name, prop_schema in schema.get("properties", {}).items()
+    ]
+    random_value = fake_data.random.random
 
-    return result
+    def generate_object() -> Dict[str, Any]:
+        result = {}
+        for prop_name, is_required, generate in fields:
+            if is_required or random_value() < 0.5:
+                result[prop_name] = generate()
+        return result
 
+    return generate_object
 
-def _generate_array_data(schema: Dict[str, Any]) -> list:
-    """Generate array data from schema"""
-    items_schema = schema.get("items", {})
+
+def _compile_array(schema: Dict[str, Any]) -> Callable[[], Any]:
+    """Plan for array data"""
+    generate_item = compile_schema(schema.get("items", {}))
     min_items = schema.get("minItems", 1)
     max_items = schema.get("maxItems", 3)
+    integer = fake_data.integer
 
-    count = fake.random_int(min=min_items, max=max_items)
-    return [generate_test_data(items_schema) for _ in range(count)]
+    return lambda: [generate_item() for _ in range(integer(min_items, max_items))]
 
 
-def _generate_string_data(schema: Dict[str, Any]) -> str:
-    """Generate string data from schema"""
+def _compile_string(schema: Dict[str, Any]) -> Callable[[], Any]:
+    """Plan for string data"""
     # Use example if provided
     if "example" in schema:
-        return schema["example"]
+        return _constant(schema["example"])
 
     # Use enum if provided
     if "enum" in schema:
-        return fake.random_element(schema["enum"])
+        values = list(schema["enum"])
+        choice = fake_data.choice
+        return lambda: choice(values)
 
     # Use format-specific generation
     format_type = schema.get("format", "")
 
     if format_type == "email":
-        return fake.email()
+        return fake_data.sampler("email")
     elif format_type == "uuid":
-        return str(uuid.uuid4())
+        return fake_data.uuid
     elif format_type == "date":
-        return fake.date().isoformat()
+        return fake_data.sampler("date")
     elif format_type == "date-time":
-        return fake.date_time().isoformat()
+        return fake_data.sampler("iso8601")
     elif format_type == "uri":
-        return fake.url()
+        return fake_data.sampler("url")
     elif format_type == "password":
-        return fake.password()
+        return fake_data.sampler("password")
+
+    # Default string generation
+    max_length = schema.get("maxLength", 20)
+    sample_text = fake_data.sampler("text", min(max_length, 50))
+
+    def generate_text() -> str:
+        return sample_text()[:max_length]
 
     # Use pattern if provided
-    if "pattern" in schema:
-        try:
-            from exrex import getone
+    pattern = schema.get("pattern")
+    generate_pattern = compile_pattern(pattern) if isinstance(pattern, str) else None
+    if generate_pattern is not None:
+        rng = fake_data.random
 
-            return getone(schema["pattern"])
-        except:
-            pass
+        def generate_match() -> str:
+            return generate_pattern(rng) or generate_text()
 
-    # Default string generation
-    min_length = schema.get("minLength", 5)
-    max_length = schema.get("maxLength", 20)
+        return generate_match
 
-    return fake.text(max_nb_chars=min(max_length, 50))[:max_length]
+    return generate_text
 
 
-def _generate_integer_data(schema: Dict[str, Any]) -> int:
-    """Generate integer data from schema"""
+def _compile_integer(schema: Dict[str, Any]) -> Callable[[], Any]:
+    """Plan for integer data"""
     # Use example if provided
     if "example" in schema:
-        return schema["example"]
+        return _constant(schema["example"])
 
     minimum = schema.get("minimum", 1)
     maximum = schema.get("maximum", 1000)
+    integer = fake_data.integer
 
-    return fake.random_int(min=minimum, max=maximum)
+    return lambda: integer(minimum, maximum)
 
 
-def _generate_number_data(schema: Dict[str, Any]) -> float:
-    """Generate number data from schema"""
+def _compile_number(schema: Dict[str, Any]) -> Callable[[], Any]:
+    """Plan for number data"""
     # Use example if provided
     if "example" in schema:
-        return schema["example"]
+        return _constant(schema["example"])
 
     minimum = schema.get("minimum", 1.0)
     maximum = schema.get("maximum", 1000.0)
+    uniform = fake_data.random.uniform
 
-    return fake.random.uniform(minimum, maximum)
+    return lambda: uniform(minimum, maximum)
 
 
 def sanitize_filename(filename: str) -> str:
@@ -24,6 +24,8 @@ OPTIONS:
   --port <port>       Port to listen on (default: stdio)
   --host <host>       Host to bind to (default: localhost)
   --verbose           Enable verbose logging
+  --template-cache-dir <dir>
+                      Keep compiled code templates across restarts
 
 EXAMPLES:
   # Run via npx (recommended)
@@ -0,0 +1,286 @@
+"""
+Benchmark the fuzzer against a local stand-in server with planted bugs.
+
+The stand-in is an aiohttp app, run in a separate process, that serves a
+small items API. Five inputs make it fail with a 500 response, each with its
+own error text:
+
+- a non-integer limit query parameter
+- a null item name
+- an item name longer than 1000 characters
+- a non-ASCII X-Client header
+- a request body nested deeper than 64 levels
+
+Mutation generation is timed on its own and with each request serialized,
+then an engine with the same seed drives a FuzzExecutor run against the
+stand-in. Mutations/s, requests/s and the distinct crashes found are
+printed, and the exit code is 1 when a planted bug was not reported.
+
+Usage: python scripts/bench_fuzz.py [--mutations N] [--requests N]
+       [--concurrency N] [--seed N]
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import multiprocessing
+import os
+import socket
+import sys
+import time
+
+from aiohttp import web
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from api_tester_mcp.fuzzing import (  # noqa: E402
+    FuzzExecutor,
+    FuzzSeed,
+    MutationEngine,
+    seed_test_data,
+)
+from api_tester_mcp.models import SpecType  # noqa: E402
+from api_tester_mcp.parsers import ScenarioGenerator, SpecificationParser  # noqa: E402
+from api_tester_mcp.test_execution import TestCaseGenerator  # noqa: E402
+
+STAND_IN_SPEC = {
+    "openapi": "3.0.0",
+    "info": {"title": "Fuzz stand-in", "version": "1.0.0"},
+    "paths": {
+        "/items": {
+            "get": {
+                "parameters": [
+                    {
+                        "name": "limit",
+                        "in": "query",
+                        "schema": {"type": "integer", "minimum": 1, "maximum": 100},
+                    },
+                    {
+                        "name": "X-Client",
+                        "in": "header",
+                        "schema": {"type": "string", "example": "bench"},
+                    },
+                ],
+                "responses": {"200": {"description": "OK"}},
+            },
+            "post": {
+                "requestBody": {
+                    "content": {
+                        "application/json": {
+                            "schema": {
+                                "type": "object",
+                                "required": ["name"],
+                                "properties": {
+                                    "name": {"type": "string", "maxLength": 100},
+                                    "price": {"type": "number", "minimum": 0},
+                                    "tags": {
+                                        "type": "array",
+                                        "items": {"type": "string"},
+                                    },
+                                },
+                            }
+                        }
+                    }
+                },
+                "responses": {"201": {"description": "Created"}},
+            },
+        },
+        "/items/{id}": {
+            "get": {
+                "parameters": [
+                    {
+                        "name": "id",
+                        "in": "path",
+                        "required": True,
+                        "schema": {"type": "integer", "minimum": 1},
+                    }
+                ],
+                "responses": {"200": {"description": "OK"}},
+            }
+        },
+    },
+}
+
+# Error text of each planted bug; plain text without digits or quotes, so
+# every bug keeps its own crash signature
+PLANTED_BUGS = (
+    "ValueError in parse_limit",
+    "AttributeError in normalize_name",
+    "DataError in save_item",
+    "UnicodeEncodeError in log_client",
+    "RecursionError in validate_item",
+)
+
+MAX_STAND_IN_DEPTH = 64
+
+
+def _depth(value) -> int:
+    """Nesting depth of a JSON value, without recursion"""
+    depth, level = 0, [value]
+    while level:
+        depth += 1
+        level = [
+            item
+            for container in level
+            if isinstance(container, (dict, list))
+            for item in (
+                container.values() if isinstance(container, dict) else container
+            )
+        ]
+    return depth - 1
+
+
+def _bug(index: int) -> web.Response:
+    return web.Response(status=500, text=f"Traceback: {PLANTED_BUGS[index]}")
+
+
+async def list_items(request: web.Request) -> web.Response:
+    limit = request.query.get("limit", "10")
+    if not limit.lstrip("-").isdigit():
+        return _bug(0)
+    if not request.headers.get("X-Client", "").isascii():
+        return _bug(3)
+    return web.json_response([])
+
+
+async def create_item(request: web.Request) -> web.Response:
+    try:
+        body = json.loads(await request.read())
+    except ValueError:
+        return web.Response(status=400, text="invalid JSON")
+    if _depth(body) > MAX_STAND_IN_DEPTH:
+        return _bug(4)
+    if not isinstance(body, dict) or "name" not in body:
+        return web.Response(status=422, text="name is required")
+    name = body["name"]
+    if name is None:
+        return _bug(1)
+    if not isinstance(name, str):
+        return web.Response(status=422, text="name must be a string")
+    if len(name) > 1000:
+        return _bug(2)
+    return web.json_response({"id": 1, "name": name}, status=201)
+
+
+async def get_item(request: web.Request) -> web.Response:
+    if not request.match_info["id"].isdigit():
+        return web.Response(status=404, text="not found")
+    return web.json_response({"id": int(request.match_info["id"])})
+
+
+def serve(port: int):
+    # Oversized request lines and headers are refused with 400 and logged
+    logging.getLogger("aiohttp.server").setLevel(logging.CRITICAL)
+    app = web.Application(client_max_size=1 << 24)
+    app.router.add_get("/items", list_items)
+    app.router.add_post("/items", create_item)
+    app.router.add_get("/items/{id}", get_item)
+    web.run_app(app, host="127.0.0.1", port=port, print=None, access_log=None)
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_for_port(port: int, timeout: float = 10.0):
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=1).close()
+            return
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(0.05)
+
+
+def build_seeds(base_url: str):
+    """One valid request per endpoint, built as run_fuzz_tests does"""
+    parser = SpecificationParser()
+    endpoints = parser.parse(json.dumps(STAND_IN_SPEC), SpecType.OPENAPI)
+    scenario_generator = ScenarioGenerator(parser.spec_data)
+    resolve = scenario_generator.parser._resolve_ref
+    test_case_generator = TestCaseGenerator(base_url, seed=1)
+    seeds = []
+    for endpoint in endpoints:
+        scenario = scenario_generator._generate_positive_scenario(endpoint)
+        scenario.test_data = seed_test_data(endpoint, resolve)
+        test_case = test_case_generator._scenario_to_test_case(
+            scenario, render_code=False
+        )
+        seeds.append(FuzzSeed.from_test_case(test_case, endpoint))
+    return seeds
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--mutations", type=int, default=100000)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+    # Progress logging would be timed along with the requests
+    logging.disable(logging.INFO)
+
+    port = free_port()
+    server = multiprocessing.Process(target=serve, args=(port,), daemon=True)
+    server.start()
+    try:
+        wait_for_port(port)
+        seeds = build_seeds(f"http://127.0.0.1:{port}")
+
+        started = time.perf_counter()
+        for request in MutationEngine(seeds, seed=args.seed).generate(args.mutations):
+            pass
+        generation_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        for request in MutationEngine(seeds, seed=args.seed).generate(args.mutations):
+            request.url()
+            request.body_bytes()
+        serialization_seconds = time.perf_counter() - started
+
+        executor = FuzzExecutor(max_concurrent=args.concurrency)
+        engine = MutationEngine(seeds, seed=args.seed)
+        results = asyncio.run(
+            executor.run(engine.generate(args.requests), args.requests)
+        )
+    finally:
+        server.terminate()
+        server.join()
+
+    found = {
+        bug
+        for crash in results["crashes"]
+        for bug in PLANTED_BUGS
+        if bug in crash["response_excerpt"]
+    }
+    print(
+        f"Mutations: {args.mutations / generation_seconds:,.0f}/s generated, "
+        f"{args.mutations / serialization_seconds:,.0f}/s generated and serialized"
+    )
+    print(
+        f"Requests: {results['requests_per_second']:,.0f}/s "
+        f"({results['total_requests']} in {results['duration_seconds']}s, "
+        f"concurrency {args.concurrency})"
+    )
+    print(f"Distinct crashes: {results['unique_crashes']}")
+    for crash in results["crashes"]:
+        request = crash["request"]
+        print(
+            f"  {crash['status']} {request['endpoint']} {request['location']} "
+            f"{request['field']} ({request['mutator']}, {crash['count']} hits, "
+            f"reproducer {crash['request_size']} bytes)"
+        )
+    print(f"Planted bugs found: {len(found)}/{len(PLANTED_BUGS)}")
+    for bug in PLANTED_BUGS:
+        if bug not in found:
+            print(f"  missed: {bug}")
+    return 0 if len(found) == len(PLANTED_BUGS) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
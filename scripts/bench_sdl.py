@@ -0,0 +1,152 @@
+"""
+Time the GraphQL SDL parser on the example schema and on generated schemas.
+
+examples/github_graphql_schema.graphql is parsed repeatedly, then
+generated schemas of increasing size (object types with described,
+argument-taking fields, input types and one Query field per type) are
+parsed once each, to show that parse time grows linearly with size.
+
+For comparison, each input is also run through the regex extraction the
+tokenizer replaced: the first `type Query { ... }` body cut at its first
+closing brace, with fields and arguments split by regexes. It only ever
+saw root fields, so the root fields each path found are printed as well.
+
+Usage: python scripts/bench_sdl.py [--repeat N] [--types N [N ...]]
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from api_tester_mcp.graphql_sdl import parse_sdl  # noqa: E402
+from api_tester_mcp.payloads import format_size  # noqa: E402
+
+EXAMPLE_SCHEMA = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "examples",
+    "github_graphql_schema.graphql",
+)
+
+FIELDS_PER_TYPE = 8
+INPUT_TYPES = 50
+
+_REGEX_ROOT_TYPES = {
+    name: re.compile(rf"type\s+{name}\s*\{{([^}}]+)\}}", re.MULTILINE | re.DOTALL)
+    for name in ("Query", "Mutation", "Subscription")
+}
+_REGEX_FIELD = re.compile(r"(\w+)\s*(\([^)]*\))?\s*:\s*([^\n]+)")
+_REGEX_ARGUMENT = re.compile(r"(\w+)\s*:\s*([^,)]+)")
+
+
+def regex_root_fields(text: str) -> int:
+    """Root fields found by the regex extraction the tokenizer replaced"""
+    count = 0
+    for pattern in _REGEX_ROOT_TYPES.values():
+        match = pattern.search(text)
+        if not match:
+            continue
+        for field in _REGEX_FIELD.finditer(match.group(1)):
+            # Arguments were split as well, their types kept as plain text
+            for _ in _REGEX_ARGUMENT.finditer(field[2] or ""):
+                pass
+            count += 1
+    return count
+
+
+def parsed_root_fields(schema) -> int:
+    """Fields of the query, mutation and subscription types of a parsed schema"""
+    types = {type_def["name"]: type_def for type_def in schema["types"]}
+    return sum(
+        len(types[root["name"]].get("fields") or [])
+        for root in (
+            schema["queryType"],
+            schema["mutationType"],
+            schema["subscriptionType"],
+        )
+        if root
+    )
+
+
+def generate_sdl(type_count: int) -> str:
+    """Schema with type_count object types that reference each other"""
+    parts = ["interface Node { id: ID! }\n"]
+    for i in range(type_count):
+        fields = "".join(
+            f'  "Field {j} of T{i}"\n'
+            f"  f{j}(first: Int = 10, after: String, filter: F{i % INPUT_TYPES}): "
+            f"[T{(i + 1) % type_count}!]\n"
+            for j in range(FIELDS_PER_TYPE)
+        )
+        parts.append(
+            f'"""Type {i}, described with {{braces}}"""\n'
+            f'type T{i} implements Node @key(fields: "id") {{\n  id: ID!\n{fields}}}\n'
+        )
+    for k in range(INPUT_TYPES):
+        parts.append(
+            f"input F{k} {{ a: String b: [Int!] c: F{(k + 1) % INPUT_TYPES} }}\n"
+        )
+    parts.append(
+        "type Query {\n"
+        + "".join(
+            f"  q{i}(id: ID!, filter: F{i % INPUT_TYPES}): T{i}\n"
+            for i in range(type_count)
+        )
+        + "}\n"
+    )
+    return "".join(parts)
+
+
+def timed(function, *args):
+    started = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - started
+
+
+def report(name: str, text: str, repeat: int):
+    parse_seconds = regex_seconds = 0.0
+    for _ in range(repeat):
+        schema, seconds = timed(parse_sdl, text)
+        parse_seconds += seconds
+        regex_count, seconds = timed(regex_root_fields, text)
+        regex_seconds += seconds
+    parse_seconds /= repeat
+    regex_seconds /= repeat
+
+    size = len(text.encode("utf-8"))
+    print(
+        f"{name}: {format_size(size)}, {len(schema['types'])} types\n"
+        f"  parse_sdl: {parse_seconds * 1000:.1f} ms "
+        f"({format_size(size / parse_seconds)}/s), "
+        f"{parsed_root_fields(schema)} root fields\n"
+        f"  regex extraction: {regex_seconds * 1000:.1f} ms, "
+        f"{regex_count} root fields"
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--repeat", type=int, default=100, help="parses of the example schema"
+    )
+    parser.add_argument(
+        "--types",
+        type=int,
+        nargs="+",
+        default=[1000, 5000, 20000],
+        help="object types of each generated schema",
+    )
+    args = parser.parse_args()
+
+    with open(EXAMPLE_SCHEMA, encoding="utf-8") as f:
+        report(os.path.basename(EXAMPLE_SCHEMA), f.read(), args.repeat)
+    for type_count in args.types:
+        report(f"generated, {type_count} types", generate_sdl(type_count), 1)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,173 @@
+"""
+Check that the test code generated for the example specifications compiles.
+
+Every supported language/framework combination is rendered for the example
+specs and for a small spec with enum, pattern and numeric constraints (whose
+boundary and pairwise scenarios put values into test names). Python files
+are compiled, JavaScript files are checked with `node --check` when Node.js
+is available. TypeScript files are not checked.
+
+Usage: python scripts/check_generated_code.py
+"""
+
+import json
+import os
+import py_compile
+import shutil
+import subprocess
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from api_tester_mcp.code_generators import get_supported_combinations  # noqa: E402
+from api_tester_mcp.models import SpecType, TestFramework, TestLanguage  # noqa: E402
+from api_tester_mcp.parsers import ScenarioGenerator, SpecificationParser  # noqa: E402
+from api_tester_mcp.test_execution import TestCaseGenerator  # noqa: E402
+from api_tester_mcp.utils import validate_spec_type  # noqa: E402
+
+EXAMPLES_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "examples"
+)
+EXAMPLE_SPECS = (
+    "petstore_openapi.json",
+    "swagger_petstore.json",
+    "petstore_postman.json",
+    "blog_graphql_introspection.json",
+)
+
+CONSTRAINED_SPEC = {
+    "openapi": "3.0.0",
+    "info": {"title": "Constraints", "version": "1.0.0"},
+    "servers": [{"url": "https://api.example.com"}],
+    "paths": {
+        "/items/{id}": {
+            "get": {
+                "parameters": [
+                    {
+                        "name": "id",
+                        "in": "path",
+                        "required": True,
+                        "schema": {"type": "integer", "minimum": 1},
+                    },
+                    {
+                        "name": "sort",
+                        "in": "query",
+                        "schema": {"type": "string", "enum": ["asc", "desc"]},
+                    },
+                    {
+                        "name": "q",
+                        "in": "query",
+                        "schema": {"type": "string", "pattern": "^[a-z]{3}$"},
+                    },
+                    {
+                        "name": "limit",
+                        "in": "query",
+                        "schema": {"type": "integer", "minimum": 1, "maximum": 100},
+                    },
+                    {"name": "verbose", "in": "query", "schema": {"type": "boolean"}},
+                    {
+                        "name": "X-Mode",
+                        "in": "header",
+                        "schema": {"type": "string", "enum": ["fast", "it's slow"]},
+                    },
+                ],
+                "responses": {"200": {"description": "OK"}},
+            }
+        },
+        "/items": {
+            "post": {
+                "requestBody": {
+                    "content": {
+                        "application/json": {
+                            "schema": {
+                                "type": "object",
+                                "required": ["name", "code"],
+                                "properties": {
+                                    "name": {"type": "string", "maxLength": 20},
+                                    "code": {
+                                        "type": "string",
+                                        "pattern": "^[A-Z]{2}-\\d{4}$",
+                                    },
+                                },
+                            }
+                        }
+                    }
+                },
+                "responses": {"201": {"description": "Created"}},
+            }
+        },
+    },
+}
+
+EXTENSIONS = {"python": ".py", "javascript": ".js", "typescript": ".ts"}
+
+
+def load_specs():
+    """Name, spec type and content of every checked spec"""
+    yield "constraints.json", SpecType.OPENAPI, json.dumps(CONSTRAINED_SPEC)
+    for filename in EXAMPLE_SPECS:
+        with open(os.path.join(EXAMPLES_DIR, filename), encoding="utf-8") as f:
+            content = f.read()
+        yield filename, SpecType(validate_spec_type(content)), content
+
+
+def check_file(file_path: str, language: str, node: str) -> str:
+    """Error message of a generated file that does not compile, or empty"""
+    if language == "python":
+        try:
+            py_compile.compile(file_path, doraise=True)
+        except py_compile.PyCompileError as e:
+            return str(e)
+    elif language == "javascript" and node:
+        result = subprocess.run(
+            [node, "--check", file_path], capture_output=True, text=True
+        )
+        if result.returncode:
+            return result.stderr.strip()
+    return ""
+
+
+def main() -> int:
+    node = shutil.which("node") or ""
+    failures = 0
+    checked = 0
+    with tempfile.TemporaryDirectory() as directory:
+        for name, spec_type, content in load_specs():
+            parser = SpecificationParser()
+            endpoints = parser.parse(content, spec_type)
+            scenarios = ScenarioGenerator(parser.spec_data).generate_scenarios(
+                endpoints
+            )
+            for combination in get_supported_combinations():
+                language = combination["language"]
+                generator = TestCaseGenerator(
+                    "https://api.example.com",
+                    language=TestLanguage(language),
+                    framework=TestFramework(combination["framework"]),
+                    seed=1,
+                )
+                test_cases = generator.generate_test_cases(scenarios, False)
+                file_path = os.path.join(
+                    directory,
+                    f"{name}_{combination['framework']}{EXTENSIONS[language]}",
+                )
+                with open(file_path, "w", encoding="utf-8") as f:
+                    generator.code_generator.write_test_code(
+                        test_cases, {"id": "check", "base_url": "", "auth_token": ""}, f
+                    )
+                error = check_file(file_path, language, node)
+                checked += 1
+                if error:
+                    failures += 1
+                    print(f"FAIL {name} {language}/{combination['framework']}")
+                    print(error)
+
+    if not node:
+        print("Node.js not found, JavaScript files were not checked")
+    print(f"{checked - failures}/{checked} generated suites compile")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())